@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
-"""Record a single finding to a per-category JSON array file.
+"""Record findings to a per-category JSON array file.
 
-Called by scanner subagents to append one finding at a time, replacing
-manual JSON construction by the LLM.
+Called by scanner subagents to append findings, replacing manual JSON
+construction by the LLM.
 
-Usage:
+Single mode (append one finding):
     python3 add-finding.py \
         --output <scan-logs/scan-orphaned-code.json> \
         --category orphaned-code \
@@ -18,7 +18,16 @@ Usage:
         --recommendation remove \
         [--notes "Optional caveats"]
 
-Atomic writes via temp file + os.replace(). Zero external dependencies.
+Batch mode (append many findings with a single load + save):
+    python3 add-finding.py \
+        --output <scan-logs/scan-orphaned-code.json> \
+        --batch <findings.ndjson | ->
+
+    Each line of the batch file (or stdin, with "-") is one finding object
+    in the same shape single mode writes: category, severity, confidence,
+    title, location {file, lines, symbol}, evidence, recommendation, notes.
+
+Atomic writes via fsynced temp file + os.replace(). Zero external dependencies.
 """
 
 import argparse
@@ -26,6 +35,11 @@ import json
 import os
 import sys
 
+# Add parent directory to path for lib imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from lib.fileio import write_atomic
+
 VALID_CATEGORIES = [
     "orphaned-code",
     "stale-code",
@@ -55,13 +69,82 @@ def load_array(path):
 
 
 def save_array(path, data):
-    """Atomic write: write to .tmp then replace."""
-    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
-    tmp = path + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write("\n")
-    os.replace(tmp, path)
+    """Atomic write of the findings array."""
+    write_atomic(path, json.dumps(data, indent=2, ensure_ascii=False) + "\n")
+
+
+def validate_finding(finding, source):
+    """Validate a batch finding object and fill optional fields.
+
+    Exits with an error naming `source` (e.g. "line 3") if invalid.
+    """
+    def fail(msg):
+        print(f"Error: batch {source}: {msg}", file=sys.stderr)
+        sys.exit(1)
+
+    if not isinstance(finding, dict):
+        fail("finding must be a JSON object")
+
+    for key, valid in (("category", VALID_CATEGORIES),
+                       ("severity", VALID_SEVERITIES),
+                       ("confidence", VALID_CONFIDENCES),
+                       ("recommendation", VALID_RECOMMENDATIONS)):
+        if finding.get(key) not in valid:
+            fail(f"'{key}' must be one of {valid}, got {finding.get(key)!r}")
+
+    for key in ("title", "evidence"):
+        if not finding.get(key):
+            fail(f"'{key}' is required")
+
+    loc = finding.get("location")
+    if not isinstance(loc, dict) or not loc.get("file"):
+        fail("'location.file' is required")
+    lines = loc.get("lines")
+    # type() rather than isinstance(): true/false are ints to isinstance()
+    if (not isinstance(lines, list) or len(lines) != 2
+            or not all(type(n) is int for n in lines)):
+        fail(f"'location.lines' must be [start, end] integers, got {lines!r}")
+    if lines[0] > lines[1]:
+        fail(f"'location.lines' start must not be after end, got {lines!r}")
+
+    return {
+        "category": finding["category"],
+        "severity": finding["severity"],
+        "confidence": finding["confidence"],
+        "title": finding["title"],
+        "location": {
+            "file": loc["file"],
+            "lines": lines,
+            "symbol": loc.get("symbol"),
+        },
+        "evidence": finding["evidence"],
+        "recommendation": finding["recommendation"],
+        "notes": finding.get("notes") or "",
+    }
+
+
+def read_batch(path):
+    """Read NDJSON findings from path ("-" for stdin), validating each line."""
+    if path == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        if not os.path.isfile(path):
+            print(f"Error: batch file not found: {path}", file=sys.stderr)
+            sys.exit(1)
+        with open(path, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+
+    findings = []
+    for lineno, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            obj = json.loads(line)
+        except json.JSONDecodeError as e:
+            print(f"Error: batch line {lineno}: invalid JSON: {e}", file=sys.stderr)
+            sys.exit(1)
+        findings.append(validate_finding(obj, f"line {lineno}"))
+    return findings
 
 
 def parse_lines(lines_str):
@@ -81,34 +164,42 @@ def parse_lines(lines_str):
 
 def main():
     parser = argparse.ArgumentParser(
-        description="Record a single finding to a per-category JSON array file"
+        description="Record findings to a per-category JSON array file"
     )
     parser.add_argument(
         "--output", required=True,
         help="Path to the per-category JSON array file"
     )
+
+    # Batch mode
+    parser.add_argument(
+        "--batch", default=None,
+        help="Path to an NDJSON file of findings (one per line), or '-' for stdin"
+    )
+
+    # Single mode (all required unless --batch is given)
     parser.add_argument(
-        "--category", required=True, choices=VALID_CATEGORIES,
+        "--category", default=None, choices=VALID_CATEGORIES,
         help="Finding category slug"
     )
     parser.add_argument(
-        "--severity", required=True, choices=VALID_SEVERITIES,
+        "--severity", default=None, choices=VALID_SEVERITIES,
         help="Finding severity"
     )
     parser.add_argument(
-        "--confidence", required=True, choices=VALID_CONFIDENCES,
+        "--confidence", default=None, choices=VALID_CONFIDENCES,
         help="Finding confidence level"
     )
     parser.add_argument(
-        "--title", required=True,
+        "--title", default=None,
         help="Short description of the finding"
     )
     parser.add_argument(
-        "--file", required=True, dest="finding_file",
+        "--file", default=None, dest="finding_file",
         help="Relative path to the file containing the finding"
     )
     parser.add_argument(
-        "--lines", required=True,
+        "--lines", default=None,
         help="Line range as 'start,end' (comma-separated)"
     )
     parser.add_argument(
@@ -116,11 +207,11 @@ def main():
         help="Function or class name (optional, defaults to null)"
     )
     parser.add_argument(
-        "--evidence", required=True,
+        "--evidence", default=None,
         help="What was observed and why it's a finding"
     )
     parser.add_argument(
-        "--recommendation", required=True, choices=VALID_RECOMMENDATIONS,
+        "--recommendation", default=None, choices=VALID_RECOMMENDATIONS,
         help="Recommended action"
     )
     parser.add_argument(
@@ -130,6 +221,37 @@ def main():
 
     args = parser.parse_args()
 
+    output_path = os.path.abspath(args.output)
+
+    if args.batch:
+        # Batch mode: validate everything first, then a single load + save
+        new_findings = read_batch(args.batch)
+        findings = load_array(output_path)
+        findings.extend(new_findings)
+        save_array(output_path, findings)
+        print(f"Added {len(new_findings)} findings to "
+              f"{os.path.basename(output_path)}", file=sys.stderr)
+        return
+
+    # Single mode: validate required fields
+    missing = [
+        flag for flag, value in (
+            ("--category", args.category),
+            ("--severity", args.severity),
+            ("--confidence", args.confidence),
+            ("--title", args.title),
+            ("--file", args.finding_file),
+            ("--lines", args.lines),
+            ("--evidence", args.evidence),
+            ("--recommendation", args.recommendation),
+        )
+        if value is None
+    ]
+    if missing:
+        print(f"Error: {', '.join(missing)} required (or use --batch)",
+              file=sys.stderr)
+        sys.exit(1)
+
     # Parse line range
     lines = parse_lines(args.lines)
 
@@ -150,7 +272,6 @@ def main():
     }
 
     # Load existing array, append, save
-    output_path = os.path.abspath(args.output)
     findings = load_array(output_path)
     findings.append(finding)
     save_array(output_path, findings)
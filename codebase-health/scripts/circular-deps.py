@@ -24,11 +24,13 @@ from typing import Dict, List, Optional, Set, Tuple
 # Add parent directory to path for lib imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from lib.fileio import write_atomic
 from lib.ignore import load_ignore_patterns, walk_source_files
+from lib.jsonio import loads
 from lib.imports import (
-    Import,
+    IMPORT_CACHE_VERSION,
     detect_language,
-    extract_imports,
+    extract_imports_batch,
     is_internal_import,
     resolve_import_to_file,
 )
@@ -37,12 +39,40 @@ from lib.imports import (
 # Graph building
 # ---------------------------------------------------------------------------
 
+def load_import_cache(path: str) -> Dict[str, dict]:
+    """Load cached per-file imports. Missing or unreadable caches are empty."""
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+        data = loads(raw)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != IMPORT_CACHE_VERSION:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def save_import_cache(path: str, entries: Dict[str, dict]) -> None:
+    """Atomic write of the import cache."""
+    write_atomic(path, json.dumps(
+        {"version": IMPORT_CACHE_VERSION, "files": entries},
+        separators=(",", ":"),
+    ))
+
 
 def build_import_graph(
-    root: str, ignore_patterns: List[str]
+    root: str,
+    ignore_patterns: List[str],
+    cache: Optional[Dict[str, dict]] = None,
 ) -> Tuple[Dict[str, Set[str]], Dict[str, Set[str]], List[dict]]:
     """Build a directed graph of internal imports.
 
+    If ``cache`` is given, files whose mtime and size match their cached
+    entry reuse the stored imports instead of being re-parsed (see
+    extract_imports_batch). The cache is updated in place to hold exactly
+    the files seen in this run.
+
     Returns:
         (forward_graph, reverse_graph, errors)
         - forward_graph: {file -> set of files it imports}
@@ -53,41 +83,94 @@ def build_import_graph(
     reverse: Dict[str, Set[str]] = defaultdict(set)
     errors: List[dict] = []
 
+    # Walked and resolved paths sit under root, so a prefix strip usually
+    # replaces os.path.relpath; fall back to it for anything else
+    prefix = os.path.join(root, "")
+
+    def to_rel(path: str) -> str:
+        if path.startswith(prefix):
+            return path[len(prefix):]
+        return os.path.relpath(path, root)
+
+    files: List[Tuple[str, str, str]] = []
     for fpath in walk_source_files(root, ignore_patterns):
         lang = detect_language(fpath)
-        if lang is None:
-            continue
+        if lang is not None:
+            files.append((fpath, to_rel(fpath), lang))
+
+    # Parsing is independent per file (parallel for large batches, skipped
+    # for cache hits); resolution and graph updates stay here
+    parse_errors: Dict[str, str] = {}
+    parsed = extract_imports_batch(
+        [fpath for fpath, _, _ in files],
+        [lang for _, _, lang in files],
+        errors=parse_errors,
+        cache=cache,
+    )
+
+    resolved_rel: Dict[Tuple[str, str, str], Optional[str]] = {}
+    for fpath, rel, lang in files:
+        imports = parsed[fpath]
+        error = parse_errors.get(fpath)
 
-        # Ensure node exists even if it has no imports
-        rel = os.path.relpath(fpath, root)
-        if rel not in forward:
-            forward[rel] = set()
+        # Touching the defaultdict creates the node even if it has no imports
+        targets = forward[rel]
 
-        try:
-            imports = extract_imports(fpath, lang)
-        except Exception as e:
-            errors.append({"file": rel, "error": str(e)})
+        if error is not None:
+            errors.append({"file": rel, "error": error})
             continue
 
+        src_dir = os.path.dirname(fpath)
         for imp in imports:
             if imp.is_type_only:
                 continue  # Skip type-only imports for cycle detection
-            if not is_internal_import(imp.target, root, fpath, lang):
-                continue
 
-            resolved = resolve_import_to_file(imp.target, fpath, root, lang)
-            if resolved is None:
+            # Resolution only depends on the importing directory, and sibling
+            # files tend to import the same targets
+            key = (imp.target, src_dir, lang)
+            if key in resolved_rel:
+                target_rel = resolved_rel[key]
+            else:
+                target_rel = None
+                if is_internal_import(imp.target, root, fpath, lang):
+                    resolved = resolve_import_to_file(imp.target, fpath, root, lang)
+                    if resolved is not None:
+                        target_rel = to_rel(resolved)
+                resolved_rel[key] = target_rel
+            if target_rel is None:
                 continue
 
-            target_rel = os.path.relpath(resolved, root)
-            forward[rel].add(target_rel)
+            targets.add(target_rel)
             reverse[target_rel].add(rel)
+            forward[target_rel]  # Ensure target node exists
+
+    # Drop entries for files that were deleted or are now ignored
+    if cache is not None:
+        for stale in cache.keys() - parsed.keys():
+            del cache[stale]
 
-            # Ensure target node exists
-            if target_rel not in forward:
-                forward[target_rel] = set()
+    return forward, reverse, errors
 
-    return dict(forward), dict(reverse), errors
+
+def index_graph(
+    forward: Dict[str, Set[str]], reverse: Dict[str, Set[str]]
+) -> Tuple[List[str], List[List[int]], List[List[int]]]:
+    """Convert string-keyed graphs to integer node IDs with adjacency lists.
+
+    All analysis passes run on the integer form; names are only looked up
+    again when building the JSON result.
+
+    Returns:
+        (names, adj, radj)
+        - names: node ID -> relative file path
+        - adj: node ID -> IDs of the files it imports
+        - radj: node ID -> IDs of the files that import it
+    """
+    names = list(forward)
+    id_of = {name: i for i, name in enumerate(names)}
+    adj = [[id_of[t] for t in forward[name]] for name in names]
+    radj = [[id_of[s] for s in reverse.get(name, ())] for name in names]
+    return names, adj, radj
 
 
 # ---------------------------------------------------------------------------
@@ -95,90 +178,133 @@ def build_import_graph(
 # ---------------------------------------------------------------------------
 
 
-def tarjan_scc(graph: Dict[str, Set[str]]) -> List[List[str]]:
+def tarjan_scc(adj: List[List[int]]) -> List[List[int]]:
     """Find all strongly connected components using Tarjan's algorithm.
 
+    Operates on the integer adjacency lists from index_graph().
     Returns list of SCCs with more than one node (i.e., actual cycles).
+
+    Iterative formulation: an explicit work stack of (node, neighbor iterator)
+    frames replaces recursion, so deep import chains cannot overflow the
+    Python stack.
     """
-    index_counter = [0]
-    stack: List[str] = []
-    on_stack: Set[str] = set()
-    index: Dict[str, int] = {}
-    lowlink: Dict[str, int] = {}
-    sccs: List[List[str]] = []
-
-    def strongconnect(node: str) -> None:
-        index[node] = index_counter[0]
-        lowlink[node] = index_counter[0]
-        index_counter[0] += 1
-        stack.append(node)
-        on_stack.add(node)
-
-        for neighbor in graph.get(node, set()):
-            if neighbor not in index:
-                strongconnect(neighbor)
-                lowlink[node] = min(lowlink[node], lowlink[neighbor])
-            elif neighbor in on_stack:
-                lowlink[node] = min(lowlink[node], index[neighbor])
-
-        if lowlink[node] == index[node]:
-            scc: List[str] = []
-            while True:
-                w = stack.pop()
-                on_stack.discard(w)
-                scc.append(w)
-                if w == node:
-                    break
-            if len(scc) > 1:
-                sccs.append(scc)
-
-    # Use iterative deepening to avoid recursion limits on large codebases
-    sys.setrecursionlimit(max(10000, len(graph) * 2))
-
-    for node in graph:
-        if node not in index:
-            strongconnect(node)
+    n = len(adj)
+    counter = 0
+    stack: List[int] = []
+    on_stack = bytearray(n)
+    index = [-1] * n
+    lowlink = [0] * n
+    sccs: List[List[int]] = []
+
+    for root in range(n):
+        if index[root] >= 0:
+            continue
+
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [(root, iter(adj[root]))]
+
+        while work:
+            node, neighbors = work[-1]
+            neighbor = next(neighbors, None)
+
+            if neighbor is not None:
+                if index[neighbor] < 0:
+                    # Descend: equivalent to the recursive strongconnect call
+                    index[neighbor] = lowlink[neighbor] = counter
+                    counter += 1
+                    stack.append(neighbor)
+                    on_stack[neighbor] = 1
+                    work.append((neighbor, iter(adj[neighbor])))
+                elif on_stack[neighbor]:
+                    lowlink[node] = min(lowlink[node], index[neighbor])
+                continue
+
+            # All neighbors visited — node is finished
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+            if lowlink[node] == index[node]:
+                scc: List[int] = []
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = 0
+                    scc.append(w)
+                    if w == node:
+                        break
+                if len(scc) > 1:
+                    sccs.append(scc)
 
     return sccs
 
 
-def extract_cycles_from_scc(scc: List[str], graph: Dict[str, Set[str]]) -> List[List[str]]:
+def extract_cycles_from_scc(scc: List[int], adj: List[List[int]]) -> List[List[int]]:
     """Extract individual cycle paths from an SCC.
 
-    For small SCCs (<=5), finds all elementary cycles.
+    For small SCCs (<=5), finds all elementary cycles (Johnson's algorithm),
+    reporting one cycle per distinct set of files.
     For larger ones, returns the SCC as a single cycle representation.
     """
-    scc_set = set(scc)
-
-    if len(scc) <= 5:
-        # For small SCCs, find shortest cycle through BFS from each node
-        cycles: List[List[str]] = []
-        seen_cycle_sets: List[frozenset] = []
+    if len(scc) > 5:
+        return [scc]
 
-        for start in scc:
-            # BFS to find shortest cycle back to start
-            queue = [(start, [start])]
-            visited = {start}
+    # Relabel the SCC's nodes 0..k-1 so the search state below is flat
+    # integer arrays instead of dicts and sets
+    k = len(scc)
+    local = {node: i for i, node in enumerate(scc)}
+    ladj = [[local[w] for w in adj[node] if w in local] for node in scc]
+
+    cycles: List[List[int]] = []
+    seen_cycle_sets: Set[frozenset] = set()
+
+    for start in range(k):
+        # Search the subgraph induced by nodes numbered at or after start,
+        # so every elementary cycle is found exactly once (from its lowest node)
+        blocked = bytearray(k)
+        blocked_by: List[Set[int]] = [set() for _ in range(k)]
+        path = [start]
+
+        def successors(node: int) -> List[int]:
+            return [w for w in ladj[node] if w >= start]
+
+        def unblock(node: int) -> None:
+            pending = [node]
+            while pending:
+                u = pending.pop()
+                if blocked[u]:
+                    blocked[u] = 0
+                    pending.extend(blocked_by[u])
+                    blocked_by[u].clear()
+
+        def circuit(node: int) -> bool:
             found = False
-
-            while queue and not found:
-                current, path = queue.pop(0)
-                for neighbor in graph.get(current, set()):
-                    if neighbor == start and len(path) > 1:
-                        cycle = path
-                        cycle_key = frozenset(cycle)
-                        if cycle_key not in seen_cycle_sets:
-                            seen_cycle_sets.append(cycle_key)
-                            cycles.append(cycle)
+            blocked[node] = 1
+            for w in successors(node):
+                if w == start:
+                    cycle_key = frozenset(path)
+                    if len(path) > 1 and cycle_key not in seen_cycle_sets:
+                        seen_cycle_sets.add(cycle_key)
+                        cycles.append([scc[i] for i in path])
+                    found = True
+                elif not blocked[w]:
+                    path.append(w)
+                    if circuit(w):
                         found = True
-                        break
-                    if neighbor in scc_set and neighbor not in visited:
-                        visited.add(neighbor)
-                        queue.append((neighbor, path + [neighbor]))
+                    path.pop()
+            if found:
+                unblock(node)
+            else:
+                for w in successors(node):
+                    blocked_by[w].add(node)
+            return found
 
-        return cycles if cycles else [scc]
-    else:
-        return [scc]
+        circuit(start)
+
+    return cycles if cycles else [scc]
 
 
 # ---------------------------------------------------------------------------
@@ -187,34 +313,37 @@ def extract_cycles_from_scc(scc: List[str], graph: Dict[str, Set[str]]) -> List[
 
 
 def detect_god_modules(
-    reverse_graph: Dict[str, Set[str]], threshold_multiplier: float = 3.0, min_importers: int = 5
+    names: List[str],
+    radj: List[List[int]],
+    threshold_multiplier: float = 3.0,
+    min_importers: int = 5,
 ) -> List[dict]:
     """Detect modules with disproportionately many importers.
 
     A god module has in-degree > threshold_multiplier * median AND > min_importers.
+    The median is taken over modules with at least one importer.
     """
-    in_degrees = {node: len(importers) for node, importers in reverse_graph.items()}
+    in_degrees = {node: len(importers) for node, importers in enumerate(radj) if importers}
 
     if not in_degrees:
         return []
 
-    values = list(in_degrees.values())
-    if not values:
-        return []
-
-    median_degree = statistics.median(values) if values else 0
+    median_degree = statistics.median(in_degrees.values())
     threshold = max(median_degree * threshold_multiplier, min_importers)
 
+    # Select first, then sort and expand importers only for the few selected
+    selected = [(node, degree) for node, degree in in_degrees.items() if degree > threshold]
+    selected.sort(key=lambda x: -x[1])
+
     god_modules = []
-    for module, degree in sorted(in_degrees.items(), key=lambda x: -x[1]):
-        if degree > threshold:
-            god_modules.append({
-                "file": module,
-                "importer_count": degree,
-                "importers": sorted(reverse_graph[module]),
-                "median_in_degree": round(median_degree, 1),
-                "threshold": round(threshold, 1),
-            })
+    for module, degree in selected:
+        god_modules.append({
+            "file": names[module],
+            "importer_count": degree,
+            "importers": sorted(names[i] for i in radj[module]),
+            "median_in_degree": round(median_degree, 1),
+            "threshold": round(threshold, 1),
+        })
 
     return god_modules
 
@@ -236,90 +365,97 @@ LAYER_KEYWORDS: Dict[str, int] = {
 }
 
 
-def _infer_layer(file_path: str) -> Optional[int]:
-    """Infer the architectural layer of a file from its directory path."""
-    parts = Path(file_path).parts
-    for part in parts:
-        lower = part.lower()
-        if lower in LAYER_KEYWORDS:
-            return LAYER_KEYWORDS[lower]
-    return None
+def _infer_layer(file_path: str) -> Tuple[Optional[int], str]:
+    """Infer the architectural layer of a file from its directory path.
 
+    Returns (layer, human-readable layer name); (None, "unknown") if no
+    path component matches a layer keyword.
+    """
+    for part in Path(file_path).parts:
+        layer = LAYER_KEYWORDS.get(part.lower())
+        if layer is not None:
+            return layer, part
+    return None, "unknown"
 
-def detect_layering_violations(graph: Dict[str, Set[str]]) -> List[dict]:
+
+def detect_layering_violations(names: List[str], adj: List[List[int]]) -> List[dict]:
     """Detect imports that violate the expected layering hierarchy.
 
     A violation occurs when a lower layer imports from a higher layer.
     """
     violations = []
 
-    for source, targets in graph.items():
-        source_layer = _infer_layer(source)
+    # Classify every node once; the edge loop below only indexes this list
+    layers = [_infer_layer(name) for name in names]
+
+    for source_id, targets in enumerate(adj):
+        source_layer, source_name = layers[source_id]
         if source_layer is None or source_layer == -1:  # Skip unknown/test layers
             continue
 
-        for target in targets:
-            target_layer = _infer_layer(target)
+        for target_id in targets:
+            target_layer, target_name = layers[target_id]
             if target_layer is None or target_layer == -1:
                 continue
 
             if source_layer < target_layer:
                 violations.append({
-                    "source": source,
+                    "source": names[source_id],
                     "source_layer": source_layer,
-                    "target": target,
+                    "target": names[target_id],
                     "target_layer": target_layer,
                     "description": (
-                        f"Lower layer '{_layer_name(source)}' imports from "
-                        f"higher layer '{_layer_name(target)}'"
+                        f"Lower layer '{source_name}' imports from "
+                        f"higher layer '{target_name}'"
                     ),
                 })
 
     return violations
 
 
-def _layer_name(file_path: str) -> str:
-    """Get a human-readable layer name for a file."""
-    parts = Path(file_path).parts
-    for part in parts:
-        lower = part.lower()
-        if lower in LAYER_KEYWORDS:
-            return part
-    return "unknown"
-
-
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 
 
-def analyze(root: str, ignore_file: Optional[str] = None) -> dict:
+def analyze(
+    root: str,
+    ignore_file: Optional[str] = None,
+    cache_file: Optional[str] = None,
+) -> dict:
     """Run full circular dependency analysis.
 
+    If ``cache_file`` is given, extracted imports are cached there between
+    runs so only changed files are re-parsed.
+
     Returns structured JSON-serializable dict.
     """
     patterns = load_ignore_patterns(ignore_file)
-    forward_graph, reverse_graph, errors = build_import_graph(root, patterns)
+    cache = load_import_cache(cache_file) if cache_file else None
+    forward_graph, reverse_graph, errors = build_import_graph(root, patterns, cache)
+    if cache_file:
+        save_import_cache(cache_file, cache)
+    names, adj, radj = index_graph(forward_graph, reverse_graph)
 
     # Cycle detection
-    sccs = tarjan_scc(forward_graph)
+    sccs = tarjan_scc(adj)
     cycles = []
     for scc in sccs:
-        for cycle_path in extract_cycles_from_scc(scc, forward_graph):
+        for cycle_path in extract_cycles_from_scc(scc, adj):
             cycles.append({
-                "files": cycle_path,
+                "files": [names[i] for i in cycle_path],
                 "length": len(cycle_path),
             })
 
     # God modules
-    god_modules = detect_god_modules(reverse_graph)
+    god_modules = detect_god_modules(names, radj)
 
     # Layering violations
-    layering_violations = detect_layering_violations(forward_graph)
+    layering_violations = detect_layering_violations(names, adj)
 
     # Graph stats
-    total_files = len(forward_graph)
-    total_edges = sum(len(targets) for targets in forward_graph.values())
+    total_files = len(names)
+    total_edges = sum(len(targets) for targets in adj)
 
     return {
         "graph_stats": {
@@ -347,6 +483,14 @@ def main() -> None:
     parser.add_argument(
         "--ignore-file", default=None, help="Path to .health-ignore file"
     )
+    parser.add_argument(
+        "--cache-file", default=None,
+        help="Path to import cache (default: .health-scan/import-cache.json "
+             "when .health-scan/ exists)"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Re-parse every file"
+    )
     args = parser.parse_args()
 
     root = os.path.abspath(args.root)
@@ -360,12 +504,18 @@ def main() -> None:
         if os.path.isfile(default_ignore):
             args.ignore_file = default_ignore
 
-    result = analyze(root, args.ignore_file)
+    # Cache extracted imports alongside other scan state, if the workspace exists
+    cache_file = None
+    if not args.no_cache:
+        if args.cache_file is not None:
+            cache_file = os.path.abspath(args.cache_file)
+        elif os.path.isdir(os.path.join(root, ".health-scan")):
+            cache_file = os.path.join(root, ".health-scan", "import-cache.json")
+
+    result = analyze(root, args.ignore_file, cache_file)
 
     output_path = os.path.abspath(args.output)
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=2)
+    write_atomic(output_path, json.dumps(result, indent=2))
 
     # Print summary to stderr
     print(f"Scanned {result['graph_stats']['total_files']} files, "
@@ -0,0 +1,54 @@
+"""Shared file output helpers for codebase-health scripts.
+
+Zero external dependencies — stdlib only.
+"""
+
+import contextlib
+import os
+import tempfile
+from typing import BinaryIO, Iterator, Union
+
+
+@contextlib.contextmanager
+def atomic_writer(path: str) -> Iterator[BinaryIO]:
+    """Yield a binary file that replaces path, atomically and durably, on exit.
+
+    Writes go to a temp file next to path with a random name (mkstemp, so
+    concurrent writers never share it and a file left by a killed run is
+    never in the way), which is fsynced and renamed over path when the
+    block finishes. If the block raises, the temp file is removed and path
+    is left as it was. The directory is only created when the first
+    attempt reports it missing.
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    prefix = f".{name}."
+    try:
+        fd, tmp = tempfile.mkstemp(suffix=".tmp", prefix=prefix, dir=directory)
+    except FileNotFoundError:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(suffix=".tmp", prefix=prefix, dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            # mkstemp creates the file 0o600; give the result the usual mode
+            os.fchmod(f.fileno(), 0o644)
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def write_atomic(path: str, data: Union[str, bytes]) -> None:
+    """Write data (str is UTF-8 encoded) to path atomically and durably.
+
+    See atomic_writer() for how.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    with atomic_writer(path) as f:
+        f.write(data)
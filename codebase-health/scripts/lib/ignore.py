@@ -5,9 +5,11 @@ filesystem walking that respects ignore patterns.
 """
 
 import fnmatch
+import functools
 import os
+import re
 from pathlib import Path
-from typing import Iterator, List, Optional, Set
+from typing import Iterator, List, Optional, Pattern, Set, Tuple
 
 DEFAULT_IGNORE_PATTERNS = [
     ".git",
@@ -42,7 +44,7 @@ def load_ignore_patterns(
         extra_patterns: Additional patterns to include.
 
     Returns:
-        Merged list of ignore patterns.
+        Merged list of ignore patterns, deduplicated in first-seen order.
     """
     patterns = list(DEFAULT_IGNORE_PATTERNS)
 
@@ -56,10 +58,57 @@ def load_ignore_patterns(
     if extra_patterns:
         patterns.extend(extra_patterns)
 
-    return patterns
+    # .health-ignore files often repeat defaults like node_modules or dist
+    return list(dict.fromkeys(patterns))
 
 
-def should_ignore(path: str, patterns: List[str], root: str) -> bool:
+def split_ignore_patterns(patterns: List[str]) -> Tuple[Set[str], List[str]]:
+    """Split patterns into plain names and globs.
+
+    Plain names have no wildcard and no "/" (after dropping a trailing
+    directory marker) and can be matched by exact comparison.
+
+    Returns:
+        (simple_names, glob_patterns)
+    """
+    simple_names: Set[str] = set()
+    globs: List[str] = []
+    for p in patterns:
+        clean = p.rstrip("/")
+        if "/" in clean or any(c in clean for c in "*?["):
+            globs.append(p)
+        else:
+            simple_names.add(clean)
+    return simple_names, globs
+
+
+def compile_ignore_matcher(patterns: List[str]) -> Pattern[str]:
+    """Compile ignore patterns into a single regex.
+
+    Each pattern is translated with fnmatch.translate and the results are
+    joined into one alternation, so a path component (or full relative
+    path) is tested against every pattern in a single match call.
+
+    Args:
+        patterns: List of ignore patterns.
+
+    Returns:
+        Compiled regex; use .match() against a component or relative path.
+    """
+    return _compile_ignore_matcher(tuple(patterns))
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_ignore_matcher(patterns: Tuple[str, ...]) -> Pattern[str]:
+    """Cached compile, so repeated walks with the same patterns translate once."""
+    # Strip trailing slash (directory marker) — we match both
+    alternatives = [fnmatch.translate(p.rstrip("/")) for p in patterns]
+    if not alternatives:
+        return re.compile(r"(?!)")  # Never matches
+    return re.compile("|".join(f"(?:{a})" for a in alternatives))
+
+
+def should_ignore(path: str, matcher: Pattern[str], root: str) -> bool:
     """Check whether a path should be ignored.
 
     Supports gitignore-style matching:
@@ -70,7 +119,7 @@ def should_ignore(path: str, patterns: List[str], root: str) -> bool:
 
     Args:
         path: Absolute or relative path to check.
-        patterns: List of ignore patterns.
+        matcher: Compiled patterns (from compile_ignore_matcher).
         root: Project root (for computing relative paths).
 
     Returns:
@@ -81,22 +130,14 @@ def should_ignore(path: str, patterns: List[str], root: str) -> bool:
     except ValueError:
         rel = path
 
-    parts = Path(rel).parts
-
-    for pattern in patterns:
-        # Strip trailing slash (directory marker) — we match both
-        clean = pattern.rstrip("/")
-
-        # Match against each path component (like gitignore)
-        for part in parts:
-            if fnmatch.fnmatch(part, clean):
-                return True
-
-        # Match against the full relative path
-        if fnmatch.fnmatch(rel, clean):
+    # Match against each path component (like gitignore)
+    match = matcher.match
+    for part in Path(rel).parts:
+        if match(part):
             return True
 
-    return False
+    # Match against the full relative path
+    return match(rel) is not None
 
 
 # Common source file extensions by language
@@ -137,15 +178,26 @@ def walk_source_files(
     if extensions is None:
         extensions = ALL_SOURCE_EXTENSIONS
 
+    # Plain names ("node_modules", ".git") are checked by set membership on
+    # the bare entry name; only real globs need the relative path and regex.
+    # Ancestors were already pruned, so a name check on the entry suffices.
+    simple_names, globs = split_ignore_patterns(patterns)
+    matcher = compile_ignore_matcher(globs) if globs else None
+
     for dirpath, dirnames, filenames in os.walk(root):
         # Prune ignored directories in-place (prevents os.walk from descending)
         dirnames[:] = [
             d for d in dirnames
-            if not should_ignore(os.path.join(dirpath, d), patterns, root)
+            if d not in simple_names and not (
+                matcher and should_ignore(os.path.join(dirpath, d), matcher, root)
+            )
         ]
 
         for fname in filenames:
-            fpath = os.path.join(dirpath, fname)
             ext = os.path.splitext(fname)[1]
-            if ext in extensions and not should_ignore(fpath, patterns, root):
-                yield fpath
+            if ext not in extensions or fname in simple_names:
+                continue
+            fpath = os.path.join(dirpath, fname)
+            if matcher and should_ignore(fpath, matcher, root):
+                continue
+            yield fpath
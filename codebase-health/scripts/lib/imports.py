@@ -7,20 +7,33 @@ Zero external dependencies — stdlib only.
 """
 
 import ast
+import bisect
+import functools
 import os
 import re
-from dataclasses import dataclass, field
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
 
 # ---------------------------------------------------------------------------
 # Data structures
 # ---------------------------------------------------------------------------
 
 
-@dataclass
-class Import:
-    """Represents a single import statement."""
+# Every Import of a file shares its source_file, and targets such as "os" or
+# "react" recur across thousands of files. Interning makes equal strings one
+# object, which also lets pickle share them when workers send results back.
+_intern = sys.intern
+
+
+class Import(NamedTuple):
+    """Represents a single import statement.
+
+    A NamedTuple rather than a dataclass: scans create one per import, and
+    tuples are smaller, faster to build and cheap to pickle across workers.
+    """
 
     source_file: str  # Absolute path of the file containing the import
     target: str  # The imported module/package string
@@ -48,6 +61,7 @@ _EXT_TO_LANG: Dict[str, str] = {
 }
 
 
+@functools.lru_cache(maxsize=None)
 def detect_language(file_path: str) -> Optional[str]:
     """Detect language from file extension."""
     ext = os.path.splitext(file_path)[1].lower()
@@ -58,81 +72,116 @@ def detect_language(file_path: str) -> Optional[str]:
 # Python import extraction (via ast — accurate)
 # ---------------------------------------------------------------------------
 
-# Standard library module names (top-level) for Python 3.8+
-# This is not exhaustive but covers the vast majority
-_PYTHON_STDLIB = {
-    "abc", "aifc", "argparse", "array", "ast", "asynchat", "asyncio",
-    "asyncore", "atexit", "audioop", "base64", "bdb", "binascii", "binhex",
-    "bisect", "builtins", "bz2", "calendar", "cgi", "cgitb", "chunk",
-    "cmath", "cmd", "code", "codecs", "codeop", "collections", "colorsys",
-    "compileall", "concurrent", "configparser", "contextlib", "contextvars",
-    "copy", "copyreg", "cProfile", "crypt", "csv", "ctypes", "curses",
-    "dataclasses", "datetime", "dbm", "decimal", "difflib", "dis",
-    "distutils", "doctest", "email", "encodings", "enum", "errno",
-    "faulthandler", "fcntl", "filecmp", "fileinput", "fnmatch", "fractions",
-    "ftplib", "functools", "gc", "getopt", "getpass", "gettext", "glob",
-    "grp", "gzip", "hashlib", "heapq", "hmac", "html", "http", "idlelib",
-    "imaplib", "imghdr", "imp", "importlib", "inspect", "io", "ipaddress",
-    "itertools", "json", "keyword", "lib2to3", "linecache", "locale",
-    "logging", "lzma", "mailbox", "mailcap", "marshal", "math", "mimetypes",
-    "mmap", "modulefinder", "multiprocessing", "netrc", "nis", "nntplib",
-    "numbers", "operator", "optparse", "os", "ossaudiodev", "pathlib",
-    "pdb", "pickle", "pickletools", "pipes", "pkgutil", "platform",
-    "plistlib", "poplib", "posix", "posixpath", "pprint", "profile",
-    "pstats", "pty", "pwd", "py_compile", "pyclbr", "pydoc", "queue",
-    "quopri", "random", "re", "readline", "reprlib", "resource", "rlcompleter",
-    "runpy", "sched", "secrets", "select", "selectors", "shelve", "shlex",
-    "shutil", "signal", "site", "smtpd", "smtplib", "sndhdr", "socket",
-    "socketserver", "spwd", "sqlite3", "ssl", "stat", "statistics",
-    "string", "stringprep", "struct", "subprocess", "sunau", "symtable",
-    "sys", "sysconfig", "syslog", "tabnanny", "tarfile", "telnetlib",
-    "tempfile", "termios", "test", "textwrap", "threading", "time",
-    "timeit", "tkinter", "token", "tokenize", "tomllib", "trace",
-    "traceback", "tracemalloc", "tty", "turtle", "turtledemo", "types",
-    "typing", "unicodedata", "unittest", "urllib", "uu", "uuid", "venv",
-    "warnings", "wave", "weakref", "webbrowser", "winreg", "winsound",
-    "wsgiref", "xdrlib", "xml", "xmlrpc", "zipapp", "zipfile", "zipimport",
-    "zlib", "_thread", "__future__", "typing_extensions",
+# Standard library module names (top-level), plus typing_extensions which
+# is treated the same way. Python 3.10+ reports the exact set for the
+# running interpreter; older versions fall back to a list that is not
+# exhaustive but covers the vast majority.
+if hasattr(sys, "stdlib_module_names"):
+    _PYTHON_STDLIB = sys.stdlib_module_names | {"typing_extensions"}
+else:
+    _PYTHON_STDLIB = frozenset({
+        "abc", "aifc", "argparse", "array", "ast", "asynchat", "asyncio",
+        "asyncore", "atexit", "audioop", "base64", "bdb", "binascii", "binhex",
+        "bisect", "builtins", "bz2", "calendar", "cgi", "cgitb", "chunk",
+        "cmath", "cmd", "code", "codecs", "codeop", "collections", "colorsys",
+        "compileall", "concurrent", "configparser", "contextlib", "contextvars",
+        "copy", "copyreg", "cProfile", "crypt", "csv", "ctypes", "curses",
+        "dataclasses", "datetime", "dbm", "decimal", "difflib", "dis",
+        "distutils", "doctest", "email", "encodings", "enum", "errno",
+        "faulthandler", "fcntl", "filecmp", "fileinput", "fnmatch", "fractions",
+        "ftplib", "functools", "gc", "getopt", "getpass", "gettext", "glob",
+        "grp", "gzip", "hashlib", "heapq", "hmac", "html", "http", "idlelib",
+        "imaplib", "imghdr", "imp", "importlib", "inspect", "io", "ipaddress",
+        "itertools", "json", "keyword", "lib2to3", "linecache", "locale",
+        "logging", "lzma", "mailbox", "mailcap", "marshal", "math", "mimetypes",
+        "mmap", "modulefinder", "multiprocessing", "netrc", "nis", "nntplib",
+        "numbers", "operator", "optparse", "os", "ossaudiodev", "pathlib",
+        "pdb", "pickle", "pickletools", "pipes", "pkgutil", "platform",
+        "plistlib", "poplib", "posix", "posixpath", "pprint", "profile",
+        "pstats", "pty", "pwd", "py_compile", "pyclbr", "pydoc", "queue",
+        "quopri", "random", "re", "readline", "reprlib", "resource", "rlcompleter",
+        "runpy", "sched", "secrets", "select", "selectors", "shelve", "shlex",
+        "shutil", "signal", "site", "smtpd", "smtplib", "sndhdr", "socket",
+        "socketserver", "spwd", "sqlite3", "ssl", "stat", "statistics",
+        "string", "stringprep", "struct", "subprocess", "sunau", "symtable",
+        "sys", "sysconfig", "syslog", "tabnanny", "tarfile", "telnetlib",
+        "tempfile", "termios", "test", "textwrap", "threading", "time",
+        "timeit", "tkinter", "token", "tokenize", "tomllib", "trace",
+        "traceback", "tracemalloc", "tty", "turtle", "turtledemo", "types",
+        "typing", "unicodedata", "unittest", "urllib", "uu", "uuid", "venv",
+        "warnings", "wave", "weakref", "webbrowser", "winreg", "winsound",
+        "wsgiref", "xdrlib", "xml", "xmlrpc", "zipapp", "zipfile", "zipimport",
+        "zlib", "_thread", "__future__", "typing_extensions",
+    })
+
+
+# Statement types that contain nested statements, mapped to the fields that
+# hold them (in ast field order). Imports are statements, so the visitor
+# only follows these and never descends into expressions.
+_PY_BLOCK_FIELDS: Dict[type, Tuple[str, ...]] = {
+    ast.Module: ("body",),
+    ast.FunctionDef: ("body",),
+    ast.AsyncFunctionDef: ("body",),
+    ast.ClassDef: ("body",),
+    ast.If: ("body", "orelse"),
+    ast.For: ("body", "orelse"),
+    ast.AsyncFor: ("body", "orelse"),
+    ast.While: ("body", "orelse"),
+    ast.With: ("body",),
+    ast.AsyncWith: ("body",),
+    ast.Try: ("body", "handlers", "orelse", "finalbody"),
+    ast.ExceptHandler: ("body",),
 }
+for _name, _fields in (
+    ("TryStar", ("body", "handlers", "orelse", "finalbody")),  # 3.11+
+    ("Match", ("cases",)),  # 3.10+
+    ("match_case", ("body",)),
+):
+    if hasattr(ast, _name):
+        _PY_BLOCK_FIELDS[getattr(ast, _name)] = _fields
+
+
+def _is_type_checking_test(test: ast.expr) -> bool:
+    """True for `if TYPE_CHECKING:` and `if typing.TYPE_CHECKING:`."""
+    return (
+        (isinstance(test, ast.Attribute) and test.attr == "TYPE_CHECKING")
+        or (isinstance(test, ast.Name) and test.id == "TYPE_CHECKING")
+    )
 
 
-def _extract_python_imports(file_path: str, source: str) -> List[Import]:
+def _extract_python_imports(file_path: str, source: Union[str, bytes]) -> List[Import]:
     """Extract imports from Python source using the ast module."""
     imports: List[Import] = []
     try:
         tree = ast.parse(source, filename=file_path)
     except SyntaxError:
-        return imports
-
-    # Detect TYPE_CHECKING blocks
-    type_checking_ranges: List[range] = []
-    for node in ast.walk(tree):
-        if isinstance(node, ast.If):
-            test = node.test
-            is_tc = False
-            if isinstance(test, ast.Attribute) and test.attr == "TYPE_CHECKING":
-                is_tc = True
-            elif isinstance(test, ast.Name) and test.id == "TYPE_CHECKING":
-                is_tc = True
-            if is_tc and node.body:
-                start = node.body[0].lineno
-                end = node.body[-1].end_lineno or node.body[-1].lineno
-                type_checking_ranges.append(range(start, end + 1))
-
-    def _in_type_checking(lineno: int) -> bool:
-        return any(lineno in r for r in type_checking_ranges)
-
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
+        if not isinstance(source, bytes):
+            return imports
+        # Undecodable bytes (e.g. inside a string literal): parse the
+        # replacement-decoded text instead, as for the other languages
+        try:
+            tree = ast.parse(source.decode("utf-8", errors="replace"), filename=file_path)
+        except SyntaxError:
+            return imports
+
+    # Breadth-first over statements only (same order as ast.walk). Each
+    # entry carries whether it sits inside an `if TYPE_CHECKING:` body.
+    queue = deque([(tree, False)])
+    while queue:
+        node, type_only = queue.popleft()
+        kind = type(node)
+
+        if kind is ast.Import:
             for alias in node.names:
                 imports.append(Import(
                     source_file=file_path,
-                    target=alias.name,
+                    target=_intern(alias.name),
                     alias=alias.asname,
-                    is_type_only=_in_type_checking(node.lineno),
+                    is_type_only=type_only,
                     line=node.lineno,
                 ))
-        elif isinstance(node, ast.ImportFrom):
+            continue
+        if kind is ast.ImportFrom:
             module = node.module or ""
             # Handle relative imports: dots indicate relative level
             prefix = "." * (node.level or 0)
@@ -140,11 +189,23 @@ def _extract_python_imports(file_path: str, source: str) -> List[Import]:
             for alias in node.names:
                 imports.append(Import(
                     source_file=file_path,
-                    target=target,
+                    target=_intern(target),
                     alias=alias.asname,
-                    is_type_only=_in_type_checking(node.lineno),
+                    is_type_only=type_only,
                     line=node.lineno,
                 ))
+            continue
+
+        fields = _PY_BLOCK_FIELDS.get(kind)
+        if fields is None:
+            continue
+        body_type_only = type_only or (
+            kind is ast.If and _is_type_checking_test(node.test)
+        )
+        for name in fields:
+            child_type_only = body_type_only if name == "body" else type_only
+            for child in getattr(node, name):
+                queue.append((child, child_type_only))
 
     return imports
 
@@ -154,50 +215,62 @@ def _extract_python_imports(file_path: str, source: str) -> List[Import]:
 # ---------------------------------------------------------------------------
 
 # Matches: import ... from "module"  /  import "module"  /  require("module")
+#          /  export ... from "module"
+# One capture group: the alternation only covers the syntactic prefix, so
+# every match yields its module in group 1.
 _JS_IMPORT_RE = re.compile(
-    r"""(?mx)
+    r"""(?x)
+    (?<![\w$.])                             # not inside a longer identifier
     (?:
-        # import type { ... } from "module"
-        import\s+type\s+.*?\s+from\s+['"]([^'"]+)['"]
-        |
-        # import ... from "module"
-        import\s+.*?\s+from\s+['"]([^'"]+)['"]
-        |
-        # import "module" (side-effect)
-        import\s+['"]([^'"]+)['"]
-        |
-        # require("module")
-        require\s*\(\s*['"]([^'"]+)['"]\s*\)
-        |
-        # export ... from "module"
-        export\s+.*?\s+from\s+['"]([^'"]+)['"]
+        import\s+(?:[^'"\n]*?\s+from\s+)?    # import [type] ... from / import (side-effect)
+        | require\s*\(\s*                     # require(
+        | export\s+[^'"\n]*?\s+from\s+       # export ... from
     )
+    ['"]([^'"\n]+)['"]
     """
 )
 
-_JS_TYPE_IMPORT_RE = re.compile(
-    r"""import\s+type\s+""",
+# `import type X from` / `import type { X } from`, but not a default import
+# that happens to be named "type" (`import type from "module"`)
+_JS_TYPE_IMPORT_RE = re.compile(r"import\s+type\s+(?!from\b)")
+
+# Comments and string literals, matched left to right so a "//" inside a
+# string is not taken for a comment. Import matches starting inside one of
+# these spans are commented out or quoted text, not real imports.
+_JS_SKIP_RE = re.compile(
+    r"""//[^\n]*|/\*.*?\*/|'(?:\\.|[^'\\\n])*'|"(?:\\.|[^"\\\n])*"|`(?:\\.|[^`\\])*`""",
+    re.DOTALL,
 )
 
 
+def _line_starts(source: str) -> List[int]:
+    """Offsets at which each line of source begins."""
+    return [0] + [m.end() for m in re.finditer("\n", source)]
+
+
 def _extract_js_ts_imports(file_path: str, source: str, language: str) -> List[Import]:
     """Extract imports from JS/TS source via regex."""
     imports: List[Import] = []
-    for i, line in enumerate(source.splitlines(), 1):
-        stripped = line.strip()
-        if stripped.startswith("//") or stripped.startswith("*"):
+    line_starts = _line_starts(source)
+
+    skip_starts: List[int] = []
+    skip_ends: List[int] = []
+    for m in _JS_SKIP_RE.finditer(source):
+        skip_starts.append(m.start())
+        skip_ends.append(m.end())
+
+    # One pass over the whole file; line numbers come from the offset table
+    for m in _JS_IMPORT_RE.finditer(source):
+        pos = m.start()
+        i = bisect.bisect_right(skip_starts, pos) - 1
+        if i >= 0 and pos < skip_ends[i]:
             continue
-        for m in _JS_IMPORT_RE.finditer(line):
-            # Groups: (1) type import, (2) regular from, (3) side-effect, (4) require, (5) export from
-            target = m.group(1) or m.group(2) or m.group(3) or m.group(4) or m.group(5)
-            if target:
-                is_type = bool(m.group(1)) or bool(_JS_TYPE_IMPORT_RE.search(line))
-                imports.append(Import(
-                    source_file=file_path,
-                    target=target,
-                    is_type_only=is_type,
-                    line=i,
-                ))
+        imports.append(Import(
+            source_file=file_path,
+            target=_intern(m.group(1)),
+            is_type_only=_JS_TYPE_IMPORT_RE.match(source, pos) is not None,
+            line=bisect.bisect_right(line_starts, pos),
+        ))
     return imports
 
 
@@ -207,32 +280,53 @@ def _extract_js_ts_imports(file_path: str, source: str, language: str) -> List[I
 
 _GO_IMPORT_SINGLE_RE = re.compile(r'^\s*import\s+"([^"]+)"', re.MULTILINE)
 _GO_IMPORT_BLOCK_RE = re.compile(r'import\s*\((.*?)\)', re.DOTALL)
-_GO_IMPORT_LINE_RE = re.compile(r'(?:\w+\s+)?"([^"]+)"')
+_GO_IMPORT_LINE_RE = re.compile(r'(?:\w+[ \t]+)?"([^"\n]+)"')
 
 
 def _extract_go_imports(file_path: str, source: str) -> List[Import]:
-    """Extract imports from Go source via regex."""
+    """Extract imports from Go source via regex.
+
+    Matches arrive in file order, so line numbers are kept as a running
+    count of newlines since the previous match rather than recounted.
+    """
     imports: List[Import] = []
+    count = source.count
 
     # Single-line imports
+    line, last = 1, 0
     for m in _GO_IMPORT_SINGLE_RE.finditer(source):
+        pos = m.start()
+        line += count("\n", last, pos)
+        last = pos
         imports.append(Import(
             source_file=file_path,
-            target=m.group(1),
-            line=source[:m.start()].count("\n") + 1,
+            target=_intern(m.group(1)),
+            line=line,
         ))
 
-    # Block imports
+    # Block imports: searches bounded to the block's span, no slicing
+    line, last = 1, 0
+    search = _GO_IMPORT_LINE_RE.search
+    find = source.find
     for block_m in _GO_IMPORT_BLOCK_RE.finditer(source):
-        block_start = source[:block_m.start()].count("\n") + 1
-        for i, line in enumerate(block_m.group(1).splitlines()):
-            line_m = _GO_IMPORT_LINE_RE.search(line)
-            if line_m:
-                imports.append(Import(
-                    source_file=file_path,
-                    target=line_m.group(1),
-                    line=block_start + i,
-                ))
+        start, end = block_m.span(1)
+        while True:
+            line_m = search(source, start, end)
+            if line_m is None:
+                break
+            pos = line_m.start()
+            line += count("\n", last, pos)
+            last = pos
+            imports.append(Import(
+                source_file=file_path,
+                target=_intern(line_m.group(1)),
+                line=line,
+            ))
+            # Only the first quoted path on a line is an import; later ones
+            # are in a trailing comment (`"fmt" // see "x"`)
+            start = find("\n", line_m.end(), end) + 1
+            if not start:
+                break
 
     return imports
 
@@ -241,18 +335,36 @@ def _extract_go_imports(file_path: str, source: str) -> List[Import]:
 # Rust import extraction (via regex)
 # ---------------------------------------------------------------------------
 
-_RUST_USE_RE = re.compile(r'^\s*use\s+([\w:]+)', re.MULTILINE)
+# What follows the `use` keyword: whitespace, then the path
+_RUST_USE_TAIL_RE = re.compile(r'\s+([\w:]+)')
 
 
 def _extract_rust_imports(file_path: str, source: str) -> List[Import]:
-    """Extract use statements from Rust source via regex."""
+    """Extract use statements from Rust source.
+
+    Candidates are found with a literal str.find for "use" (a fast C-level
+    substring search) rather than a line-anchored regex tried at every
+    position; only candidates that start a line (after indentation) are
+    handed to a small regex for the path.
+    """
     imports: List[Import] = []
-    for m in _RUST_USE_RE.finditer(source):
-        imports.append(Import(
-            source_file=file_path,
-            target=m.group(1),
-            line=source[:m.start()].count("\n") + 1,
-        ))
+    find = source.find
+    line, last = 1, 0  # Running line count; candidates arrive in file order
+    pos = find("use")
+    while pos >= 0:
+        # Only indentation may precede `use` on its line
+        line_start = source.rfind("\n", 0, pos) + 1
+        if line_start == pos or source[line_start:pos].isspace():
+            m = _RUST_USE_TAIL_RE.match(source, pos + 3)
+            if m:
+                line += source.count("\n", last, pos)
+                last = pos
+                imports.append(Import(
+                    source_file=file_path,
+                    target=_intern(m.group(1)),
+                    line=line,
+                ))
+        pos = find("use", pos + 3)
     return imports
 
 
@@ -261,6 +373,23 @@ def _extract_rust_imports(file_path: str, source: str) -> List[Import]:
 # ---------------------------------------------------------------------------
 
 
+# Minified bundles are build output; their require() calls are bundler
+# internals rather than project structure
+_MINIFIED_SUFFIXES = (".min.js", ".min.mjs", ".min.cjs")
+
+
+def _max_source_bytes() -> int:
+    """Size limit for parsed files (HEALTH_SCAN_MAX_SOURCE_BYTES; 0 = none)."""
+    try:
+        return int(os.environ.get("HEALTH_SCAN_MAX_SOURCE_BYTES", 2 * 1024 * 1024))
+    except ValueError:
+        return 2 * 1024 * 1024
+
+
+# Files larger than this are almost always generated or bundled
+MAX_SOURCE_BYTES = _max_source_bytes()
+
+
 def extract_imports(file_path: str, language: Optional[str] = None) -> List[Import]:
     """Extract imports from a source file.
 
@@ -268,23 +397,33 @@ def extract_imports(file_path: str, language: Optional[str] = None) -> List[Impo
         file_path: Absolute path to the source file.
         language: Language override. If None, detected from extension.
 
+    Minified bundles and files over MAX_SOURCE_BYTES are skipped (empty
+    list) before being read.
+
     Returns:
         List of Import instances. Empty list on errors.
     """
     if language is None:
         language = detect_language(file_path)
-    if language is None:
+    if language is None or file_path.endswith(_MINIFIED_SUFFIXES):
         return []
+    file_path = _intern(file_path)
 
     try:
-        with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-            source = f.read()
+        with open(file_path, "rb") as f:
+            if MAX_SOURCE_BYTES and os.fstat(f.fileno()).st_size > MAX_SOURCE_BYTES:
+                return []
+            raw = f.read()
     except (OSError, IOError):
         return []
 
+    # ast.parse takes bytes directly and honours BOMs and coding cookies;
+    # the regex-based extractors work on decoded text
     if language == "python":
-        return _extract_python_imports(file_path, source)
-    elif language in ("javascript", "typescript"):
+        return _extract_python_imports(file_path, raw)
+
+    source = raw.decode("utf-8", errors="replace")
+    if language in ("javascript", "typescript"):
         return _extract_js_ts_imports(file_path, source, language)
     elif language == "go":
         return _extract_go_imports(file_path, source)
@@ -294,6 +433,184 @@ def extract_imports(file_path: str, language: Optional[str] = None) -> List[Impo
         return []
 
 
+# Below this many files, process-pool startup costs more than it saves
+PARALLEL_MIN_FILES = 200
+
+
+def _extract_imports_safe(
+    file_path: str, language: Optional[str]
+) -> Tuple[List[Import], Optional[str]]:
+    """extract_imports that reports unexpected errors instead of raising.
+
+    Top-level so process workers can run it.
+    """
+    try:
+        return extract_imports(file_path, language), None
+    except Exception as e:
+        return [], str(e)
+
+
+# Bump when the cache entry shape below changes so stale caches are discarded
+IMPORT_CACHE_VERSION = 2
+
+
+def _cache_entry(st: os.stat_result, imports: List[Import]) -> dict:
+    """Serialize one file's imports for the cache (compact rows, no source)."""
+    return {
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "imports": [
+            [imp.target, imp.alias, imp.is_type_only, imp.line] for imp in imports
+        ],
+    }
+
+
+def extract_imports_batch(
+    paths: List[str],
+    languages: Optional[List[Optional[str]]] = None,
+    errors: Optional[Dict[str, str]] = None,
+    cache: Optional[Dict[str, dict]] = None,
+) -> Dict[str, List[Import]]:
+    """Extract imports from many files, in parallel when there are enough.
+
+    Parsing is independent per file, so large batches are spread over a
+    process pool (one worker per CPU); small ones run in-process.
+
+    Args:
+        paths: Source files to parse.
+        languages: Per-path language overrides (parallel to paths), or None
+                   to detect each from its extension.
+        errors: If given, filled with {path: message} for files whose
+                extraction raised. Those files map to an empty list.
+        cache: If given, a {path: entry} dict (persisted by the caller,
+               see IMPORT_CACHE_VERSION). Files whose mtime and size match
+               their entry are not re-parsed; parsed files get fresh
+               entries. Entries for other paths are left untouched.
+
+    Returns:
+        {path: list of Import instances}, in input order.
+    """
+    if languages is None:
+        languages = [None] * len(paths)
+
+    batch: Dict[str, List[Import]] = {}
+    stats: Dict[str, os.stat_result] = {}
+    todo_paths: List[str] = []
+    todo_langs: List[Optional[str]] = []
+    for path, language in zip(paths, languages):
+        if cache is not None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                st = None
+            if st is not None:
+                stats[path] = st
+                entry = cache.get(path)
+                if (entry
+                        and entry.get("mtime_ns") == st.st_mtime_ns
+                        and entry.get("size") == st.st_size):
+                    batch[path] = [
+                        Import(path, _intern(target), *rest)
+                        for target, *rest in entry["imports"]
+                    ]
+                    continue
+        todo_paths.append(path)
+        todo_langs.append(language)
+
+    workers = os.cpu_count() or 1
+    if len(todo_paths) < PARALLEL_MIN_FILES or workers < 2:
+        results = map(_extract_imports_safe, todo_paths, todo_langs)
+        _collect_batch(todo_paths, results, batch, errors, cache, stats)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                _extract_imports_safe, todo_paths, todo_langs, chunksize=32
+            )
+            _collect_batch(todo_paths, results, batch, errors, cache, stats)
+
+    return {path: batch[path] for path in paths}
+
+
+def _collect_batch(
+    paths: List[str],
+    results: Iterable[Tuple[List[Import], Optional[str]]],
+    batch: Dict[str, List[Import]],
+    errors: Optional[Dict[str, str]],
+    cache: Optional[Dict[str, dict]],
+    stats: Dict[str, os.stat_result],
+) -> None:
+    for path, (imports, error) in zip(paths, results):
+        batch[path] = imports
+        if error is not None:
+            if errors is not None:
+                errors[path] = error
+        elif cache is not None and path in stats:
+            cache[path] = _cache_entry(stats[path], imports)
+
+
+# Rust standard crates (never project-internal)
+_RUST_STDLIB = frozenset({"std", "core", "alloc", "proc_macro"})
+
+
+@functools.lru_cache(maxsize=8192)
+def _dir_entries(path: str) -> Tuple[frozenset, frozenset]:
+    """(file names, directory names) directly inside path.
+
+    Resolution probes many candidate names per directory; one cached
+    scandir replaces a stat call per candidate. Unreadable or missing
+    directories yield two empty sets.
+    """
+    files: List[str] = []
+    dirs: List[str] = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_file():
+                        files.append(entry.name)
+                    elif entry.is_dir():
+                        dirs.append(entry.name)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return frozenset(files), frozenset(dirs)
+
+
+def _is_file(path: str) -> bool:
+    """Cached equivalent of os.path.isfile."""
+    parent, name = os.path.split(path)
+    return name in _dir_entries(parent)[0]
+
+
+def _is_dir(path: str) -> bool:
+    """Cached equivalent of os.path.isdir."""
+    parent, name = os.path.split(os.path.normpath(path))
+    return name in _dir_entries(parent)[1]
+
+
+@functools.lru_cache(maxsize=None)
+def _python_top_exists(root: str, top: str) -> bool:
+    """Whether a top-level Python package or module named `top` is in root."""
+    return (
+        _is_dir(os.path.join(root, top))
+        or _is_file(os.path.join(root, top + ".py"))
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _read_go_module_path(root: str) -> Optional[str]:
+    """Module path declared in root/go.mod, or None if absent/unreadable."""
+    try:
+        with open(os.path.join(root, "go.mod"), "r") as f:
+            for line in f:
+                if line.startswith("module "):
+                    return line.split()[1].strip()
+    except (OSError, IOError):
+        pass
+    return None
+
+
 def is_internal_import(target: str, root: str, source_file: str, language: Optional[str] = None) -> bool:
     """Determine whether an import target refers to project-internal code.
 
@@ -314,14 +631,11 @@ def is_internal_import(target: str, root: str, source_file: str, language: Optio
         if target.startswith("."):
             return True
         # Check if top-level module name matches a directory/file in root
-        top = target.split(".")[0]
+        top = target.partition(".")[0]
         if top in _PYTHON_STDLIB:
             return False
         # Check if it exists as a package or module in the project
-        return (
-            os.path.isdir(os.path.join(root, top))
-            or os.path.isfile(os.path.join(root, top + ".py"))
-        )
+        return _python_top_exists(root, top)
 
     elif language in ("javascript", "typescript"):
         # Relative paths are internal
@@ -329,24 +643,15 @@ def is_internal_import(target: str, root: str, source_file: str, language: Optio
 
     elif language == "go":
         # Go imports: internal if they share the module path prefix
-        go_mod = os.path.join(root, "go.mod")
-        if os.path.isfile(go_mod):
-            try:
-                with open(go_mod, "r") as f:
-                    for line in f:
-                        if line.startswith("module "):
-                            module_path = line.split()[1].strip()
-                            return target.startswith(module_path)
-            except (OSError, IOError):
-                pass
-        return False
+        module_path = _read_go_module_path(root)
+        return module_path is not None and target.startswith(module_path)
 
     elif language == "rust":
         # Rust: crate:: and super:: are internal; std/core/alloc are stdlib
         if target.startswith(("crate::", "super::", "self::")):
             return True
-        top = target.split("::")[0]
-        return top not in {"std", "core", "alloc", "proc_macro"}
+        top = target.partition("::")[0]
+        return top not in _RUST_STDLIB
 
     return False
 
@@ -406,12 +711,12 @@ def _resolve_python_import(target: str, source_file: str, root: str) -> Optional
 
     # Try as package
     init = os.path.join(path, "__init__.py")
-    if os.path.isfile(init):
+    if _is_file(init):
         return init
 
     # Try as module
     mod = path + ".py"
-    if os.path.isfile(mod):
+    if _is_file(mod):
         return mod
 
     return None
@@ -426,20 +731,20 @@ def _resolve_js_import(target: str, source_file: str, root: str, language: str)
     resolved = os.path.normpath(os.path.join(base, target))
 
     # Try exact path
-    if os.path.isfile(resolved):
+    if _is_file(resolved):
         return resolved
 
     # Try with extensions
     exts = [".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs"] if language == "typescript" else [".js", ".jsx", ".mjs", ".cjs", ".ts", ".tsx"]
     for ext in exts:
         candidate = resolved + ext
-        if os.path.isfile(candidate):
+        if _is_file(candidate):
             return candidate
 
     # Try index files
     for ext in exts:
         candidate = os.path.join(resolved, "index" + ext)
-        if os.path.isfile(candidate):
+        if _is_file(candidate):
             return candidate
 
     return None
@@ -447,23 +752,14 @@ def _resolve_js_import(target: str, source_file: str, root: str, language: str)
 
 def _resolve_go_import(target: str, root: str) -> Optional[str]:
     """Resolve a Go import to a directory (Go packages are directories)."""
-    go_mod = os.path.join(root, "go.mod")
-    if not os.path.isfile(go_mod):
+    module_path = _read_go_module_path(root)
+    if module_path is None or not target.startswith(module_path):
         return None
 
-    try:
-        with open(go_mod, "r") as f:
-            for line in f:
-                if line.startswith("module "):
-                    module_path = line.split()[1].strip()
-                    if target.startswith(module_path):
-                        rel = target[len(module_path):].lstrip("/")
-                        pkg_dir = os.path.join(root, rel)
-                        if os.path.isdir(pkg_dir):
-                            return pkg_dir
-                    break
-    except (OSError, IOError):
-        pass
+    rel = target[len(module_path):].lstrip("/")
+    pkg_dir = os.path.join(root, rel)
+    if _is_dir(pkg_dir):
+        return pkg_dir
 
     return None
 
@@ -487,12 +783,12 @@ def _resolve_rust_import(target: str, source_file: str, root: str) -> Optional[s
     path = os.path.join(base, *parts)
 
     # Try as file
-    if os.path.isfile(path + ".rs"):
+    if _is_file(path + ".rs"):
         return path + ".rs"
 
     # Try as directory with mod.rs
     mod_rs = os.path.join(path, "mod.rs")
-    if os.path.isfile(mod_rs):
+    if _is_file(mod_rs):
         return mod_rs
 
     return None
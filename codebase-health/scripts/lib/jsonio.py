@@ -0,0 +1,96 @@
+"""Shared JSON parsing and serialization for codebase-health scripts.
+
+orjson is used when installed and the stdlib json module otherwise. Both
+paths accept the same input and produce the same data; see
+dump_json_bytes() for the one formatting difference.
+
+Zero required dependencies — stdlib only, orjson optional.
+"""
+
+import json
+import math
+import re
+
+try:
+    import orjson  # Optional; faster, same data (float exponents differ)
+except ImportError:
+    orjson = None
+
+
+# 20+ digits in a row: possibly an integer beyond 64 bits, which orjson
+# would parse as a float. Long digit runs inside strings match too; those
+# just take the json path.
+_LONG_DIGITS_RE = re.compile(rb"\d{20}")
+
+
+def loads(raw: bytes):
+    """Parse JSON from bytes.
+
+    Whatever orjson rejects (NaN/Infinity literals, invalid JSON) or would
+    get wrong (integers beyond 64 bits) is handed to json, which parses it
+    or reports the error.
+    """
+    if orjson is not None and not _LONG_DIGITS_RE.search(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def _has_non_finite(data) -> bool:
+    """Whether data holds a NaN or infinite float anywhere."""
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, float):
+            if not math.isfinite(obj):
+                return True
+        elif isinstance(obj, dict):
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+    return False
+
+
+def _orjson_dumps(data, option: int):
+    """orjson.dumps(data), or None where json has to serialize it instead."""
+    try:
+        payload = orjson.dumps(data, option=option)
+    except TypeError:
+        return None  # e.g. integers beyond 64 bits
+    # orjson writes NaN and +/-Infinity as null, which changes the data;
+    # json keeps them. Any such float shows up as a null in the output, so
+    # the data is only walked when there is one.
+    if b"null" in payload and _has_non_finite(data):
+        return None
+    return payload
+
+
+def dump_json_bytes(data) -> bytes:
+    """Serialize to 2-space-indented UTF-8 JSON with a trailing newline.
+
+    With orjson the bytes match json.dumps(indent=2, ensure_ascii=False)
+    except for float exponents: orjson writes 1e-7 and 1e16 where json
+    writes 1e-07 and 1e+16. Both parse to the same value.
+    """
+    if orjson is not None:
+        payload = _orjson_dumps(
+            data, orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        )
+        if payload is not None:
+            return payload
+    return (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def dump_json_line(data) -> bytes:
+    """Serialize as one compact JSON line (UTF-8 bytes, trailing newline).
+
+    Same orjson/json relationship as dump_json_bytes().
+    """
+    if orjson is not None:
+        payload = _orjson_dumps(data, orjson.OPT_APPEND_NEWLINE)
+        if payload is not None:
+            return payload
+    return (json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+            + "\n").encode("utf-8")
@@ -2,8 +2,8 @@
 """Merge per-category scan JSON files into final health-scan-findings.json.
 
 Called by the scanner orchestrator after all subagents complete. Reads
-per-category JSON arrays, assigns sequential IDs, deduplicates, computes
-summary counts, and writes the final findings file.
+per-category JSON arrays, deduplicates, then assigns sequential IDs and
+computes summary counts in one pass, and writes the final findings file.
 
 Usage:
     python3 merge-findings.py \
@@ -12,101 +12,137 @@ Usage:
         --project "project-name" \
         --root-path "/absolute/path/to/project"
 
-Atomic writes via temp file + os.replace(). Zero external dependencies.
+Atomic writes via temp file + os.replace(). Zero required dependencies;
+orjson is used for faster JSON parsing/serialization when installed
+(see lib/jsonio.py).
 """
 
 import argparse
-import glob
 import json
 import os
 import re
 import sys
 from datetime import datetime, timezone
 
+# Add parent directory to path for lib imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from lib.jsonio import dump_json_bytes, loads
+
 
 def load_json(path):
     """Load a JSON file."""
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return loads(f.read())
 
 
 def save_json(path, data):
     """Atomic write JSON."""
     os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
     tmp = path + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    with open(tmp, "wb") as f:
+        f.write(dump_json_bytes(data))
     os.replace(tmp, path)
 
 
-def should_skip(filename):
-    """Return True if this file should NOT be merged (WIP, orientation, verify, raw, non-scan)."""
-    base = os.path.basename(filename)
-    # Only process scan-*.json files
-    if not base.startswith("scan-"):
-        return True
-    if not base.endswith(".json"):
-        return True
-    # Skip WIP checkpoint files
-    if "-wip.json" in base:
-        return True
-    # Skip raw script output files
-    if "-raw.json" in base:
-        return True
-    # Skip orientation (it's markdown in .md but guard against .json variant)
-    if "orientation" in base:
-        return True
-    # Skip verify files
-    if base.startswith("scan-verify") or "verify" in base:
-        return True
-    return False
+def iter_scan_files(scan_dir):
+    """Yield paths of per-category scan-*.json files to merge.
+
+    Skips WIP checkpoints, raw script output, orientation and verify files.
+    """
+    with os.scandir(scan_dir) as it:
+        for entry in it:
+            name = entry.name
+            if (name.startswith("scan-")
+                    and name.endswith(".json")
+                    # WIP checkpoints and raw script output
+                    and "-wip.json" not in name
+                    and "-raw.json" not in name
+                    # Orientation is markdown, but guard against a .json variant
+                    and "orientation" not in name
+                    and "verify" not in name
+                    and entry.is_file()):
+                yield entry.path
+
+
+# Shared stand-in for a missing location; never mutated
+_EMPTY = {}
+
+# From this many findings, dedupe by sorting instead of hashing: one sort
+# over precomputed keys, then a sequential scan, with no large hash table
+SORT_DEDUP_MIN = 50000
 
 
 def deduplicate(findings):
-    """Deduplicate by (file, lines tuple, category). Keeps first occurrence."""
-    seen = set()
-    result = []
-    dups = 0
+    """Deduplicate by (file, lines, category). Keeps first occurrence."""
+    if len(findings) >= SORT_DEDUP_MIN:
+        try:
+            return _deduplicate_sorted(findings)
+        except TypeError:
+            pass  # Keys of mixed types can't be ordered; hashing still works
+
+    seen = {}
+    keep = seen.setdefault
     for f in findings:
-        loc = f.get("location", {})
-        key = (
+        loc = f.get("location") or _EMPTY
+        # Lines are flattened into the key rather than wrapped in a tuple
+        key = (loc.get("file", ""), *(loc.get("lines") or ()), f.get("category", ""))
+        keep(key, f)
+    result = list(seen.values())
+    return result, len(findings) - len(result)
+
+
+def _deduplicate_sorted(findings):
+    """Sort-and-scan variant of deduplicate() with the same result and order."""
+    keys = []
+    for f in findings:
+        loc = f.get("location") or _EMPTY
+        keys.append((
             loc.get("file", ""),
-            tuple(loc.get("lines", [])),
+            tuple(loc.get("lines") or ()),
             f.get("category", ""),
-        )
-        if key in seen:
-            dups += 1
-            continue
-        seen.add(key)
-        result.append(f)
-    return result, dups
+        ))
+
+    # Stable sort, so the first occurrence leads each run of equal keys
+    order = sorted(range(len(findings)), key=keys.__getitem__)
+    kept = []
+    prev = None
+    for i in order:
+        if keys[i] != prev:
+            kept.append(i)
+            prev = keys[i]
+
+    # Restore input order
+    kept.sort()
+    return [findings[i] for i in kept], len(findings) - len(kept)
+
 
+def finalize(findings):
+    """Add placeholders and sequential IDs, and count the summary, in one pass.
 
-def assign_ids(findings):
-    """Assign sequential IDs: F001, F002, ... (zero-padded)."""
+    Each finding gets null verification/implementation fields and an ID
+    F001, F002, ... (zero-padded, wider past 999).
+
+    Returns:
+        Summary dict: total_findings, by_severity, by_category.
+    """
     n = len(findings)
-    if n >= 1000:
-        width = len(str(n))
-    else:
-        width = 3
+    width = max(3, len(str(n)))
+    by_severity = {}
+    by_category = {}
     for i, f in enumerate(findings, start=1):
+        f["verification"] = None
+        f["implementation"] = None
         f["id"] = f"F{i:0{width}d}"
-
-
-def compute_summary(findings):
-    """Compute summary counts."""
-    summary = {
-        "total_findings": len(findings),
-        "by_severity": {},
-        "by_category": {},
-    }
-    for f in findings:
         sev = f.get("severity", "unknown")
         cat = f.get("category", "unknown")
-        summary["by_severity"][sev] = summary["by_severity"].get(sev, 0) + 1
-        summary["by_category"][cat] = summary["by_category"].get(cat, 0) + 1
-    return summary
+        by_severity[sev] = by_severity.get(sev, 0) + 1
+        by_category[cat] = by_category.get(cat, 0) + 1
+    return {
+        "total_findings": n,
+        "by_severity": by_severity,
+        "by_category": by_category,
+    }
 
 
 def main():
@@ -137,17 +173,13 @@ def main():
         print(f"Error: scan directory not found: {scan_dir}", file=sys.stderr)
         sys.exit(1)
 
-    # Collect all scan-*.json files
-    pattern = os.path.join(scan_dir, "scan-*.json")
-    json_files = sorted(glob.glob(pattern))
+    # Collect all mergeable scan-*.json files
+    json_files = sorted(iter_scan_files(scan_dir))
 
     all_findings = []
     categories_seen = set()
 
     for json_file in json_files:
-        if should_skip(json_file):
-            continue
-
         try:
             data = load_json(json_file)
         except (json.JSONDecodeError, OSError) as e:
@@ -170,20 +202,15 @@ def main():
     # Deduplicate
     findings, dups = deduplicate(all_findings)
 
-    # Add verification and implementation placeholders
-    for f in findings:
-        f["verification"] = None
-        f["implementation"] = None
-
-    # Assign IDs
-    assign_ids(findings)
+    # Placeholders, IDs and summary counts
+    summary = finalize(findings)
 
     # Build output
     output = {
         "project": args.project,
         "scan_date": datetime.now(timezone.utc).isoformat(),
         "root_path": args.root_path,
-        "summary": compute_summary(findings),
+        "summary": summary,
         "findings": findings,
     }
 
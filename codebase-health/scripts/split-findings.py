@@ -8,189 +8,313 @@ Generates two outputs from health-scan-findings.json:
 
 2. Implementor queue JSON (safe-to-fix findings only)
    for the implementor to read instead of the full findings file.
+   With --implementor-format jsonl it is NDJSON instead: the header
+   (project, scan_date, root_path, summary) on the first line, then one
+   finding per line, written without building the whole document.
 
 Usage:
     python3 split-findings.py \
         --findings <path>/health-scan-findings.json \
         --bootstrap-out <path>/health-verify-gsd-bootstrap.md \
         --implementor-out <path>/health-implement-queue.json \
-        [--test-baseline <path>/health-verify-test-baseline.json]
+        [--test-baseline <path>/health-verify-test-baseline.json] \
+        [--implementor-format json|jsonl] \
+        [--jobs N]
 
-Zero external dependencies — stdlib only.
+Zero required dependencies; orjson is used for faster JSON parsing and
+serialization when installed (see lib/jsonio.py).
 """
 
 import argparse
 import json
 import os
 import sys
-from datetime import datetime, timezone
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# Add parent directory to path for lib imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from lib.jsonio import dump_json_bytes, dump_json_line, loads
 
 
 def load_json(path):
-    """Load a JSON file."""
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """Load a JSON file.
+
+    Both parsers take the raw bytes, so there is no separate decode pass.
+    """
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+# Both outputs are derived from the findings file and can be regenerated at
+# any time, so writes are atomic but not durable by default: the temp file +
+# os.replace() rename already rules out a torn or half-written output, and
+# skipping fsync avoids a write barrier per file. Pass durable=True only for
+# source-of-truth data.
+
+
+def _sync(f):
+    """Flush f and fsync it to disk."""
+    f.flush()
+    os.fsync(f.fileno())
+
 
+def save_json(path, data, durable=False):
+    """Atomic write JSON.
 
-def save_json(path, data):
-    """Atomic write JSON."""
+    The document is serialized in one call and written with a single
+    write, rather than streamed through json.dump's many small chunks.
+    """
+    payload = dump_json_bytes(data)
     tmp = path + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    with open(tmp, "wb") as f:
+        f.write(payload)
+        if durable:
+            _sync(f)
     os.replace(tmp, path)
 
 
-def save_text(path, text):
-    """Atomic write text."""
+def save_jsonl(path, header, records, durable=False):
+    """Atomic write NDJSON: header on the first line, then one line per record.
+
+    Records are serialized and written one at a time, so only a single
+    record's bytes are held in memory at once.
+    """
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(dump_json_line(header))
+        for record in records:
+            f.write(dump_json_line(record))
+        if durable:
+            _sync(f)
+    os.replace(tmp, path)
+
+
+def save_text_streaming(path, writer, durable=False):
+    """Atomic write text produced incrementally.
+
+    Calls writer(f) with the open temp file, so the document is written as
+    it is generated rather than built up in memory first.
+    """
     tmp = path + ".tmp"
     with open(tmp, "w", encoding="utf-8") as f:
-        f.write(text)
+        writer(f)
+        if durable:
+            _sync(f)
     os.replace(tmp, path)
 
 
-def filter_findings(findings, safety_value):
-    """Return findings matching a verification.safety value."""
-    result = []
-    for f in findings:
-        v = f.get("verification")
-        if v and v.get("safety") == safety_value:
-            result.append(f)
-    return result
+_ensured_dirs = set()
 
 
-def group_by_category(findings):
-    """Group findings by category, preserving order of first appearance."""
-    groups = {}
-    order = []
-    for f in findings:
-        cat = f.get("category", "unknown")
-        if cat not in groups:
-            groups[cat] = []
-            order.append(cat)
-        groups[cat].append(f)
-    return [(cat, groups[cat]) for cat in order]
-
-
-def estimate_effort(finding):
-    """Estimate effort based on dependent count and file touches."""
-    v = finding.get("verification", {}) or {}
-    deps = v.get("dependents", []) or []
+def ensure_dir(path):
+    """Create directory `path` if needed, at most once per process."""
+    if path not in _ensured_dirs:
+        if not os.path.isdir(path):
+            os.makedirs(path, exist_ok=True)
+        _ensured_dirs.add(path)
+
+
+# A needs-review finding with the fields rendering needs already looked up:
+# raw finding, verification dict, location dict, dependents list, effort index
+PreppedFinding = namedtuple("PreppedFinding", "raw v loc deps effort")
+
+_EMPTY = {}  # Shared stand-in for a missing location; never mutated
+
+
+# Effort levels, indexed by estimate_effort(); a group's effort is the max
+EFFORT_LEVELS = ("Small", "Medium", "Large")
+
+
+def estimate_effort(deps):
+    """Estimate effort from a finding's dependents (files touched).
+
+    Returns an index into EFFORT_LEVELS: 0 for at most one dependent, 1 for
+    up to four, 2 beyond that.
+    """
     n = len(deps)
-    if n <= 1:
-        return "Small"
-    elif n <= 4:
-        return "Medium"
-    else:
-        return "Large"
+    return 0 if n <= 1 else 1 if n <= 4 else 2
+
 
+# Upper-cased severity labels; there are only a handful of distinct values
+_SEVERITY_LABELS = {}
 
-def format_finding_entry(finding):
-    """Format a single finding for the bootstrap markdown."""
-    v = finding.get("verification", {}) or {}
-    loc = finding.get("location", {}) or {}
 
-    lines = []
-    fid = finding.get("id", "?")
-    title = finding.get("title", "")
-    lines.append(f"### {fid} — {title}")
+def format_finding_entry(prepped, out):
+    """Write a single PreppedFinding's bootstrap markdown lines to `out`."""
+    finding, v, loc, deps, _ = prepped
+    w = out.write
 
-    # Severity and category
-    severity = finding.get("severity", "?").upper()
-    category = finding.get("category", "?")
+    # Heading, severity, category and file are always present
+    sev = finding.get("severity", "?")
+    severity = _SEVERITY_LABELS.get(sev)
+    if severity is None:
+        severity = _SEVERITY_LABELS[sev] = sev.upper()
     file_ref = loc.get("file", "?")
     loc_lines = loc.get("lines")
     if loc_lines:
-        file_ref += ":" + ",".join(str(l) for l in loc_lines)
-    lines.append(f"- **Severity:** {severity} | **Category:** {category}")
-    lines.append(f"- **File:** `{file_ref}`")
-
-    # Problem — combine evidence + verification reasoning
-    evidence = finding.get("evidence", "")
-    reasoning = v.get("reasoning", "")
-    if evidence and reasoning:
-        lines.append(f"- **Problem:** {evidence}")
-    elif evidence:
-        lines.append(f"- **Problem:** {evidence}")
-    elif reasoning:
-        lines.append(f"- **Problem:** {reasoning}")
+        file_ref += ":" + ",".join(map(str, loc_lines))
+    w(f"### {finding.get('id', '?')} — {finding.get('title', '')}\n"
+      f"- **Severity:** {severity} | **Category:** {finding.get('category', '?')}\n"
+      f"- **File:** `{file_ref}`\n")
+
+    # Problem — evidence, falling back to verification reasoning
+    problem = finding.get("evidence", "") or v.get("reasoning", "")
+    if problem:
+        w(f"- **Problem:** {problem}\n")
 
     # Impact analysis as runtime impact if present
     impact = v.get("impact_analysis", "")
     if impact:
-        lines.append(f"- **Runtime impact:** {impact}")
+        w(f"- **Runtime impact:** {impact}\n")
 
     # Proposed fix
     proposed = v.get("proposed_change", "")
     if proposed:
-        lines.append(f"- **Proposed fix:** {proposed}")
+        w(f"- **Proposed fix:** {proposed}\n")
 
     # Files touched (dependents)
-    deps = v.get("dependents", []) or []
     if deps:
-        lines.append(f"- **Files touched:** {', '.join('`' + d + '`' for d in deps)}")
+        w("- **Files touched:** `" + "`, `".join(deps) + "`\n")
 
     # Test coverage
     test_cov = v.get("test_coverage", "")
     if test_cov:
-        lines.append(f"- **Test coverage:** {test_cov}")
+        w(f"- **Test coverage:** {test_cov}\n")
 
     # Risk
     risk = v.get("risk_notes", "")
     if risk:
-        lines.append(f"- **Risk:** {risk}")
+        w(f"- **Risk:** {risk}\n")
+
+
+def partition_findings(findings):
+    """Split findings by verification.safety in a single pass.
+
+    The same traversal also gathers what the two outputs need: severity and
+    category counts for safe-to-fix findings, and needs-review findings
+    grouped by category (in order of first appearance) with each group's
+    effort.
+
+    Returns:
+        Dict with "safe-to-fix", "needs-review", "do-not-touch" and
+        "unverified" finding lists (an unrecognized safety value lands in
+        none of them), "queue_summary" ({total_findings, by_severity,
+        by_category}) and "review_groups" ([(category, [PreppedFinding],
+        effort)]).
+    """
+    safe_to_fix, needs_review, do_not_touch, unverified = [], [], [], []
+    by_severity = Counter()
+    by_category = Counter()
+    # category -> [max effort, findings]; dicts keep first-seen order
+    groups = {}
+    group = group_cat = None  # Group of the previous needs-review finding
 
-    return "\n".join(lines)
+    for f in findings:
+        v = f.get("verification")
+        safety = v.get("safety") if v else None
+        if safety == "safe-to-fix":
+            safe_to_fix.append(f)
+            by_severity[f.get("severity", "unknown")] += 1
+            by_category[f.get("category", "unknown")] += 1
+        elif safety == "needs-review":
+            needs_review.append(f)
+            cat = f.get("category", "unknown")
+            deps = v.get("dependents") or ()  # () is a shared constant
+            effort = estimate_effort(deps)
+            prepped = PreppedFinding(
+                f, v, f.get("location") or _EMPTY, deps, effort
+            )
+            # Scans usually emit findings category by category, so most
+            # findings continue the previous one's group: compare against
+            # it first and only probe the dict when the category changes.
+            if group is None or cat != group_cat:
+                group = groups.get(cat)
+                if group is None:
+                    group = groups[cat] = [effort, []]
+                group_cat = cat
+            group[1].append(prepped)
+            if effort > group[0]:
+                group[0] = effort
+        elif safety == "do-not-touch":
+            do_not_touch.append(f)
+        elif not safety:
+            unverified.append(f)
+
+    return {
+        "safe-to-fix": safe_to_fix,
+        "needs-review": needs_review,
+        "do-not-touch": do_not_touch,
+        "unverified": unverified,
+        "queue_summary": {
+            "total_findings": len(safe_to_fix),
+            "by_severity": dict(by_severity),
+            "by_category": dict(by_category),
+        },
+        "review_groups": [
+            (cat, group, EFFORT_LEVELS[effort])
+            for cat, (effort, group) in groups.items()
+        ],
+    }
 
 
-def generate_bootstrap(data, needs_review, test_baseline):
-    """Generate the GSD bootstrap markdown document."""
-    lines = []
+# Static parts of the bootstrap document
+_BOOTSTRAP_HEADER = (
+    "# Needs-Review Findings — Codebase Health Verification\n"
+    "\n"
+    "**Source:** `.health-scan/health-scan-findings.json` (verified {date})\n"
+    "**Purpose:** Context document for GSD phase planning. Each finding has been "
+    "verified by a dedicated agent and classified as `needs-review` — meaning the "
+    "fix is likely correct but has uncertainty, touches multiple files, or affects "
+    "critical paths. All require human approval before implementation.\n"
+)
+_GROUPING_TABLE_HEADER = (
+    "\n"
+    "## Implementation Grouping Suggestion\n"
+    "\n"
+    "For phase planning, these naturally cluster into work units:\n"
+    "\n"
+    "| Group | Findings | Theme | Effort |\n"
+    "|---|---|---|---|\n"
+)
+
+
+def generate_bootstrap(data, review_groups, test_baseline, out):
+    """Write the GSD bootstrap markdown document to the text stream `out`."""
+    w = out.write
 
     # Header
-    scan_date = data.get("scan_date", datetime.now(timezone.utc).isoformat())
-    lines.append("# Needs-Review Findings — Codebase Health Verification")
-    lines.append("")
-    lines.append(f"**Source:** `.health-scan/health-scan-findings.json` (verified {scan_date[:10]})")
-    lines.append("**Purpose:** Context document for GSD phase planning. Each finding has been "
-                 "verified by a dedicated agent and classified as `needs-review` — meaning the "
-                 "fix is likely correct but has uncertainty, touches multiple files, or affects "
-                 "critical paths. All require human approval before implementation.")
+    if "scan_date" in data:
+        scan_date = data["scan_date"]
+    else:
+        # Only needed for findings files without a scan date
+        from datetime import datetime, timezone
+        scan_date = datetime.now(timezone.utc).isoformat()
+    w(_BOOTSTRAP_HEADER.format(date=scan_date[:10]))
 
     # Test baseline
     if test_baseline:
         passed = test_baseline.get("passed", "?")
         skipped = test_baseline.get("skipped", 0)
         failed = test_baseline.get("failed", 0)
-        lines.append("")
+        w("\n")
         parts = [f"{passed} passed"]
         if skipped:
             parts.append(f"{skipped} skipped")
         parts.append(f"{failed} failed")
-        lines.append(f"**Test baseline:** {', '.join(parts)}")
+        w(f"**Test baseline:** {', '.join(parts)}\n")
 
-    lines.append("")
-    lines.append("---")
-
-    # Group findings by category
-    grouped = group_by_category(needs_review)
+    w("\n---\n")
 
+    # One section per category group
     group_num = 0
     group_summaries = []
-    for cat, findings in grouped:
+    for cat, findings, group_effort in review_groups:
         group_num += 1
         # Determine group theme from category
         theme = cat.replace("-", " ").title()
-        finding_ids = [f.get("id", "?") for f in findings]
-
-        # Estimate group effort from max of individual efforts
-        efforts = [estimate_effort(f) for f in findings]
-        if "Large" in efforts:
-            group_effort = "Large"
-        elif "Medium" in efforts:
-            group_effort = "Medium"
-        else:
-            group_effort = "Small"
+        finding_ids = [p.raw.get("id", "?") for p in findings]
 
         group_summaries.append({
             "name": theme,
@@ -198,57 +322,31 @@ def generate_bootstrap(data, needs_review, test_baseline):
             "effort": group_effort,
         })
 
-        lines.append("")
-        lines.append(f"## Group {group_num}: {theme}")
-        lines.append("")
-        for finding in findings:
-            lines.append(format_finding_entry(finding))
-            lines.append("")
-            lines.append("---")
+        w(f"\n## Group {group_num}: {theme}\n\n")
+        for prepped in findings:
+            format_finding_entry(prepped, out)
+            w("\n---\n")
 
     # Implementation Grouping Suggestion table
-    lines.append("")
-    lines.append("## Implementation Grouping Suggestion")
-    lines.append("")
-    lines.append("For phase planning, these naturally cluster into work units:")
-    lines.append("")
-    lines.append("| Group | Findings | Theme | Effort |")
-    lines.append("|---|---|---|---|")
+    w(_GROUPING_TABLE_HEADER)
     for gs in group_summaries:
         ids_str = ", ".join(gs["ids"])
-        lines.append(f"| {gs['name']} | {ids_str} | {gs['name']} | {gs['effort']} |")
+        w(f"| {gs['name']} | {ids_str} | {gs['name']} | {gs['effort']} |\n")
 
-    lines.append("")
-    return "\n".join(lines)
 
+def generate_implementor_queue(data, safe_findings, summary):
+    """Generate the implementor queue JSON (same structure, filtered findings).
 
-def generate_implementor_queue(data, safe_findings):
-    """Generate the implementor queue JSON (same structure, filtered findings)."""
-    queue = {
+    `summary` holds the counts for safe_findings from partition_findings().
+    """
+    return {
         "project": data.get("project", ""),
         "scan_date": data.get("scan_date", ""),
         "root_path": data.get("root_path", ""),
-        "summary": {
-            "total_findings": len(safe_findings),
-            "by_severity": {},
-            "by_category": {},
-        },
+        "summary": summary,
         "findings": safe_findings,
     }
 
-    # Recompute summary counts
-    for f in safe_findings:
-        sev = f.get("severity", "unknown")
-        cat = f.get("category", "unknown")
-        queue["summary"]["by_severity"][sev] = (
-            queue["summary"]["by_severity"].get(sev, 0) + 1
-        )
-        queue["summary"]["by_category"][cat] = (
-            queue["summary"]["by_category"].get(cat, 0) + 1
-        )
-
-    return queue
-
 
 def main():
     parser = argparse.ArgumentParser(
@@ -269,6 +367,16 @@ def main():
         "--test-baseline", default=None,
         help="Path to health-verify-test-baseline.json (optional)"
     )
+    parser.add_argument(
+        "--implementor-format", choices=["json", "jsonl"], default="json",
+        help="Implementor queue format: a single JSON document (default), or "
+             "NDJSON with the queue header on the first line and one finding "
+             "per line after it"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=2,
+        help="Write the two outputs concurrently when > 1 (default: 2)"
+    )
     args = parser.parse_args()
 
     # Load findings
@@ -297,35 +405,61 @@ def main():
                       file=sys.stderr)
 
     # Split findings
-    needs_review = filter_findings(all_findings, "needs-review")
-    safe_to_fix = filter_findings(all_findings, "safe-to-fix")
+    split = partition_findings(all_findings)
+    safe_to_fix = split["safe-to-fix"]
+    needs_review = split["needs-review"]
+    do_not_touch = split["do-not-touch"]
+    unverified = split["unverified"]
 
-    # Generate bootstrap (only if needs-review findings exist)
     bootstrap_path = os.path.abspath(args.bootstrap_out)
+    impl_path = os.path.abspath(args.implementor_out)
+
+    def write_bootstrap():
+        ensure_dir(os.path.dirname(bootstrap_path))
+        save_text_streaming(
+            bootstrap_path,
+            lambda out: generate_bootstrap(
+                data, split["review_groups"], test_baseline, out
+            ),
+        )
+
+    def write_queue():
+        ensure_dir(os.path.dirname(impl_path))
+        queue = generate_implementor_queue(data, safe_to_fix,
+                                           split["queue_summary"])
+        if args.implementor_format == "jsonl":
+            findings = queue.pop("findings")
+            save_jsonl(impl_path, queue, findings)
+        else:
+            save_json(impl_path, queue)
+
+    # Each output is only generated if it has findings. The two are
+    # independent, so with --jobs > 1 they are written concurrently.
+    writers = []
+    if needs_review:
+        writers.append(write_bootstrap)
+    if safe_to_fix:
+        writers.append(write_queue)
+    if args.jobs > 1 and len(writers) > 1:
+        with ThreadPoolExecutor(max_workers=len(writers)) as pool:
+            for fut in [pool.submit(fn) for fn in writers]:
+                fut.result()
+    else:
+        for fn in writers:
+            fn()
+
     if needs_review:
-        os.makedirs(os.path.dirname(bootstrap_path), exist_ok=True)
-        bootstrap_md = generate_bootstrap(data, needs_review, test_baseline)
-        save_text(bootstrap_path, bootstrap_md)
         print(f"Bootstrap: {len(needs_review)} needs-review findings → {bootstrap_path}",
               file=sys.stderr)
     else:
         print("Bootstrap: no needs-review findings, skipping", file=sys.stderr)
-
-    # Generate implementor queue (only if safe-to-fix findings exist)
-    impl_path = os.path.abspath(args.implementor_out)
     if safe_to_fix:
-        os.makedirs(os.path.dirname(impl_path), exist_ok=True)
-        queue = generate_implementor_queue(data, safe_to_fix)
-        save_json(impl_path, queue)
         print(f"Implementor queue: {len(safe_to_fix)} safe-to-fix findings → {impl_path}",
               file=sys.stderr)
     else:
         print("Implementor queue: no safe-to-fix findings, skipping", file=sys.stderr)
 
     # Summary
-    do_not_touch = filter_findings(all_findings, "do-not-touch")
-    unverified = [f for f in all_findings
-                  if not f.get("verification") or not f["verification"].get("safety")]
     print(f"\nSplit summary: {len(safe_to_fix)} safe-to-fix, "
           f"{len(needs_review)} needs-review, "
           f"{len(do_not_touch)} do-not-touch, "
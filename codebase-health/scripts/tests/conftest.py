@@ -0,0 +1,26 @@
+"""Shared fixtures for the codebase-health script tests."""
+
+import importlib.util
+import os
+import sys
+
+import pytest
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The scripts import their helpers as `lib.*`, relative to scripts/
+sys.path.insert(0, SCRIPTS_DIR)
+
+
+@pytest.fixture
+def load_script():
+    """Import a hyphenated script (e.g. "verify-finding") as a module."""
+
+    def load(name):
+        path = os.path.join(SCRIPTS_DIR, f"{name}.py")
+        spec = importlib.util.spec_from_file_location(name.replace("-", "_"), path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    return load
@@ -0,0 +1,27 @@
+"""Tests for add-finding.py."""
+
+import pytest
+
+FINDING = {
+    "category": "orphaned-code",
+    "severity": "low",
+    "confidence": "high",
+    "title": "Unused helper",
+    "location": {"file": "a.py", "lines": [3, 9], "symbol": "helper"},
+    "evidence": "No callers",
+    "recommendation": "remove",
+}
+
+
+@pytest.mark.parametrize("lines", [[True, False], [1, True], [9, 3]])
+def test_validate_finding_rejects_bad_line_ranges(load_script, lines):
+    add_finding = load_script("add-finding")
+    finding = dict(FINDING, location=dict(FINDING["location"], lines=lines))
+    with pytest.raises(SystemExit):
+        add_finding.validate_finding(finding, "line 1")
+
+
+def test_validate_finding_accepts_a_line_range(load_script):
+    add_finding = load_script("add-finding")
+    finding = add_finding.validate_finding(FINDING, "line 1")
+    assert finding["location"]["lines"] == [3, 9]
@@ -0,0 +1,18 @@
+"""Tests for lib.fileio."""
+
+import os
+
+from lib.fileio import write_atomic
+
+
+def test_write_atomic_ignores_temp_files_left_by_killed_runs(tmp_path):
+    path = tmp_path / "findings.json"
+    # The name a crashed earlier run with this PID used to leave behind
+    (tmp_path / f"findings.json.{os.getpid()}.tmp").write_text("partial")
+
+    write_atomic(str(path), "{}\n")
+
+    assert path.read_text() == "{}\n"
+    assert sorted(os.listdir(tmp_path)) == [
+        "findings.json", f"findings.json.{os.getpid()}.tmp",
+    ]
@@ -0,0 +1,22 @@
+"""Tests for lib.imports."""
+
+from lib.imports import _extract_go_imports
+
+
+def test_go_block_ignores_quoted_text_in_trailing_comment():
+    source = (
+        "package main\n"
+        "\n"
+        "import (\n"
+        '\t"strings" // see "trailing" note\n'
+        '\tfoo "example.com/a/b"\n'
+        "\n"
+        '\t"os"\n'
+        ")\n"
+    )
+    imports = _extract_go_imports("main.go", source)
+    assert [(i.target, i.line) for i in imports] == [
+        ("strings", 4),
+        ("example.com/a/b", 5),
+        ("os", 7),
+    ]
@@ -0,0 +1,22 @@
+"""Tests for lib.jsonio."""
+
+import json
+import math
+
+from lib.jsonio import dump_json_bytes, dump_json_line, loads
+
+
+def test_non_finite_floats_survive_a_round_trip():
+    data = {"ratio": float("nan"), "limit": float("inf"), "note": None}
+    for dump in (dump_json_bytes, dump_json_line):
+        back = loads(dump(data))
+        assert math.isnan(back["ratio"])
+        assert back["limit"] == float("inf")
+        assert back["note"] is None
+
+
+def test_matches_json_for_big_integers():
+    data = {"hash": 123456789012345678901234}
+    expected = json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+    assert dump_json_bytes(data) == expected.encode("utf-8")
+    assert loads(b'{"hash": 123456789012345678901234}') == data
@@ -0,0 +1,40 @@
+"""Tests for verify-finding.py."""
+
+import json
+import sys
+
+import pytest
+
+
+def test_batch_handles_integers_beyond_64_bits(load_script, tmp_path, monkeypatch):
+    verify_finding = load_script("verify-finding")
+    findings = tmp_path / "findings.json"
+    findings.write_text(
+        '{"findings":[{"id":"F001","hash":123456789012345678901234}]}'
+    )
+    batch = tmp_path / "batch.json"
+    batch.write_text('[{"id":"F001","verification":{"safety":"safe"}}]')
+
+    monkeypatch.setattr(sys, "argv", [
+        "verify-finding.py", "--findings", str(findings), "--batch", str(batch),
+    ])
+    verify_finding.main()
+
+    assert json.loads(findings.read_text()) == {"findings": [{
+        "id": "F001",
+        "hash": 123456789012345678901234,
+        "verification": {"safety": "safe"},
+    }]}
+
+
+def test_stream_batch_rejects_non_object_findings(load_script, tmp_path):
+    ijson = pytest.importorskip("ijson")
+    verify_finding = load_script("verify-finding")
+    findings = tmp_path / "findings.json"
+    original = '{"findings": [null, {"id": "x"}, {"id": "a"}]}'
+    findings.write_text(original)
+
+    batch = [{"id": "a", "verification": {"safety": "safe"}}]
+    with pytest.raises(ijson.JSONError):
+        verify_finding.stream_apply_batch(str(findings), batch)
+    assert findings.read_text() == original
@@ -3,28 +3,60 @@
 
 Parses dependency manifests and searches for actual usage of each declared
 dependency via import statements, CLI usage in scripts, and config references.
+Python imports are read from the syntax tree, so a name that only appears in
+a comment or string doesn't count; other languages are matched by substring.
 
 Classifies each dependency as: used, unused, or uncertain.
 
 Usage:
     python3 unused-deps.py --root <path> --output <path> [--ignore-file <path>]
+        [--cache-file <path> | --no-cache] [--verbose]
 
-Zero external dependencies — stdlib only.
+Zero required dependencies; google-re2 or pyahocorasick is used to match
+many import names in one pass, and orjson for faster JSON output (see
+lib/jsonio.py), when installed.
 """
 
 import argparse
+import ast
 import json
+import mmap
 import os
 import re
 import sys
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import (
+    Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union,
+)
 
 # Add parent directory to path for lib imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from lib.fileio import write_atomic
+from lib.jsonio import dump_json_bytes
 from lib.ignore import load_ignore_patterns, walk_source_files, ALL_SOURCE_EXTENSIONS
 
+try:
+    import re2  # Optional (google-re2); fastest multi-name search
+    re2.Set.SearchSet  # Other "re2" packages lack RE2::Set
+except (ImportError, AttributeError):
+    re2 = None
+
+try:
+    import ahocorasick  # Optional (pyahocorasick); faster multi-name search
+except ImportError:
+    ahocorasick = None
+
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    try:
+        import tomli as tomllib  # Optional backport for older Pythons
+    except ImportError:
+        tomllib = None
+
 # ---------------------------------------------------------------------------
 # Known package-name → import-name mappings
 # ---------------------------------------------------------------------------
@@ -135,31 +167,73 @@ NODE_ALIASES: Dict[str, List[str]] = {
 # Manifest parsing
 # ---------------------------------------------------------------------------
 
-
-def _parse_package_json(path: str) -> List[dict]:
+# Everything from the first of these characters on is a version specifier,
+# extra, marker or URL rather than part of the package name
+_VERSION_SPLIT_RE = re.compile(r"[>=<!\[;@\s]")
+_INSTALL_REQUIRES_RE = re.compile(r"install_requires\s*=\s*\[(.*?)\]", re.DOTALL)
+_TESTS_REQUIRE_RE = re.compile(r"tests_require\s*=\s*\[(.*?)\]", re.DOTALL)
+_QUOTED_STRING_RE = re.compile(r"[\"']([^\"']+)[\"']")
+
+
+class DepTable:
+    """Declared dependencies as parallel columns (structure of arrays).
+
+    Row i is names[i], ecosystems[i], manifests[i], is_devs[i]. The scan
+    mostly touches names and ecosystems, so keeping each field in its own
+    flat list avoids building and chasing a dict per dependency; dicts are
+    only made for the final report.
+    """
+
+    __slots__ = ("names", "ecosystems", "manifests", "is_devs")
+
+    def __init__(self) -> None:
+        self.names: List[str] = []
+        self.ecosystems: List[str] = []
+        self.manifests: List[str] = []
+        self.is_devs: List[bool] = []
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add(self, name: str, ecosystem: str, manifest: str, is_dev: bool) -> None:
+        """Append one dependency.
+
+        Strings are interned: ecosystems and manifests repeat on every row,
+        and names recur across manifests and ecosystems.
+        """
+        self.names.append(sys.intern(name))
+        self.ecosystems.append(sys.intern(ecosystem))
+        self.manifests.append(sys.intern(manifest))
+        self.is_devs.append(is_dev)
+
+    def unique(self) -> "DepTable":
+        """Copy with only the first row for each (lowercased name, ecosystem)."""
+        seen: Set[Tuple[str, str]] = set()
+        table = DepTable()
+        for row in zip(self.names, self.ecosystems, self.manifests, self.is_devs):
+            key = (row[0].lower(), row[1])
+            if key not in seen:
+                seen.add(key)
+                table.add(*row)
+        return table
+
+
+def _parse_package_json(path: str, table: DepTable) -> None:
     """Parse package.json for dependencies."""
-    deps = []
     try:
         with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
     except (json.JSONDecodeError, OSError):
-        return deps
+        return
 
     for section, is_dev in [("dependencies", False), ("devDependencies", True),
                              ("peerDependencies", False), ("optionalDependencies", False)]:
         for name in data.get(section, {}):
-            deps.append({
-                "name": name,
-                "manifest": os.path.basename(path),
-                "is_dev": is_dev,
-                "ecosystem": "node",
-            })
-    return deps
+            table.add(name, "node", os.path.basename(path), is_dev)
 
 
-def _parse_requirements_txt(path: str) -> List[dict]:
+def _parse_requirements_txt(path: str, table: DepTable) -> None:
     """Parse requirements.txt for dependencies."""
-    deps = []
     is_dev = "dev" in os.path.basename(path).lower()
     try:
         with open(path, "r", encoding="utf-8") as f:
@@ -168,27 +242,82 @@ def _parse_requirements_txt(path: str) -> List[dict]:
                 if not line or line.startswith("#") or line.startswith("-"):
                     continue
                 # Extract package name (before any version specifier)
-                name = re.split(r"[>=<!\[;@\s]", line)[0].strip()
+                name = _VERSION_SPLIT_RE.split(line)[0].strip()
                 if name:
-                    deps.append({
-                        "name": name,
-                        "manifest": os.path.basename(path),
-                        "is_dev": is_dev,
-                        "ecosystem": "python",
-                    })
+                    table.add(name, "python", os.path.basename(path), is_dev)
     except OSError:
         pass
-    return deps
 
 
-def _parse_pyproject_toml(path: str) -> List[dict]:
+def _load_toml(path: str) -> Optional[dict]:
+    """Parse a TOML file, or None if no TOML parser is available or it fails.
+
+    Callers fall back to their line-based parsing on None, which also
+    recovers what it can from files that aren't valid TOML.
+    """
+    if tomllib is None:
+        return None
+    try:
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    except (OSError, ValueError):  # TOMLDecodeError is a ValueError
+        return None
+
+
+def _toml_table(data: dict, *keys: str) -> dict:
+    """data[keys[0]][keys[1]]..., or {} if any level is missing or not a table."""
+    for key in keys:
+        data = data.get(key) if isinstance(data, dict) else None
+    return data if isinstance(data, dict) else {}
+
+
+def _parse_pyproject_toml(path: str, table: DepTable) -> None:
+    """Parse pyproject.toml for dependencies.
+
+    Reads PEP 621 [project] dependencies and optional-dependencies, PEP 735
+    [dependency-groups] and Poetry's tables. Without a TOML parser, falls
+    back to a basic line-based scan.
+    """
+    data = _load_toml(path)
+    if data is None:
+        _scan_pyproject_toml(path, table)
+        return
+
+    def add(name: str, is_dev: bool) -> None:
+        if name:
+            table.add(name, "python", "pyproject.toml", is_dev)
+
+    def add_requirements(requirements: object, is_dev: bool) -> None:
+        if isinstance(requirements, list):
+            for req in requirements:
+                if isinstance(req, str):  # Skips {include-group = ...}
+                    add(_VERSION_SPLIT_RE.split(req.strip())[0], is_dev)
+
+    project = _toml_table(data, "project")
+    add_requirements(project.get("dependencies"), False)
+    for requirements in _toml_table(project, "optional-dependencies").values():
+        add_requirements(requirements, True)
+    for requirements in _toml_table(data, "dependency-groups").values():
+        add_requirements(requirements, True)
+
+    poetry = _toml_table(data, "tool", "poetry")
+    for name in _toml_table(poetry, "dependencies"):
+        if name.lower() != "python":  # The interpreter constraint
+            add(name, False)
+    for name in _toml_table(poetry, "dev-dependencies"):
+        add(name, True)
+    for group in _toml_table(poetry, "group").values():
+        for name in _toml_table(group, "dependencies"):
+            add(name, True)
+
+
+def _scan_pyproject_toml(path: str, table: DepTable) -> None:
     """Parse pyproject.toml for dependencies (basic regex, no toml lib)."""
-    deps = []
     try:
         with open(path, "r", encoding="utf-8") as f:
             content = f.read()
     except OSError:
-        return deps
+        return
 
     # Match dependencies = [...] sections
     in_deps = False
@@ -208,64 +337,58 @@ def _parse_pyproject_toml(path: str) -> List[dict]:
                 name = stripped.split("=")[0].strip().strip('"').strip("'")
             elif stripped.startswith('"') or stripped.startswith("'"):
                 raw = stripped.strip('",\' ')
-                name = re.split(r"[>=<!\[;@\s]", raw)[0].strip()
+                name = _VERSION_SPLIT_RE.split(raw)[0].strip()
             else:
-                name = re.split(r"[>=<!\[;@\s]", stripped)[0].strip()
+                name = _VERSION_SPLIT_RE.split(stripped)[0].strip()
 
             if name and not name.startswith("["):
-                deps.append({
-                    "name": name,
-                    "manifest": "pyproject.toml",
-                    "is_dev": in_dev,
-                    "ecosystem": "python",
-                })
-
-    return deps
+                table.add(name, "python", "pyproject.toml", in_dev)
 
 
-def _parse_setup_py(path: str) -> List[dict]:
+def _parse_setup_py(path: str, table: DepTable) -> None:
     """Parse setup.py for install_requires (regex-based, best effort)."""
-    deps = []
     try:
         with open(path, "r", encoding="utf-8") as f:
             content = f.read()
     except OSError:
-        return deps
+        return
 
     # Look for install_requires=[...] and extras_require={...}
-    for m in re.finditer(r'install_requires\s*=\s*\[(.*?)\]', content, re.DOTALL):
-        for dep in re.findall(r'["\']([^"\']+)["\']', m.group(1)):
-            name = re.split(r"[>=<!\[;@\s]", dep)[0].strip()
+    for m in _INSTALL_REQUIRES_RE.finditer(content):
+        for dep in _QUOTED_STRING_RE.findall(m.group(1)):
+            name = _VERSION_SPLIT_RE.split(dep)[0].strip()
             if name:
-                deps.append({
-                    "name": name,
-                    "manifest": "setup.py",
-                    "is_dev": False,
-                    "ecosystem": "python",
-                })
-
-    for m in re.finditer(r'tests_require\s*=\s*\[(.*?)\]', content, re.DOTALL):
-        for dep in re.findall(r'["\']([^"\']+)["\']', m.group(1)):
-            name = re.split(r"[>=<!\[;@\s]", dep)[0].strip()
+                table.add(name, "python", "setup.py", False)
+
+    for m in _TESTS_REQUIRE_RE.finditer(content):
+        for dep in _QUOTED_STRING_RE.findall(m.group(1)):
+            name = _VERSION_SPLIT_RE.split(dep)[0].strip()
             if name:
-                deps.append({
-                    "name": name,
-                    "manifest": "setup.py",
-                    "is_dev": True,
-                    "ecosystem": "python",
-                })
+                table.add(name, "python", "setup.py", True)
+
 
-    return deps
+def _parse_pipfile(path: str, table: DepTable) -> None:
+    """Parse Pipfile for dependencies.
 
+    Without a TOML parser, falls back to a basic line-based scan.
+    """
+    data = _load_toml(path)
+    if data is None:
+        _scan_pipfile(path, table)
+        return
 
-def _parse_pipfile(path: str) -> List[dict]:
+    for section, is_dev in (("packages", False), ("dev-packages", True)):
+        for name in _toml_table(data, section):
+            table.add(name, "python", "Pipfile", is_dev)
+
+
+def _scan_pipfile(path: str, table: DepTable) -> None:
     """Parse Pipfile for dependencies (basic, no toml lib)."""
-    deps = []
     try:
         with open(path, "r", encoding="utf-8") as f:
             content = f.read()
     except OSError:
-        return deps
+        return
 
     in_section = False
     is_dev = False
@@ -279,24 +402,16 @@ def _parse_pipfile(path: str) -> List[dict]:
         if in_section and "=" in stripped and not stripped.startswith("#"):
             name = stripped.split("=")[0].strip().strip('"').strip("'")
             if name:
-                deps.append({
-                    "name": name,
-                    "manifest": "Pipfile",
-                    "is_dev": is_dev,
-                    "ecosystem": "python",
-                })
-
-    return deps
+                table.add(name, "python", "Pipfile", is_dev)
 
 
-def _parse_go_mod(path: str) -> List[dict]:
+def _parse_go_mod(path: str, table: DepTable) -> None:
     """Parse go.mod for dependencies."""
-    deps = []
     try:
         with open(path, "r", encoding="utf-8") as f:
             content = f.read()
     except OSError:
-        return deps
+        return
 
     in_require = False
     for line in content.splitlines():
@@ -310,34 +425,45 @@ def _parse_go_mod(path: str) -> List[dict]:
         if stripped.startswith("require ") and "(" not in stripped:
             parts = stripped.split()
             if len(parts) >= 2:
-                deps.append({
-                    "name": parts[1],
-                    "manifest": "go.mod",
-                    "is_dev": False,
-                    "ecosystem": "go",
-                })
+                table.add(parts[1], "go", "go.mod", False)
         elif in_require and stripped and not stripped.startswith("//"):
             parts = stripped.split()
             if parts:
-                name = parts[0]
-                deps.append({
-                    "name": name,
-                    "manifest": "go.mod",
-                    "is_dev": "// indirect" in line,
-                    "ecosystem": "go",
-                })
-
-    return deps
-
-
-def _parse_cargo_toml(path: str) -> List[dict]:
+                table.add(parts[0], "go", "go.mod", "// indirect" in line)
+
+
+def _parse_cargo_toml(path: str, table: DepTable) -> None:
+    """Parse Cargo.toml for dependencies.
+
+    Reads [dependencies], [dev-dependencies] and [build-dependencies], their
+    [target.<cfg>.*] variants and [workspace.dependencies]. Without a TOML
+    parser, falls back to a basic line-based scan.
+    """
+    data = _load_toml(path)
+    if data is None:
+        _scan_cargo_toml(path, table)
+        return
+
+    sections = [data, _toml_table(data, "workspace")]
+    sections.extend(t for t in _toml_table(data, "target").values()
+                    if isinstance(t, dict))
+    for section in sections:
+        for kind, is_dev in (
+            ("dependencies", False),
+            ("dev-dependencies", True),
+            ("build-dependencies", True),
+        ):
+            for name in _toml_table(section, kind):
+                table.add(name, "rust", "Cargo.toml", is_dev)
+
+
+def _scan_cargo_toml(path: str, table: DepTable) -> None:
     """Parse Cargo.toml for dependencies (basic, no toml lib)."""
-    deps = []
     try:
         with open(path, "r", encoding="utf-8") as f:
             content = f.read()
     except OSError:
-        return deps
+        return
 
     in_deps = False
     is_dev = False
@@ -351,14 +477,7 @@ def _parse_cargo_toml(path: str) -> List[dict]:
         if in_deps and "=" in stripped and not stripped.startswith("#"):
             name = stripped.split("=")[0].strip()
             if name and not name.startswith("["):
-                deps.append({
-                    "name": name,
-                    "manifest": "Cargo.toml",
-                    "is_dev": is_dev,
-                    "ecosystem": "rust",
-                })
-
-    return deps
+                table.add(name, "rust", "Cargo.toml", is_dev)
 
 
 # ---------------------------------------------------------------------------
@@ -380,13 +499,25 @@ MANIFEST_PARSERS = {
 }
 
 
-def discover_manifests(root: str) -> List[dict]:
+def _list_root_files(root: str) -> Set[str]:
+    """Names of the files directly inside root, from a single directory read.
+
+    Lets the manifest and config lookups below test membership in a set
+    rather than stat each candidate name.
+    """
+    return {os.path.basename(path) for path in _list_dir_files(root)}
+
+
+def discover_manifests(
+    root: str, root_files: Optional[Set[str]] = None
+) -> DepTable:
     """Find and parse all dependency manifests at the project root."""
-    all_deps = []
+    if root_files is None:
+        root_files = _list_root_files(root)
+    all_deps = DepTable()
     for filename, parser in MANIFEST_PARSERS.items():
-        path = os.path.join(root, filename)
-        if os.path.isfile(path):
-            all_deps.extend(parser(path))
+        if filename in root_files:
+            parser(os.path.join(root, filename), all_deps)
     return all_deps
 
 
@@ -395,10 +526,8 @@ def discover_manifests(root: str) -> List[dict]:
 # ---------------------------------------------------------------------------
 
 
-def _get_import_names(dep: dict) -> List[str]:
+def _get_import_names(name: str, ecosystem: str) -> List[str]:
     """Get the list of possible import names for a dependency."""
-    name = dep["name"]
-    ecosystem = dep["ecosystem"]
     names = []
 
     if ecosystem == "python":
@@ -428,42 +557,500 @@ def _get_import_names(dep: dict) -> List[str]:
     return names
 
 
-def _search_in_source_files(
-    root: str, ignore_patterns: List[str], import_names: List[str], ecosystem: str,
-) -> List[str]:
-    """Search source files for import/usage of given names."""
-    evidence = []
-    extensions = None
+# Raw source file content, as read or memory-mapped
+ByteContent = Union[bytes, mmap.mmap]
 
-    if ecosystem == "python":
-        extensions = {".py"}
-    elif ecosystem == "node":
-        extensions = {".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs"}
-    elif ecosystem == "go":
-        extensions = {".go"}
-    elif ecosystem == "rust":
-        extensions = {".rs"}
+# Source file extensions searched for each ecosystem's imports
+ECOSYSTEM_EXTENSIONS: Dict[str, Set[str]] = {
+    "python": {".py"},
+    "node": {".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs"},
+    "go": {".go"},
+    "rust": {".rs"},
+}
+
+# The same table inverted, extension -> ecosystem, to dispatch each walked file
+EXTENSION_ECOSYSTEMS: Dict[str, str] = {
+    ext: eco for eco, exts in ECOSYSTEM_EXTENSIONS.items() for ext in exts
+}
+
+
+def _list_source_files(
+    root: str, ignore_patterns: List[str], ecosystems: Set[str],
+) -> List[Tuple[str, str]]:
+    """Walk the tree once for the source files of the given ecosystems.
+
+    Returns:
+        (absolute path, ecosystem) pairs, in walk order.
+    """
+    extensions = {ext for ext, eco in EXTENSION_ECOSYSTEMS.items()
+                  if eco in ecosystems}
+    if not extensions:
+        return []
+    return [
+        (fpath, EXTENSION_ECOSYSTEMS[os.path.splitext(fpath)[1]])
+        for fpath in walk_source_files(root, ignore_patterns, extensions)
+    ]
+
+
+# Import name -> its UTF-8 bytes, so a name shared by several dependencies
+# or ecosystems (or a matcher rebuilt per batch) is only encoded once
+_encoded_names: Dict[str, bytes] = {}
+
+
+def _index_names(
+    targets: List[Tuple[int, List[str]]],
+) -> Tuple[Dict[bytes, List[int]], List[int]]:
+    """Group dependencies by their UTF-8 encoded import names.
+
+    Returns:
+        ({name: dep indexes}, dep indexes with an empty name, which is a
+        substring of anything). Each name is searched for once, and a hit
+        credits every dependency sharing it.
+    """
+    name_to_deps: Dict[bytes, List[int]] = {}
+    always: List[int] = []
+    for i, names in targets:
+        for name in names:
+            if name:
+                key = _encoded_names.get(name)
+                if key is None:
+                    key = _encoded_names[name] = name.encode("utf-8")
+                name_to_deps.setdefault(key, []).append(i)
+            else:
+                always.append(i)
+    return name_to_deps, always
+
+
+def _build_name_matcher(
+    targets: List[Tuple[int, List[str]]],
+) -> Callable[[ByteContent], Iterable[int]]:
+    """Build a matcher for the import names of a set of dependencies.
+
+    Matching is done on the raw file bytes against the UTF-8 encoded names,
+    so file content never has to be decoded.
+
+    Args:
+        targets: (dep index, import names) pairs.
+
+    Returns:
+        Function mapping file content (bytes or mmap) to the indexes of the
+        dependencies with at least one import name occurring in it as a
+        substring.
+    """
+    name_to_deps, always = _index_names(targets)
+    if not name_to_deps:
+        return lambda content: always
+
+    if re2 is not None:
+        match = _build_re2_matcher(name_to_deps, always)
+        if match is not None:
+            return match
+
+    if ahocorasick is None:
+        def match(content: ByteContent) -> Set[int]:
+            find = content.find
+            hits = set(always)
+            for name, indexes in name_to_deps.items():
+                if not hits.issuperset(indexes) and find(name) != -1:
+                    hits.update(indexes)
+            return hits
+        return match
+
+    # One automaton over every name finds all (overlapping) occurrences in
+    # a single pass over the content, instead of one search per name. The
+    # automaton works on str, so bytes are mapped 1:1 to code points via
+    # latin-1, on both the names and the content.
+    automaton = ahocorasick.Automaton()
+    for name, indexes in name_to_deps.items():
+        automaton.add_word(name.decode("latin-1"), indexes)
+    automaton.make_automaton()
+
+    def match(content: ByteContent) -> Set[int]:
+        hits = set(always)
+        for _, indexes in automaton.iter(str(content, "latin-1")):
+            hits.update(indexes)
+        return hits
+    return match
+
+
+def _build_re2_matcher(
+    name_to_deps: Dict[bytes, List[int]], always: List[int],
+) -> Optional[Callable[[ByteContent], Iterable[int]]]:
+    """_build_name_matcher using an RE2 pattern set, or None if it won't compile.
+
+    RE2::Set reports which of its patterns occur anywhere in the content
+    from a single DFA pass, without visiting each occurrence, and works on
+    bytes and mmaps directly. Each distinct name is one escaped literal.
+    Very large sets can exceed RE2's memory budget; the caller then falls
+    back to the other matchers.
+    """
+    pattern_set = re2.Set.SearchSet()
+    pattern_deps: List[List[int]] = []
+    for name, indexes in name_to_deps.items():
+        pattern_set.Add(re2.escape(name))
+        pattern_deps.append(indexes)
+    try:
+        pattern_set.Compile()
+    except re2.error:
+        return None
+
+    def match(content: ByteContent) -> Set[int]:
+        hits = set(always)
+        for p in pattern_set.Match(content) or ():
+            hits.update(pattern_deps[p])
+        return hits
+    return match
+
+
+# Below this many files, process-pool startup costs more than it saves
+PARALLEL_MIN_FILES = 200
+
+# Evidence kept per dependency in the report. Source evidence comes first,
+# so once a dependency has this many import hits no later file can change
+# its entry, and it is no longer searched for
+EVIDENCE_CAP = 10
+
+# Files scanned between checks for dependencies that reached EVIDENCE_CAP
+SCAN_BATCH_FILES = 256
+
+# This process's search targets, {ecosystem: [(dep index, import names)]},
+# set by _init_matchers, and the matchers built from them for the current
+# set of dropped dependencies
+_targets: Dict[str, List[Tuple[int, List[str]]]] = {}
+_python_names: Dict[int, List[str]] = {}  # dep index -> lowercased names
+_matchers: Dict[str, Callable[[ByteContent], Iterable[int]]] = {}
+_matchers_skip: FrozenSet[int] = frozenset()
+
+
+def _init_matchers(targets: Dict[str, List[Tuple[int, List[str]]]]) -> None:
+    """Set the search targets (also the process-pool initializer)."""
+    global _targets, _python_names, _matchers, _matchers_skip
+    _targets = targets
+    _python_names = {i: [name.lower() for name in names]
+                     for i, names in targets.get("python", ())}
+    _matchers = {}
+    _matchers_skip = frozenset()
+
+
+def _get_matcher(
+    ecosystem: str, skip: FrozenSet[int]
+) -> Callable[[ByteContent], Iterable[int]]:
+    """Matcher for an ecosystem's targets minus the dep indexes in skip.
+
+    Built on first use; skip only grows during a run, so matchers for an
+    older skip set are discarded. Python names are lowercased, to prefilter
+    lowercased content for _python_imports.
+    """
+    global _matchers, _matchers_skip
+    if skip != _matchers_skip:
+        _matchers = {}
+        _matchers_skip = skip
+    match = _matchers.get(ecosystem)
+    if match is None:
+        if ecosystem == "python":
+            targets = [(i, names) for i, names in _python_names.items()
+                       if i not in skip]
+        else:
+            targets = [t for t in _targets[ecosystem] if t[0] not in skip]
+        match = _matchers[ecosystem] = _build_name_matcher(targets)
+    return match
 
-    for fpath in walk_source_files(root, ignore_patterns, extensions):
-        try:
-            with open(fpath, "r", encoding="utf-8", errors="replace") as f:
-                content = f.read()
-        except (OSError, IOError):
-            continue
 
-        rel = os.path.relpath(fpath, root)
+# Source files at least this large are memory-mapped instead of read; below
+# it, the extra map/unmap syscalls cost more than the copy they save
+MMAP_MIN_BYTES = 256 * 1024
 
-        for import_name in import_names:
-            if import_name in content:
-                evidence.append(f"import found in {rel}")
-                break
+# Source files larger than this (generated bundles, vendored blobs) or with a
+# NUL byte in their first SNIFF_BYTES (binary) are not searched
+MAX_SOURCE_BYTES = 2_000_000
+SNIFF_BYTES = 4096
+
+
+def _python_imports(content: bytes) -> Optional[Set[str]]:
+    """Lowercased names of the modules a Python source imports.
+
+    Includes every dotted prefix ("a" and "a.b" for "import a.b"), names
+    brought in by "from a import b" as "a.b", and string literals passed
+    to importlib.import_module() or __import__(). Relative imports are
+    skipped. Returns None if the source doesn't parse.
+    """
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")  # e.g. invalid escape sequences
+            tree = ast.parse(content)
+    except (SyntaxError, ValueError, RecursionError):
+        return None
+
+    modules: List[str] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.module and not node.level:
+                modules.append(node.module)
+                modules.extend(f"{node.module}.{alias.name}" for alias in node.names)
+        elif isinstance(node, ast.Call) and node.args:
+            func = node.func
+            if isinstance(func, ast.Name):
+                func_name = func.id
+            elif isinstance(func, ast.Attribute):
+                func_name = func.attr
+            else:
+                continue
+            arg = node.args[0]
+            if (func_name in ("import_module", "__import__")
+                    and isinstance(arg, ast.Constant) and isinstance(arg.value, str)):
+                modules.append(arg.value)
+
+    imports: Set[str] = set()
+    for module in modules:
+        parts = module.lower().split(".")
+        for n in range(1, len(parts) + 1):
+            imports.add(".".join(parts[:n]))
+    return imports
+
+
+def _match_python_file(content: bytes, skip: FrozenSet[int]) -> List[int]:
+    """_match_source_file for the content of a Python file.
+
+    Only dependencies with a name occurring in the (lowercased) source are
+    checked against its parsed imports, so files mentioning none are never
+    parsed. Files that don't parse fall back to the substring match.
+    """
+    candidates = list(_get_matcher("python", skip)(content.lower()))
+    if not candidates:
+        return []
+    imports = _python_imports(content)
+    if imports is None:
+        return candidates
+    return [i for i in candidates
+            if any(name in imports for name in _python_names[i])]
+
+
+def _match_source_file(
+    fpath: str, ecosystem: str, skip: FrozenSet[int] = frozenset()
+) -> Optional[List[int]]:
+    """Indexes of the dependencies imported by one source file.
+
+    Dependencies whose index is in skip are not searched for. Top-level so
+    process workers can run it. Unreadable files match nothing; oversized
+    and binary files (see MAX_SOURCE_BYTES) aren't searched and give None.
+    """
+    match = _get_matcher(ecosystem, skip)
+    try:
+        with open(fpath, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > MAX_SOURCE_BYTES:
+                return None
+            head = f.read(SNIFF_BYTES)
+            if b"\0" in head:
+                return None
+            if ecosystem == "python":
+                return _match_python_file(head + f.read(), skip)
+            if size >= MMAP_MIN_BYTES:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return list(match(mm))
+            content = head + f.read()
+    except (OSError, ValueError):  # ValueError: file emptied before mmap
+        return []
+    return list(match(content))
+
+
+# Bump when the source cache layout below changes so stale caches are discarded
+SOURCE_CACHE_VERSION = 2
+
+
+def load_source_cache(path: str) -> dict:
+    """Load the source scan cache. Missing or unreadable caches are empty.
+
+    The cache holds "targets" (the import names it was built for, see
+    _search_in_source_files) and "files" ({path: {mtime_ns, size, hits}},
+    plus "skipped", the dep indexes not searched for, when there were any,
+    and "ignored" for oversized or binary files).
+    """
+    try:
+        with open(path, "rb") as f:
+            data = json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != SOURCE_CACHE_VERSION:
+        return {}
+    return {"targets": data.get("targets"), "files": data.get("files")}
+
+
+def save_source_cache(path: str, cache: dict) -> None:
+    """Atomic write of the source scan cache."""
+    write_atomic(path, json.dumps(
+        {"version": SOURCE_CACHE_VERSION, **cache}, separators=(",", ":"),
+    ))
+
+
+def _search_in_source_files(
+    root: str, ignore_patterns: List[str], deps: DepTable,
+    import_names: List[List[str]], cache: Optional[dict] = None,
+    verbose: bool = False,
+) -> List[List[str]]:
+    """Search source files for import/usage of every dependency at once.
+
+    Each file is read once, and checked against the import names of all
+    dependencies in its ecosystem. Files are independent, so large trees
+    are spread over a process pool (one worker per CPU). Files are handled
+    in batches, in walk order; a dependency with EVIDENCE_CAP import hits
+    is dropped from the search for later batches, and files of an
+    ecosystem with nothing left to search for are not read at all.
+
+    Args:
+        deps: Dependencies to search for.
+        import_names: Possible import names, parallel to deps.
+        cache: If given, a cache from load_source_cache (persisted by the
+               caller). When it was built for the same import names, files
+               whose mtime and size match their entry are not re-read
+               (unless the entry skipped a dependency still searched for).
+               It is updated in place to hold exactly the files scanned.
+        verbose: Report the number of oversized or binary files skipped
+                 on stderr.
+
+    Returns:
+        Evidence list per dependency, parallel to deps, of at most
+        EVIDENCE_CAP entries each.
+    """
+    evidence: List[List[str]] = [[] for _ in range(len(deps))]
+
+    # ecosystem -> [(dep index, import names)]
+    targets: Dict[str, List[Tuple[int, List[str]]]] = {}
+    for i, (ecosystem, names) in enumerate(zip(deps.ecosystems, import_names)):
+        if names:
+            targets.setdefault(ecosystem, []).append((i, names))
+
+    files = _list_source_files(root, ignore_patterns, set(targets))
+
+    # Cached hits are dep indexes, so they only hold for the same targets
+    entries: Dict[str, dict] = {}
+    if cache is not None:
+        signature = {eco: [[i, list(names)] for i, names in t]
+                     for eco, t in targets.items()}
+        if cache.get("targets") == signature and isinstance(cache.get("files"), dict):
+            entries = cache["files"]
+        cache["targets"] = signature
+        cache["files"] = fresh_entries = {}
+
+    stats: Dict[str, os.stat_result] = {}
+    if cache is not None:
+        for fpath, _ in files:
+            try:
+                stats[fpath] = os.stat(fpath)
+            except OSError:
+                pass
+
+    def cached_entry(fpath: str) -> Optional[dict]:
+        st = stats.get(fpath)
+        entry = entries.get(fpath)
+        if (st is not None and entry
+                and entry.get("mtime_ns") == st.st_mtime_ns
+                and entry.get("size") == st.st_size):
+            return entry
+        return None
+
+    workers = os.cpu_count() or 1
+    uncached = sum(1 for fpath, _ in files if cached_entry(fpath) is None)
+    executor = None
+    if uncached >= PARALLEL_MIN_FILES and workers >= 2:
+        executor = ProcessPoolExecutor(max_workers=workers,
+                                       initializer=_init_matchers,
+                                       initargs=(targets,))
+    else:
+        _init_matchers(targets)
+
+    resolved: Set[int] = set()
+    ignored: Set[str] = set()
+    try:
+        for start in range(0, len(files), SCAN_BATCH_FILES):
+            batch = files[start:start + SCAN_BATCH_FILES]
+            skip = frozenset(resolved)
+            skipped_by_eco = {
+                eco: [i for i, _ in t if i in skip] for eco, t in targets.items()
+            }
+
+            hits_by_path: Dict[str, List[int]] = {}
+            todo_paths: List[str] = []
+            todo_ecosystems: List[str] = []
+            for fpath, eco in batch:
+                entry = cached_entry(fpath)
+                if entry is not None and skip.issuperset(entry.get("skipped", ())):
+                    hits_by_path[fpath] = entry["hits"]
+                    fresh_entries[fpath] = entry
+                    if entry.get("ignored"):
+                        ignored.add(fpath)
+                elif len(skipped_by_eco[eco]) == len(targets[eco]):
+                    hits_by_path[fpath] = []  # Nothing left to search for
+                else:
+                    todo_paths.append(fpath)
+                    todo_ecosystems.append(eco)
+
+            skips = [skip] * len(todo_paths)
+            if executor is not None:
+                results = executor.map(_match_source_file, todo_paths,
+                                       todo_ecosystems, skips, chunksize=32)
+            else:
+                results = map(_match_source_file, todo_paths, todo_ecosystems, skips)
+            for fpath, hits in zip(todo_paths, results):
+                if hits is None:
+                    ignored.add(fpath)
+                    hits = []
+                hits_by_path[fpath] = hits
+
+            if cache is not None:
+                for fpath, eco in batch:
+                    st = stats.get(fpath)
+                    if st is not None and fpath not in fresh_entries:
+                        entry = {
+                            "mtime_ns": st.st_mtime_ns,
+                            "size": st.st_size,
+                            "hits": hits_by_path[fpath],
+                        }
+                        if skipped_by_eco[eco]:
+                            entry["skipped"] = skipped_by_eco[eco]
+                        if fpath in ignored:
+                            entry["ignored"] = True
+                        fresh_entries[fpath] = entry
+
+            # Evidence in walk order, whether hits were cached or fresh. The
+            # message is only built for a file some dependency still needs
+            for fpath, _ in batch:
+                hit = None
+                for i in hits_by_path[fpath]:
+                    dep_evidence = evidence[i]
+                    if len(dep_evidence) < EVIDENCE_CAP:
+                        if hit is None:
+                            hit = f"import found in {os.path.relpath(fpath, root)}"
+                        dep_evidence.append(hit)
+                        if len(dep_evidence) == EVIDENCE_CAP:
+                            resolved.add(i)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if verbose:
+        print(f"Skipped {len(ignored)} source files over {MAX_SOURCE_BYTES} "
+              f"bytes or binary", file=sys.stderr)
 
     return evidence
 
 
-def _search_in_scripts_and_ci(root: str, dep_name: str) -> List[str]:
-    """Search for CLI usage of a dependency in scripts, Makefiles, CI configs."""
-    evidence = []
+def _list_dir_files(path: str) -> List[str]:
+    """Paths of the files directly inside path ([] if it isn't a directory).
+
+    Uses the file type from the directory listing, so no per-entry stat.
+    """
+    try:
+        with os.scandir(path) as it:
+            return [entry.path for entry in it if entry.is_file()]
+    except OSError:
+        return []
+
+
+def _script_and_ci_files(root: str, root_files: Set[str]) -> List[str]:
+    """Scripts, Makefiles and CI configs that may invoke a dependency's CLI."""
     search_files = []
 
     # Collect script and config files
@@ -477,43 +1064,24 @@ def _search_in_scripts_and_ci(root: str, dep_name: str) -> List[str]:
     ]:
         if "*" in pattern_path:
             # Glob-like — scan the directory
-            dir_part = os.path.dirname(pattern_path)
+            dir_part, ext = pattern_path.split("*")
             full_dir = os.path.join(root, dir_part)
-            if os.path.isdir(full_dir):
-                for f in os.listdir(full_dir):
-                    ext = os.path.splitext(f)[1]
-                    name_part = os.path.splitext(os.path.basename(pattern_path))[0]
-                    if ext in (".yml", ".yaml"):
-                        search_files.append(os.path.join(full_dir, f))
-        else:
-            full = os.path.join(root, pattern_path)
-            if os.path.isfile(full):
-                search_files.append(full)
+            search_files.extend(
+                path for path in _list_dir_files(full_dir)
+                if os.path.splitext(path)[1] == ext
+            )
+        elif pattern_path in root_files:
+            search_files.append(os.path.join(root, pattern_path))
 
     # Also check scripts/ and bin/ directories
     for script_dir in ["scripts", "bin", "script", "tools"]:
-        sdir = os.path.join(root, script_dir)
-        if os.path.isdir(sdir):
-            for f in os.listdir(sdir):
-                search_files.append(os.path.join(sdir, f))
-
-    for fpath in search_files:
-        try:
-            with open(fpath, "r", encoding="utf-8", errors="replace") as f:
-                content = f.read()
-        except (OSError, IOError):
-            continue
+        search_files.extend(_list_dir_files(os.path.join(root, script_dir)))
 
-        if dep_name in content:
-            rel = os.path.relpath(fpath, root)
-            evidence.append(f"CLI/config reference in {rel}")
+    return search_files
 
-    return evidence
 
-
-def _search_in_config_files(root: str, dep_name: str) -> List[str]:
-    """Search config files for plugin/tool references."""
-    evidence = []
+def _config_files(root: str, root_files: Set[str]) -> List[str]:
+    """Tool config files that may reference a dependency as a plugin."""
     config_files = []
 
     for name in [
@@ -534,20 +1102,50 @@ def _search_in_config_files(root: str, dep_name: str) -> List[str]:
         "pyproject.toml", "setup.cfg", "mypy.ini", ".flake8",
         "pytest.ini", "conftest.py",
     ]:
-        path = os.path.join(root, name)
-        if os.path.isfile(path):
-            config_files.append(path)
-
-    for fpath in config_files:
-        try:
-            with open(fpath, "r", encoding="utf-8", errors="replace") as f:
-                content = f.read()
-        except (OSError, IOError):
-            continue
-
-        if dep_name in content:
-            rel = os.path.relpath(fpath, root)
-            evidence.append(f"config reference in {rel}")
+        if name in root_files:
+            config_files.append(os.path.join(root, name))
+
+    return config_files
+
+
+def _search_in_scripts_and_config(
+    root: str, dep_names: List[str], root_files: Optional[Set[str]] = None
+) -> List[List[str]]:
+    """Search scripts, CI and tool configs for references to every dependency.
+
+    Each file is read once and matched against all dependency names at
+    once, instead of being re-read per dependency.
+
+    Returns:
+        Evidence list per dependency, parallel to dep_names, of at most
+        EVIDENCE_CAP entries each: CLI/config references in scripts and CI
+        first, then config references.
+    """
+    if root_files is None:
+        root_files = _list_root_files(root)
+    evidence: List[List[str]] = [[] for _ in dep_names]
+    match = _build_name_matcher([(i, [name]) for i, name in enumerate(dep_names)])
+
+    hits_by_path: Dict[str, Iterable[int]] = {}
+    for label, paths in (
+        ("CLI/config reference", _script_and_ci_files(root, root_files)),
+        ("config reference", _config_files(root, root_files)),
+    ):
+        for fpath in paths:
+            hits = hits_by_path.get(fpath)
+            if hits is None:
+                try:
+                    with open(fpath, "rb") as f:
+                        hits = match(f.read())
+                except OSError:
+                    hits = ()
+                hits_by_path[fpath] = hits
+            reference = None
+            for i in hits:
+                if len(evidence[i]) < EVIDENCE_CAP:
+                    if reference is None:
+                        reference = f"{label} in {os.path.relpath(fpath, root)}"
+                    evidence[i].append(reference)
 
     return evidence
 
@@ -557,7 +1155,7 @@ def _search_in_config_files(root: str, dep_name: str) -> List[str]:
 # ---------------------------------------------------------------------------
 
 
-def classify_dependency(dep: dict, evidence: List[str]) -> str:
+def classify_dependency(evidence: List[str]) -> str:
     """Classify a dependency as used, unused, or uncertain."""
     if not evidence:
         return "unused"
@@ -577,51 +1175,60 @@ def classify_dependency(dep: dict, evidence: List[str]) -> str:
 # ---------------------------------------------------------------------------
 
 
-def analyze(root: str, ignore_file: Optional[str] = None) -> dict:
-    """Run full unused dependency analysis."""
-    patterns = load_ignore_patterns(ignore_file)
-
-    # Discover dependencies
-    all_deps = discover_manifests(root)
+def analyze(
+    root: str,
+    ignore_file: Optional[str] = None,
+    cache_file: Optional[str] = None,
+    verbose: bool = False,
+) -> dict:
+    """Run full unused dependency analysis.
 
-    # Deduplicate by name+ecosystem
-    seen: Set[Tuple[str, str]] = set()
-    unique_deps = []
-    for dep in all_deps:
-        key = (dep["name"].lower(), dep["ecosystem"])
-        if key not in seen:
-            seen.add(key)
-            unique_deps.append(dep)
-
-    # Analyze each dependency
-    results = []
-    for dep in unique_deps:
-        import_names = _get_import_names(dep)
+    If ``cache_file`` is given, per-file source scan results are cached
+    there between runs so only changed files are re-read. ``verbose``
+    reports skipped source files on stderr.
+    """
+    patterns = load_ignore_patterns(ignore_file)
 
-        evidence = []
+    # One directory read answers every "does <root>/<name> exist" check
+    root_files = _list_root_files(root)
 
-        # Search source files for imports
-        if import_names:
-            evidence.extend(
-                _search_in_source_files(root, patterns, import_names, dep["ecosystem"])
-            )
+    # Discover dependencies, deduplicated by name+ecosystem
+    deps = discover_manifests(root, root_files).unique()
 
-        # Search scripts and CI for CLI usage
-        evidence.extend(_search_in_scripts_and_ci(root, dep["name"]))
+    # Search source files for imports of all dependencies in one pass
+    all_import_names = [
+        _get_import_names(name, ecosystem)
+        for name, ecosystem in zip(deps.names, deps.ecosystems)
+    ]
+    cache = load_source_cache(cache_file) if cache_file else None
+    source_evidence = _search_in_source_files(
+        root, patterns, deps, all_import_names, cache, verbose
+    )
+    if cache_file:
+        save_source_cache(cache_file, cache)
 
-        # Search config files for plugin/tool references
-        evidence.extend(_search_in_config_files(root, dep["name"]))
+    # Search scripts, CI and config files for CLI usage and plugin/tool
+    # references, also in one pass
+    tool_evidence = _search_in_scripts_and_config(
+        root, deps.names, root_files
+    )
 
-        classification = classify_dependency(dep, evidence)
+    # Analyze each dependency
+    results = []
+    for i, (import_names, evidence, references) in enumerate(zip(
+        all_import_names, source_evidence, tool_evidence
+    )):
+        evidence.extend(references)
+        classification = classify_dependency(evidence)
 
         results.append({
-            "name": dep["name"],
-            "ecosystem": dep["ecosystem"],
-            "manifest": dep["manifest"],
-            "is_dev": dep["is_dev"],
+            "name": deps.names[i],
+            "ecosystem": deps.ecosystems[i],
+            "manifest": deps.manifests[i],
+            "is_dev": deps.is_devs[i],
             "classification": classification,
             "import_names_checked": import_names,
-            "evidence": evidence[:10],  # Cap evidence to keep output manageable
+            "evidence": evidence[:EVIDENCE_CAP],  # Keep output manageable
         })
 
     # Summary
@@ -651,6 +1258,18 @@ def main() -> None:
     parser.add_argument(
         "--ignore-file", default=None, help="Path to .health-ignore file"
     )
+    parser.add_argument(
+        "--cache-file", default=None,
+        help="Path to source scan cache (default: "
+             ".health-scan/unused-deps-cache.json when .health-scan/ exists)"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Re-read every source file"
+    )
+    parser.add_argument(
+        "--verbose", action="store_true",
+        help="Report how many oversized or binary source files were skipped"
+    )
     args = parser.parse_args()
 
     root = os.path.abspath(args.root)
@@ -664,12 +1283,17 @@ def main() -> None:
         if os.path.isfile(default_ignore):
             args.ignore_file = default_ignore
 
-    result = analyze(root, args.ignore_file)
+    # Cache source scan results alongside other scan state, if the workspace exists
+    cache_file = None
+    if not args.no_cache:
+        if args.cache_file is not None:
+            cache_file = os.path.abspath(args.cache_file)
+        elif os.path.isdir(os.path.join(root, ".health-scan")):
+            cache_file = os.path.join(root, ".health-scan", "unused-deps-cache.json")
+
+    result = analyze(root, args.ignore_file, cache_file, args.verbose)
 
-    output_path = os.path.abspath(args.output)
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=2)
+    write_atomic(os.path.abspath(args.output), dump_json_bytes(result))
 
     # Print summary to stderr
     s = result["summary"]["by_classification"]
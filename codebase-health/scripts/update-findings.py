@@ -6,6 +6,9 @@ Two modes of operation:
 Batch mode (merge subagent results):
     python3 update-findings.py --findings <path> --batch <path>
 
+Stream mode (many updates from stdin, one {id, implementation} per line):
+    python3 update-findings.py --findings <path> --stdin-jsonl < updates.ndjson
+
 Single mode (per-finding update):
     python3 update-findings.py --findings <path> --id F001 --status applied \
         --change-description "..." --files-modified a.py,b.py \
@@ -14,7 +17,9 @@ Single mode (per-finding update):
     python3 update-findings.py --findings <path> --id F001 --status rolled-back \
         --failure-reason "Test failed after removing function"
 
-Atomic writes via temp file + os.replace(). Zero external dependencies.
+Atomic writes via fsynced temp file + os.replace(). Zero required dependencies;
+orjson is used for faster JSON serialization when installed
+(see lib/jsonio.py).
 """
 
 import argparse
@@ -22,6 +27,12 @@ import json
 import os
 import sys
 
+# Add parent directory to path for lib imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from lib.fileio import write_atomic
+from lib.jsonio import dump_json_bytes
+
 
 def load_findings(path):
     """Load and return the findings JSON."""
@@ -30,12 +41,8 @@ def load_findings(path):
 
 
 def save_findings(path, data):
-    """Atomic write: write to .tmp then replace."""
-    tmp = path + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write("\n")
-    os.replace(tmp, path)
+    """Atomic write via lib.fileio.write_atomic()."""
+    write_atomic(path, dump_json_bytes(data))
 
 
 def build_implementation(args):
@@ -87,6 +94,43 @@ def apply_batch(data, batch):
     return updated, missing
 
 
+def load_batch(path):
+    """Load a batch results JSON file ([{id, implementation}, ...])."""
+    batch_path = os.path.abspath(path)
+    if not os.path.isfile(batch_path):
+        print(f"Error: batch file not found: {batch_path}", file=sys.stderr)
+        sys.exit(1)
+    try:
+        with open(batch_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (json.JSONDecodeError, OSError) as e:
+        print(f"Error: failed to load batch file: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def read_jsonl_updates(stream):
+    """Read {id, implementation} objects, one per line, from stream.
+
+    Blank lines are skipped; exits with an error naming the line if one
+    isn't a JSON object.
+    """
+    batch = []
+    for lineno, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError as e:
+            print(f"Error: stdin line {lineno}: invalid JSON: {e}", file=sys.stderr)
+            sys.exit(1)
+        if not isinstance(entry, dict):
+            print(f"Error: stdin line {lineno}: expected a JSON object",
+                  file=sys.stderr)
+            sys.exit(1)
+        batch.append(entry)
+    return batch
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Update implementation fields in health-scan-findings.json"
@@ -100,6 +144,11 @@ def main():
         "--batch", default=None,
         help="Path to batch results JSON ([{id, implementation}, ...])"
     )
+    parser.add_argument(
+        "--stdin-jsonl", action="store_true", default=False,
+        help="Read {id, implementation} updates from stdin, one JSON object "
+             "per line, and save once"
+    )
 
     # Single mode
     parser.add_argument("--id", default=None, help="Finding ID (e.g. F001)")
@@ -127,13 +176,19 @@ def main():
     args = parser.parse_args()
 
     # Validate mode
-    if args.batch and args.id:
-        print("Error: --batch and --id are mutually exclusive", file=sys.stderr)
-        sys.exit(1)
-    if not args.batch and not args.id:
-        print("Error: specify either --batch <path> or --id <ID> --status <status>",
+    modes = [flag for flag, value in (
+        ("--batch", args.batch),
+        ("--stdin-jsonl", args.stdin_jsonl),
+        ("--id", args.id),
+    ) if value]
+    if len(modes) > 1:
+        print(f"Error: {' and '.join(modes)} are mutually exclusive",
               file=sys.stderr)
         sys.exit(1)
+    if not modes:
+        print("Error: specify either --batch <path>, --stdin-jsonl or "
+              "--id <ID> --status <status>", file=sys.stderr)
+        sys.exit(1)
     if args.id and not args.status:
         print("Error: --status is required with --id", file=sys.stderr)
         sys.exit(1)
@@ -150,18 +205,12 @@ def main():
         print(f"Error: failed to load findings: {e}", file=sys.stderr)
         sys.exit(1)
 
-    if args.batch:
-        # Batch mode
-        batch_path = os.path.abspath(args.batch)
-        if not os.path.isfile(batch_path):
-            print(f"Error: batch file not found: {batch_path}", file=sys.stderr)
-            sys.exit(1)
-        try:
-            with open(batch_path, "r", encoding="utf-8") as f:
-                batch = json.load(f)
-        except (json.JSONDecodeError, OSError) as e:
-            print(f"Error: failed to load batch file: {e}", file=sys.stderr)
-            sys.exit(1)
+    if args.batch or args.stdin_jsonl:
+        # Batch mode (from a file or stdin)
+        if args.stdin_jsonl:
+            batch = read_jsonl_updates(sys.stdin)
+        else:
+            batch = load_batch(args.batch)
 
         updated, missing = apply_batch(data, batch)
         if missing:
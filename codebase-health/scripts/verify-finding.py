@@ -28,7 +28,11 @@ Batch mode (merge subagent results into main findings file):
         --findings <health-scan-findings.json> \
         --batch <scan-logs/verify-orphaned-code.json>
 
-Atomic writes via temp file + os.replace(). Zero external dependencies.
+Atomic writes via fsynced temp file + os.replace(). Zero required
+dependencies; orjson is used for faster JSON parsing and serialization
+when installed (see lib/jsonio.py), and with ijson installed batch mode
+streams the findings file one finding at a time instead of loading it
+whole.
 """
 
 import argparse
@@ -36,14 +40,26 @@ import json
 import os
 import sys
 
+
+try:
+    import ijson  # Optional; batch mode streams the findings file with it
+except ImportError:
+    ijson = None
+
+# Add parent directory to path for lib imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from lib.fileio import atomic_writer, write_atomic
+from lib.jsonio import dump_json_bytes, loads
+
 VALID_SAFETY = ["safe-to-fix", "needs-review", "do-not-touch"]
 VALID_TEST_COVERAGE = ["covered", "partial", "none"]
 
 
 def load_json(path):
     """Load a JSON file."""
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return loads(f.read())
 
 
 def load_array(path):
@@ -57,14 +73,18 @@ def load_array(path):
     return data
 
 
+def load_findings(path):
+    """load_json() the findings file, exiting with an error if it fails."""
+    try:
+        return load_json(path)
+    except (json.JSONDecodeError, OSError) as e:
+        print(f"Error: failed to load findings: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
 def save_json(path, data):
     """Atomic write JSON."""
-    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
-    tmp = path + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write("\n")
-    os.replace(tmp, path)
+    write_atomic(path, dump_json_bytes(data))
 
 
 def build_verification(args):
@@ -96,21 +116,140 @@ def apply_single(data, finding_id, verification):
 
 def apply_batch(data, batch):
     """Apply a batch of verification results. Returns (updated_count, missing_ids)."""
-    findings_by_id = {f["id"]: f for f in data.get("findings", [])}
+    findings_by_id = {f["id"]: f for f in data.get("findings") or ()}
+    get_finding = findings_by_id.get
 
     updated = 0
     missing = []
     for entry in batch:
         fid = entry.get("id")
-        verification = entry.get("verification")
         if not fid:
             print("Warning: batch entry missing 'id', skipping", file=sys.stderr)
             continue
-        if fid in findings_by_id:
-            findings_by_id[fid]["verification"] = verification
+        finding = get_finding(fid)
+        if finding is None:
+            missing.append(fid)
+        else:
+            finding["verification"] = entry.get("verification")
+            updated += 1
+
+    return updated, missing
+
+
+def load_batch(path):
+    """Load a batch results JSON array ([{id, verification}, ...])."""
+    batch_path = os.path.abspath(path)
+    if not os.path.isfile(batch_path):
+        print(f"Error: batch file not found: {batch_path}",
+              file=sys.stderr)
+        sys.exit(1)
+    try:
+        batch = load_json(batch_path)
+    except (json.JSONDecodeError, OSError) as e:
+        print(f"Error: failed to load batch file: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if not isinstance(batch, list):
+        print(f"Error: batch file must contain a JSON array",
+              file=sys.stderr)
+        sys.exit(1)
+    return batch
+
+
+def _dump_nested(value, indent):
+    """Serialize value as dump_json_bytes() would at the given nesting indent."""
+    return dump_json_bytes(value)[:-1].replace(b"\n", b"\n" + indent)
+
+
+def _build_value(event, value, events):
+    """Assemble the JSON value starting at (event, value) from ijson events."""
+    builder = ijson.ObjectBuilder()
+    depth = 0
+    while True:
+        builder.event(event, value)
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+        if depth == 0:
+            return builder.value
+        _, event, value = next(events)
+
+
+def stream_apply_batch(findings_path, batch):
+    """Apply a batch like apply_batch(), streaming the findings file.
+
+    The file is read twice with ijson: once to see which IDs exist, then
+    again to copy it to a temp file finding by finding, patching matches.
+    Only one finding is held in memory at a time, and the output is the
+    same as loading, apply_batch() and save_json(). Returns
+    (updated_count, missing_ids). Raises ijson.JSONError, leaving the
+    findings file as it was, if it can't be parsed or a findings entry
+    isn't an object.
+    """
+    # Pass 1: the position of each ID (the last one wins, as in apply_batch)
+    last_index = {}
+    with open(findings_path, "rb") as f:
+        index = -1
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix == "findings.item" and event != "end_map":
+                if event != "start_map":
+                    # Pass 2 counts every element; bail out rather than
+                    # patch the wrong finding
+                    raise ijson.JSONError("findings entry is not a JSON object")
+                index += 1
+            elif prefix == "findings.item.id" and event not in (
+                    "start_map", "start_array"):
+                last_index[value] = index
+
+    patch = {}
+    updated = 0
+    missing = []
+    for entry in batch:
+        fid = entry.get("id")
+        if not fid:
+            print("Warning: batch entry missing 'id', skipping", file=sys.stderr)
+            continue
+        if fid in last_index:
+            patch[last_index[fid]] = entry.get("verification")
             updated += 1
         else:
             missing.append(fid)
+    if not updated:
+        return updated, missing  # Nothing to patch; leave the file alone
+
+    # Pass 2: copy through, re-serialized to match save_json() byte for byte
+    with open(findings_path, "rb") as src, atomic_writer(findings_path) as out:
+        events = ijson.parse(src, use_float=True)
+        _, event, value = next(events)
+        if event != "start_map":
+            raise ijson.JSONError("findings file is not a JSON object")
+        out.write(b"{")
+        members = 0
+        for _, event, key in events:
+            if event == "end_map":
+                break
+            out.write(b"\n  " if members == 0 else b",\n  ")
+            out.write(_dump_nested(key, b"  ") + b": ")
+            members += 1
+            _, event, value = next(events)
+            if key != "findings" or event != "start_array":
+                out.write(_dump_nested(_build_value(event, value, events),
+                                       b"  "))
+                continue
+            out.write(b"[")
+            index = -1
+            for _, event, value in events:
+                if event == "end_array":
+                    break
+                index += 1
+                finding = _build_value(event, value, events)
+                if index in patch:
+                    finding["verification"] = patch[index]
+                out.write(b"\n    " if index == 0 else b",\n    ")
+                out.write(_dump_nested(finding, b"    "))
+            out.write(b"\n  ]" if index >= 0 else b"]")
+        out.write(b"\n}\n" if members else b"}\n")
 
     return updated, missing
 
@@ -194,31 +333,29 @@ def main():
               file=sys.stderr)
         sys.exit(1)
 
-    try:
-        data = load_json(findings_path)
-    except (json.JSONDecodeError, OSError) as e:
-        print(f"Error: failed to load findings: {e}", file=sys.stderr)
-        sys.exit(1)
+    # Batch mode streams the findings file when ijson is available
+    data = None
+    if not (args.batch and ijson is not None):
+        data = load_findings(findings_path)
 
     if args.batch:
         # ── Batch mode: --findings + --batch ──
-        batch_path = os.path.abspath(args.batch)
-        if not os.path.isfile(batch_path):
-            print(f"Error: batch file not found: {batch_path}",
-                  file=sys.stderr)
-            sys.exit(1)
-        try:
-            batch = load_json(batch_path)
-        except (json.JSONDecodeError, OSError) as e:
-            print(f"Error: failed to load batch file: {e}", file=sys.stderr)
-            sys.exit(1)
-
-        if not isinstance(batch, list):
-            print(f"Error: batch file must contain a JSON array",
-                  file=sys.stderr)
-            sys.exit(1)
-
-        updated, missing = apply_batch(data, batch)
+        batch = load_batch(args.batch)
+        if data is None:
+            try:
+                updated, missing = stream_apply_batch(findings_path, batch)
+            except ijson.JSONError:
+                # Some ijson backends reject JSON that json accepts (yajl2_c
+                # overflows on integers of 64 bits or more). The file is
+                # left untouched, so load it whole instead.
+                data = load_findings(findings_path)
+            except OSError as e:
+                if e.filename != findings_path:
+                    raise  # Writing the result failed, not reading the file
+                print(f"Error: failed to load findings: {e}", file=sys.stderr)
+                sys.exit(1)
+        if data is not None:
+            updated, missing = apply_batch(data, batch)
         if missing:
             print(f"Warning: {len(missing)} IDs not found: {', '.join(missing)}",
                   file=sys.stderr)
@@ -235,8 +372,8 @@ def main():
             sys.exit(1)
 
         verification = build_verification(args)
-        found = apply_single(data, args.id, verification)
-        if not found:
+        updated = apply_single(data, args.id, verification)
+        if not updated:
             print(f"Warning: finding {args.id} not found in {findings_path}",
                   file=sys.stderr)
             print("Updated 0 verifications (1 not found)", file=sys.stderr)
@@ -244,7 +381,9 @@ def main():
             print(f"Updated verification for {args.id} ({args.safety})",
                   file=sys.stderr)
 
-    save_json(findings_path, data)
+    # No matching IDs means nothing changed; skip rewriting the file
+    if data is not None and updated:
+        save_json(findings_path, data)
 
 
 if __name__ == "__main__":
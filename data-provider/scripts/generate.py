@@ -9,76 +9,51 @@ Usage:
     python scripts/field_mapper/generate.py
     python scripts/field_mapper/generate.py --work-dir .mg/data-provider --model opus
     python scripts/field_mapper/generate.py --dry-run
+    python scripts/field_mapper/generate.py --archive tasks.tar
 """
 
 import argparse
+import functools
+import io
+import mmap
+import os
 import re
 import sys
+import tarfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import NamedTuple
 
 DEFAULT_WORK_DIR = ".mg/data-provider"
 
+# Threads writing task files; each write is a few small syscalls, so
+# overlapping them matters more than CPU count
+WRITE_WORKERS = 8
 
-def slugify(name: str) -> str:
-    """Convert a display name to a kebab-case slug."""
-    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
-
-
-def parse_fields(field_ref_path: Path) -> list[dict]:
-    """Parse the field reference markdown to extract field definitions.
+# Rows of both field reference tables, matched in one pass over the raw
+# UTF-8 bytes (\r? because the file isn't newline-translated):
+#   fields:        | # | `Field Name` | Definition |        -> groups 1-3
+#   substitutions: | `Field Name` (#N) | Raw Inputs Needed | -> groups 4-6
+_ROW_RE = re.compile(
+    rb"^\|\s*(?:"
+    rb"(\d+)\s*\|\s*`([^`]+)`\s*\|\s*(.+?)"
+    rb"|`([^`]+)`\s*\(#(\d+)\)\s*\|\s*(.+?)"
+    rb")\s*\|\r?$",
+    re.MULTILINE,
+)
 
-    Returns a list of dicts with keys: number, name, definition, derivation_inputs.
-    """
-    content = field_ref_path.read_text()
-
-    # Parse the fields table rows: | # | `Field Name` | Definition |
-    field_pattern = re.compile(
-        r"^\|\s*(\d+)\s*\|\s*`([^`]+)`\s*\|\s*(.+?)\s*\|$", re.MULTILINE
-    )
-    fields = []
-    for match in field_pattern.finditer(content):
-        fields.append(
-            {
-                "number": int(match.group(1)),
-                "name": match.group(2),
-                "definition": match.group(3).strip(),
-                "derivation_inputs": "",
-            }
-        )
-
-    # Parse the substitutions table: | `Field Name` (#N) | Raw Inputs Needed |
-    sub_pattern = re.compile(
-        r"^\|\s*`([^`]+)`\s*\(#(\d+)\)\s*\|\s*(.+?)\s*\|$", re.MULTILINE
-    )
-    sub_map = {}
-    for match in sub_pattern.finditer(content):
-        sub_map[int(match.group(2))] = match.group(3).strip()
-
-    for field in fields:
-        field["derivation_inputs"] = sub_map.get(field["number"], "")
-
-    return fields
-
-
-def parse_providers(providers_path: Path) -> list[str]:
-    """Read provider names from providers.txt (one per line, skip blanks)."""
-    lines = providers_path.read_text().splitlines()
-    return [line.strip() for line in lines if line.strip()]
 
-
-def generate_task_file(
-    field: dict, provider_name: str, provider_slug: str, model: str
-) -> str:
-    """Generate the markdown content for a single task file."""
-    return f"""# Task: {field['name']} → {provider_name}
+# Task file body, filled by generate_task_file()
+_TASK_TEMPLATE = """# Task: {name} → {provider}
 
 ## Config
-field_number: {field['number']}
-field_name: {field['name']}
+field_number: {number}
+field_name: {name}
 field_definition: >
-  {field['definition']}
-derivation_inputs: {field['derivation_inputs']}
-provider: {provider_name}
+  {definition}
+derivation_inputs: {derivation_inputs}
+provider: {provider}
 provider_slug: {provider_slug}
 model: {model}
 status: pending
@@ -110,6 +85,132 @@ rejection_reason:
 """
 
 
+class _SlugTable(dict):
+    """str.translate table: keeps a-z and 0-9, maps everything else to "-"."""
+
+    def __missing__(self, codepoint):
+        return "-"
+
+
+_SLUG_TABLE = _SlugTable(
+    (ord(c), c) for c in "abcdefghijklmnopqrstuvwxyz0123456789"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def slugify(name: str) -> str:
+    """Convert a display name to a kebab-case slug."""
+    # Splitting on "-" and dropping empty parts collapses runs and trims ends
+    return "-".join(filter(None, name.lower().translate(_SLUG_TABLE).split("-")))
+
+
+def _iter_rows(path: Path):
+    """Yield _ROW_RE matches over path, scanned through a read-only mmap."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return  # mmap can't map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            yield from _ROW_RE.finditer(content)
+
+
+class Field(NamedTuple):
+    """One row of the field reference, with its derivation inputs."""
+
+    number: int
+    name: str
+    definition: str
+    derivation_inputs: str = ""
+
+
+def parse_fields(field_ref_path: Path) -> list[Field]:
+    """Parse the field reference markdown to extract field definitions.
+
+    Returns a list of Field tuples (number, name, definition, derivation_inputs).
+    """
+    rows = []
+    sub_map = {}
+    # Only the captured cells are decoded, never the whole file
+    for match in _iter_rows(field_ref_path):
+        if match.group(1) is not None:
+            rows.append(
+                (
+                    int(match.group(1)),
+                    match.group(2).decode("utf-8"),
+                    match.group(3).decode("utf-8").strip(),
+                )
+            )
+        else:
+            sub_map[int(match.group(5))] = match.group(6).decode("utf-8").strip()
+
+    return [
+        Field(number, name, definition, sub_map.get(number, ""))
+        for number, name, definition in rows
+    ]
+
+
+def parse_providers(providers_path: Path) -> list[str]:
+    """Read provider names from providers.txt (one per line, skip blanks)."""
+    lines = providers_path.read_text().splitlines()
+    return [line.strip() for line in lines if line.strip()]
+
+
+def generate_task_file(
+    field: Field, provider_name: str, provider_slug: str, model: str
+) -> str:
+    """Generate the markdown content for a single task file."""
+    return _TASK_TEMPLATE.format_map(
+        {
+            "name": field.name,
+            "number": field.number,
+            "definition": field.definition,
+            "derivation_inputs": field.derivation_inputs,
+            "provider": provider_name,
+            "provider_slug": provider_slug,
+            "model": model,
+        }
+    )
+
+
+def write_file(path: str, data: bytes) -> None:
+    """Create or truncate path and write data with raw os.open/os.write."""
+    # 0o666 leaves permissions to the umask, as Path.write_text() did
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def write_task_files(jobs: list[tuple[str, bytes]]) -> None:
+    """Write (path, content) pairs, overlapping the file syscalls across threads."""
+    with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+        # list() drains the results so a failed write raises here
+        list(executor.map(lambda job: write_file(*job), jobs))
+
+
+def archive_members(archive: Path) -> set[str]:
+    """Names already in the tar at archive (empty if it doesn't exist yet)."""
+    if not archive.exists():
+        return set()
+    with tarfile.open(archive) as tf:
+        return set(tf.getnames())
+
+
+def write_task_archive(archive: Path, jobs: list[tuple[str, bytes]]) -> None:
+    """Append (member name, content) pairs to an uncompressed tar in one pass."""
+    archive.parent.mkdir(parents=True, exist_ok=True)
+    mtime = time.time()
+    with tarfile.open(archive, "a") as tf:  # "a" creates it if missing
+        for name, data in jobs:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = mtime
+            info.mode = 0o644
+            tf.addfile(info, io.BytesIO(data))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate field-mapping task files for provider research."
@@ -131,6 +232,13 @@ def main():
         action="store_true",
         help="Print what would be created without writing files",
     )
+    parser.add_argument(
+        "--archive",
+        type=Path,
+        default=None,
+        help="Add task files to this uncompressed tar (created if missing) "
+        "instead of writing them to the tasks/ folder",
+    )
 
     args = parser.parse_args()
 
@@ -147,8 +255,6 @@ def main():
         print(f"Error: Provider list not found: {providers_file}", file=sys.stderr)
         sys.exit(1)
 
-    tasks_dir.mkdir(parents=True, exist_ok=True)
-
     fields = parse_fields(field_ref)
     if not fields:
         print("Error: No fields parsed from field reference.", file=sys.stderr)
@@ -159,35 +265,59 @@ def main():
         print("Error: No providers found in providers.txt.", file=sys.stderr)
         sys.exit(1)
 
-    created = 0
-    skipped = 0
-
+    if args.archive:
+        existing = archive_members(args.archive)
+    else:
+        tasks_dir.mkdir(parents=True, exist_ok=True)
+        # One directory listing instead of a stat per task file
+        with os.scandir(tasks_dir) as entries:
+            existing = {entry.name for entry in entries}
+
+    # Pass 1: every (filename, field, provider) combination, in output order
+    provider_pairs = [(name, slugify(name)) for name in providers]
+    plan = []
     for field in fields:
-        field_slug = slugify(field["name"])
-        for provider_name in providers:
-            provider_slug = slugify(provider_name)
-            filename = f"field-{field['number']:02d}-{field_slug}--{provider_slug}.md"
-            filepath = tasks_dir / filename
-
-            if args.dry_run:
-                exists = filepath.exists()
-                tag = "EXISTS" if exists else "CREATE"
-                print(f"  [{tag}] {filename}")
-                if exists:
-                    skipped += 1
-                else:
-                    created += 1
-                continue
+        prefix = f"field-{field.number:02d}-{slugify(field.name)}--"
+        for provider_name, provider_slug in provider_pairs:
+            plan.append(
+                (f"{prefix}{provider_slug}.md", field, provider_name, provider_slug)
+            )
 
-            if filepath.exists():
+    # Pass 2: report or create
+    if args.dry_run:
+        tags = []
+        skipped = 0
+        for filename, *_ in plan:
+            if filename in existing:
+                tags.append(f"  [EXISTS] {filename}")
                 skipped += 1
+            else:
+                tags.append(f"  [CREATE] {filename}")
+        print("\n".join(tags))
+        created = len(plan) - skipped
+    else:
+        jobs = []  # (filename, content) of files to create
+        for filename, field, provider_name, provider_slug in plan:
+            if filename in existing:
                 continue
-
+            # Added so a repeated provider slug is skipped
+            existing.add(filename)
             content = generate_task_file(
                 field, provider_name, provider_slug, args.model
             )
-            filepath.write_text(content)
-            created += 1
+            jobs.append((filename, content.encode("utf-8")))
+        if args.archive:
+            if jobs:
+                write_task_archive(args.archive, jobs)
+        else:
+            # Plain strings here: no Path object per task file
+            tasks_dir_str = os.fspath(tasks_dir)
+            join = os.path.join
+            write_task_files(
+                [(join(tasks_dir_str, name), data) for name, data in jobs]
+            )
+        created = len(jobs)
+        skipped = len(plan) - created
 
     total = len(fields) * len(providers)
     print(f"Fields: {len(fields)}, Providers: {len(providers)}, Total: {total}")
@@ -50,12 +50,67 @@ Usage:
 
 import argparse
 import json
+import os
 import re
+import shutil
 import sys
 from pathlib import Path
+from typing import Optional
+
+try:
+    import orjson  # Optional; read/list JSON output is identical without it
+except ImportError:
+    orjson = None
 
 DEFAULT_WORK_DIR = ".mg/data-provider"
 
+# Index of the Config values `list` shows, kept in the tasks directory;
+# entries are trusted only while the file's mtime and size still match
+INDEX_FILENAME = ".index.json"
+INDEX_VERSION = 1
+_INDEX_KEYS = ("field_number", "field_name", "provider", "status", "iterations")
+_INDEX_DEFAULTS = ("?", "?", "?", "unknown", "0")
+
+# Task file line shapes (used by update_field_in_file)
+_SECTION_RE = re.compile(r"^## (.+)$")  # ## Config
+_INDENT_UPDATE_RE = re.compile(r"^(  )(\w[\w_]*): ?(.*)$")
+_KV_RE = re.compile(r"^(\w[\w_]*): ?(.*)$")  # status: pending
+
+
+def _split_kv(text: str) -> Optional[tuple[str, str]]:
+    """Split "key: value" into (key, stripped value), or None if not a pair.
+
+    Same rule as _KV_RE: the key is one or more word characters (letters,
+    digits, underscore) directly before the colon.
+    """
+    key, sep, val = text.partition(":")
+    if sep and key.replace("_", "a").isalnum():
+        return key, val.strip()
+    return None
+
+
+def _dumps(data) -> str:
+    """Serialize to 2-space-indented JSON, non-ASCII characters kept as-is."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def list_task_files(tasks_dir: Path) -> list[Path]:
+    """Task files (field-*.md) in tasks_dir, sorted by name.
+
+    One os.scandir() pass with plain str tests, instead of Path.glob()'s
+    pattern matching.
+    """
+    with os.scandir(tasks_dir) as entries:
+        files = [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.startswith("field-") and entry.name.endswith(".md")
+        ]
+    files.sort(key=lambda p: p.name)
+    return files
+
 
 def parse_task_file(filepath: Path) -> dict[str, dict[str, str]]:
     """Parse a task file into sections with key-value pairs.
@@ -63,16 +118,38 @@ def parse_task_file(filepath: Path) -> dict[str, dict[str, str]]:
     Returns a dict of sections, each containing key-value pairs.
     Handles multiline values (lines starting with '>') and indented sub-keys.
     """
-    content = filepath.read_text()
+    return _parse_lines(filepath.read_text().splitlines())
+
+
+def parse_task_config_only(filepath: Path) -> dict[str, dict[str, str]]:
+    """Parse a task file up to the end of its Config section.
+
+    Same result for Config as parse_task_file(), but reading stops at the
+    section header that follows Config, so the Research and Verification
+    bodies are never read.
+    """
+    with open(filepath) as f:
+        return _parse_lines(_iter_lines(f), stop_after="Config")
+
+
+def _parse_lines(
+    lines, stop_after: Optional[str] = None
+) -> dict[str, dict[str, str]]:
+    """Parse task file lines into sections (see parse_task_file).
+
+    With stop_after, return at the first section header after that
+    section has been parsed.
+    """
     sections: dict[str, dict[str, str]] = {}
     current_section = ""
     current_key = ""
 
-    for line in content.splitlines():
+    for line in lines:
         # Section header: ## Config, ## Research, ## Verification
-        section_match = re.match(r"^## (.+)$", line)
-        if section_match:
-            current_section = section_match.group(1).strip()
+        if line.startswith("## ") and len(line) > 3:
+            if stop_after in sections:
+                break
+            current_section = line[3:].strip()
             sections[current_section] = {}
             current_key = ""
             continue
@@ -85,19 +162,17 @@ def parse_task_file(filepath: Path) -> dict[str, dict[str, str]]:
             continue
 
         # Indented sub-key (e.g., "  endpoint_exists: true" under checks:)
-        indent_match = re.match(r"^  (\w[\w_]*): ?(.*)$", line)
-        if indent_match:
-            sub_key = indent_match.group(1)
-            sub_val = indent_match.group(2).strip()
+        pair = _split_kv(line[2:]) if line.startswith("  ") else None
+        if pair:
+            sub_key, sub_val = pair
             sections[current_section][sub_key] = sub_val
             current_key = sub_key
             continue
 
         # Top-level key-value
-        kv_match = re.match(r"^(\w[\w_]*): ?(.*)$", line)
-        if kv_match:
-            key = kv_match.group(1)
-            val = kv_match.group(2).strip()
+        pair = _split_kv(line)
+        if pair:
+            key, val = pair
             # Handle multiline indicator '>'
             if val == ">":
                 val = ""
@@ -117,60 +192,241 @@ def parse_task_file(filepath: Path) -> dict[str, dict[str, str]]:
     return sections
 
 
-def update_field_in_file(filepath: Path, section: str, key: str, value: str) -> None:
-    """Update a single key-value pair in a task file, preserving structure."""
-    lines = filepath.read_text().splitlines()
-    in_section = False
+def _read_config_value(filepath: Path, key: str, default: str = "") -> str:
+    """Read one key from a task file's Config section, or default if absent.
+
+    Scans the Config lines for "key:" without building the section dict.
+    Matches parse_task_file() for single-line values (the last occurrence
+    wins, indented or not, and a bare '>' reads as "").
+    """
+    prefix = f"{key}:"
+    value = default
+    in_config = False
+    with open(filepath) as f:
+        for line in _iter_lines(f):
+            if line.startswith("## ") and len(line) > 3:
+                if in_config:
+                    break  # Config is over
+                in_config = line[3:].strip() == "Config"
+                continue
+            if not in_config:
+                continue
+            text = line[2:] if line.startswith("  ") else line
+            if text.startswith(prefix):
+                value = text[len(prefix):].strip()
+                if value == ">":
+                    value = ""
+    return value
+
+
+def _iter_lines(f):
+    """Yield the lines of text file f as str.splitlines() would split them."""
+    for raw in f:
+        # raw keeps its line break, so a blank line still yields ""
+        yield from raw.splitlines()
+
+
+def _apply_updates(
+    lines, remaining: dict[str, dict[str, str]], changed: set[tuple[str, str]]
+):
+    """Yield lines with the {section: {key: value}} updates applied.
+
+    Each key is popped from remaining as it is applied, so what is left
+    afterwards was not found. (section, key) is added to changed when
+    applying it actually altered the text, so an empty changed means the
+    output is the input.
+    """
+    pending: dict[str, str] = {}  # Keys still to update in the current section
+    section = ""
     in_checks = False
-    updated = False
+    skip_continuation = False
+    skip_key = ("", "")  # (section, key) whose continuation lines are skipped
+
+    for line in lines:
+        # Drop the continuation lines of a replaced multiline ('>') value
+        if skip_continuation:
+            if line.startswith("  "):
+                changed.add(skip_key)
+                continue
+            skip_continuation = False
+
+        # Cheap str tests first: most lines are blank or can't match a regex
+        if not line:
+            yield line
+            continue
 
-    for i, line in enumerate(lines):
-        section_match = re.match(r"^## (.+)$", line)
+        section_match = _SECTION_RE.match(line) if line.startswith("## ") else None
         if section_match:
-            in_section = section_match.group(1).strip() == section
+            section = section_match.group(1).strip()
+            pending = remaining.get(section, {})
             in_checks = False
+            yield line
             continue
 
-        if not in_section:
+        if not pending:
+            yield line
             continue
 
         # Handle indented keys under 'checks:'
         if line.strip() == "checks:":
             in_checks = True
+            yield line
             continue
 
         if in_checks:
-            indent_match = re.match(r"^(  )(\w[\w_]*): ?(.*)$", line)
-            if indent_match and indent_match.group(2) == key:
-                lines[i] = f"  {key}: {value}"
-                updated = True
-                break
+            indent_match = (
+                _INDENT_UPDATE_RE.match(line)
+                if line.startswith("  ") and ":" in line
+                else None
+            )
+            if indent_match and indent_match.group(2) in pending:
+                key = indent_match.group(2)
+                new_line = f"  {key}: {pending.pop(key)}"
+                if new_line != line:
+                    changed.add((section, key))
+                yield new_line
+                continue
             # End of checks block (non-indented line with content)
             if line.strip() and not line.startswith("  "):
                 in_checks = False
 
         # Top-level key match
-        kv_match = re.match(r"^(\w[\w_]*): ?(.*)$", line)
-        if kv_match and kv_match.group(1) == key:
-            # Check if next line is a multiline continuation
-            if kv_match.group(2).strip() == ">":
-                # Replace the '>' line and the continuation
-                lines[i] = f"{key}: {value}"
-                # Remove continuation lines
-                while i + 1 < len(lines) and lines[i + 1].startswith("  "):
-                    lines.pop(i + 1)
+        kv_match = _KV_RE.match(line) if ":" in line else None
+        if kv_match and kv_match.group(1) in pending:
+            key = kv_match.group(1)
+            new_line = f"{key}: {pending.pop(key)}"
+            if new_line != line:
+                changed.add((section, key))
+            yield new_line
+            # Replacing a '>' value also replaces its continuation lines
+            skip_continuation = kv_match.group(2).strip() == ">"
+            skip_key = (section, key)
+            continue
+
+        yield line
+
+
+def update_fields_in_file(
+    filepath: Path, updates: dict[str, dict[str, str]]
+) -> dict[str, dict[str, str]]:
+    """Update several key-value pairs in a task file, preserving structure.
+
+    updates maps section -> {key: value}. The file is streamed line by line
+    into a temp file that replaces it atomically, once however many keys
+    there are; each key is matched as update_field_in_file() matches it,
+    and keys that aren't found are reported on stderr. If every key already
+    has its value, the file is left untouched (same mtime, no rename).
+
+    Returns the updates that were applied, in the same shape.
+    """
+    remaining = {section: dict(kvs) for section, kvs in updates.items()}
+    changed: set[tuple[str, str]] = set()
+
+    tmp = filepath.with_name(f"{filepath.name}.{os.getpid()}.tmp")
+    try:
+        with filepath.open() as fin, tmp.open("w") as fout:
+            for line in _apply_updates(_iter_lines(fin), remaining, changed):
+                fout.write(line + "\n")
+        if changed:
+            shutil.copymode(filepath, tmp)
+            os.replace(tmp, filepath)
+        else:
+            tmp.unlink()
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+    applied: dict[str, dict[str, str]] = {}
+    for section, kvs in updates.items():
+        for key, value in kvs.items():
+            if key in remaining[section]:
+                print(
+                    f"Warning: key '{key}' not found in section '{section}' "
+                    f"of {filepath.name}",
+                    file=sys.stderr,
+                )
             else:
-                lines[i] = f"{key}: {value}"
-            updated = True
-            break
+                applied.setdefault(section, {})[key] = value
+    return applied
 
-    if updated:
-        filepath.write_text("\n".join(lines) + "\n")
-    else:
-        print(
-            f"Warning: key '{key}' not found in section '{section}' of {filepath.name}",
-            file=sys.stderr,
-        )
+
+def update_field_in_file(filepath: Path, section: str, key: str, value: str) -> None:
+    """Update a single key-value pair in a task file, preserving structure."""
+    update_fields_in_file(filepath, {section: {key: value}})
+
+
+def _read_index(tasks_dir: Path) -> dict:
+    """Load the list index: filename -> {mtime_ns, size, <_INDEX_KEYS>}.
+
+    A missing, unreadable or outdated index is treated as empty.
+    """
+    try:
+        with open(tasks_dir / INDEX_FILENAME) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}  # Missing, or corrupt; rebuild it
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+        return {}
+    return data.get("entries", {})
+
+
+def _write_index(tasks_dir: Path, entries: dict) -> None:
+    """Write the list index atomically (temp file + os.replace)."""
+    path = tasks_dir / INDEX_FILENAME
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "w") as f:
+            json.dump(
+                {"version": INDEX_VERSION, "entries": entries},
+                f,
+                separators=(",", ":"),
+            )
+        os.replace(tmp, path)
+    except OSError as e:
+        tmp.unlink(missing_ok=True)
+        print(f"Warning: could not write task index {path}: {e}", file=sys.stderr)
+
+
+def _index_entry(st: os.stat_result, config: dict[str, str]) -> dict:
+    """Build a list index entry from a file's stat and its Config values."""
+    entry = {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+    entry.update(zip(_INDEX_KEYS, map(config.get, _INDEX_KEYS, _INDEX_DEFAULTS)))
+    return entry
+
+
+def _index_matches(entry, st: os.stat_result) -> bool:
+    """Whether an index entry was recorded for the file as it is now."""
+    return (
+        isinstance(entry, dict)
+        and entry.get("mtime_ns") == st.st_mtime_ns
+        and entry.get("size") == st.st_size
+    )
+
+
+def _update_index(
+    filepath: Path, before: os.stat_result, config_updates: dict[str, str]
+) -> None:
+    """Carry a task file's index entry over a change made by this script.
+
+    before is the file's stat from before the change. If the entry was
+    current then, the Config values just written are applied to it and it
+    is re-stamped; otherwise it's left for `list` to re-parse.
+    """
+    tasks_dir = filepath.parent
+    index = _read_index(tasks_dir)
+    entry = index.get(filepath.name)
+    if not _index_matches(entry, before):
+        return
+    st = filepath.stat()
+    new_entry = dict(entry)
+    new_entry.update(
+        (key, value) for key, value in config_updates.items() if key in _INDEX_KEYS
+    )
+    new_entry["mtime_ns"] = st.st_mtime_ns
+    new_entry["size"] = st.st_size
+    if new_entry != entry:  # Unchanged when the update was a no-op
+        index[filepath.name] = new_entry
+        _write_index(tasks_dir, index)
 
 
 def resolve_file(args: argparse.Namespace) -> Path:
@@ -191,31 +447,40 @@ def cmd_list(args: argparse.Namespace) -> None:
         print(f"Error: Tasks directory not found: {tasks_dir}", file=sys.stderr)
         sys.exit(1)
 
-    files = sorted(tasks_dir.glob("field-*.md"))
+    files = list_task_files(tasks_dir)
     results = []
 
+    # Files changed since they were indexed (e.g. by hand, or by generate.py)
+    # are re-parsed; the index is rewritten if anything differed
+    index = _read_index(tasks_dir)
+    entries = {}
     for f in files:
-        sections = parse_task_file(f)
-        config = sections.get("Config", {})
-        status = config.get("status", "unknown")
-        iterations = config.get("iterations", "0")
-
-        if args.status and status != args.status:
+        st = f.stat()
+        entry = index.get(f.name)
+        if not _index_matches(entry, st):
+            # Only Config is listed; skip reading the rest of each file
+            entry = _index_entry(st, parse_task_config_only(f).get("Config", {}))
+        entries[f.name] = entry
+
+        if args.status and entry["status"] != args.status:
             continue
 
         results.append(
             {
                 "file": f.name,
-                "field_number": config.get("field_number", "?"),
-                "field_name": config.get("field_name", "?"),
-                "provider": config.get("provider", "?"),
-                "status": status,
-                "iterations": iterations,
+                "field_number": entry["field_number"],
+                "field_name": entry["field_name"],
+                "provider": entry["provider"],
+                "status": entry["status"],
+                "iterations": entry["iterations"],
             }
         )
 
+    if entries != index:
+        _write_index(tasks_dir, entries)
+
     if args.format == "json":
-        print(json.dumps(results, indent=2))
+        print(_dumps(results))
     else:
         for r in results:
             print(
@@ -235,7 +500,7 @@ def cmd_read(args: argparse.Namespace) -> None:
         sys.exit(1)
 
     sections = parse_task_file(filepath)
-    print(json.dumps(sections, indent=2))
+    print(_dumps(sections))
 
 
 def cmd_update(args: argparse.Namespace) -> None:
@@ -253,7 +518,9 @@ def cmd_update(args: argparse.Namespace) -> None:
         )
         sys.exit(1)
 
-    update_field_in_file(filepath, "Config", "status", args.status)
+    before = filepath.stat()
+    applied = update_fields_in_file(filepath, {"Config": {"status": args.status}})
+    _update_index(filepath, before, applied.get("Config", {}))
     print(f"Updated {filepath.name}: status → {args.status}")
 
 
@@ -278,11 +545,12 @@ def cmd_set_research(args: argparse.Namespace) -> None:
         "notes": args.notes or "",
     }
 
-    for key, value in field_map.items():
-        update_field_in_file(filepath, "Research", key, value)
-
     # Also update status to researched
-    update_field_in_file(filepath, "Config", "status", "researched")
+    before = filepath.stat()
+    applied = update_fields_in_file(
+        filepath, {"Research": field_map, "Config": {"status": "researched"}}
+    )
+    _update_index(filepath, before, applied.get("Config", {}))
     print(f"Updated {filepath.name}: research results set, status → researched")
 
 
@@ -293,43 +561,36 @@ def cmd_set_verification(args: argparse.Namespace) -> None:
         print(f"Error: File not found: {filepath}", file=sys.stderr)
         sys.exit(1)
 
-    update_field_in_file(filepath, "Verification", "verified", args.verified)
-    update_field_in_file(
-        filepath, "Verification", "endpoint_exists", args.endpoint_exists or ""
-    )
-    update_field_in_file(
-        filepath, "Verification", "field_in_response", args.field_in_response or ""
-    )
-    update_field_in_file(
-        filepath, "Verification", "derivation_correct", args.derivation_correct or ""
-    )
-    update_field_in_file(
-        filepath,
-        "Verification",
-        "historical_available",
-        args.historical_available or "",
-    )
-    update_field_in_file(
-        filepath, "Verification", "api_version_current", args.api_version_current or ""
-    )
-    update_field_in_file(
-        filepath, "Verification", "rejection_reason", args.rejection_reason or ""
+    verification_map = {
+        "verified": args.verified,
+        "endpoint_exists": args.endpoint_exists or "",
+        "field_in_response": args.field_in_response or "",
+        "derivation_correct": args.derivation_correct or "",
+        "historical_available": args.historical_available or "",
+        "api_version_current": args.api_version_current or "",
+        "rejection_reason": args.rejection_reason or "",
+    }
+    # Status from the verification outcome; a rejection retries unless the
+    # task has already been through an iteration
+    if args.verified == "true":
+        status = "verified"
+    else:
+        iterations = int(_read_config_value(filepath, "iterations", "0"))
+        status = "inconclusive" if iterations >= 1 else "pending"
+
+    # One rewrite for the verification results and the status together
+    before = filepath.stat()
+    applied = update_fields_in_file(
+        filepath, {"Verification": verification_map, "Config": {"status": status}}
     )
+    _update_index(filepath, before, applied.get("Config", {}))
 
-    # Update status based on verification outcome
-    if args.verified == "true":
-        update_field_in_file(filepath, "Config", "status", "verified")
+    if status == "verified":
         print(f"Updated {filepath.name}: verified, status → verified")
+    elif status == "inconclusive":
+        print(f"Updated {filepath.name}: rejected, iterations={iterations}, status → inconclusive")
     else:
-        # Check iterations to decide if inconclusive or retry
-        sections = parse_task_file(filepath)
-        iterations = int(sections.get("Config", {}).get("iterations", "0"))
-        if iterations >= 1:
-            update_field_in_file(filepath, "Config", "status", "inconclusive")
-            print(f"Updated {filepath.name}: rejected, iterations={iterations}, status → inconclusive")
-        else:
-            update_field_in_file(filepath, "Config", "status", "pending")
-            print(f"Updated {filepath.name}: rejected, status → pending (ready for retry)")
+        print(f"Updated {filepath.name}: rejected, status → pending (ready for retry)")
 
     print(f"Verification results written to {filepath.name}")
 
@@ -341,10 +602,13 @@ def cmd_increment_iterations(args: argparse.Namespace) -> None:
         print(f"Error: File not found: {filepath}", file=sys.stderr)
         sys.exit(1)
 
-    sections = parse_task_file(filepath)
-    current = int(sections.get("Config", {}).get("iterations", "0"))
+    current = int(_read_config_value(filepath, "iterations", "0"))
     new_val = current + 1
-    update_field_in_file(filepath, "Config", "iterations", str(new_val))
+    before = filepath.stat()
+    applied = update_fields_in_file(
+        filepath, {"Config": {"iterations": str(new_val)}}
+    )
+    _update_index(filepath, before, applied.get("Config", {}))
     print(f"Updated {filepath.name}: iterations {current} → {new_val}")
 
 
@@ -378,10 +642,16 @@ def cmd_clear_research(args: argparse.Namespace) -> None:
         "rejection_reason",
     ]
 
-    for key in research_fields:
-        update_field_in_file(filepath, "Research", key, "")
-    for key in verification_fields:
-        update_field_in_file(filepath, "Verification", key, "")
+    before = filepath.stat()
+    update_fields_in_file(
+        filepath,
+        {
+            "Research": dict.fromkeys(research_fields, ""),
+            "Verification": dict.fromkeys(verification_fields, ""),
+        },
+    )
+    # No Config values change, but the entry still needs re-stamping
+    _update_index(filepath, before, {})
 
     print(f"Cleared research and verification sections in {filepath.name}")
 
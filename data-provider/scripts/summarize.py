@@ -2,54 +2,164 @@
 """Summarize field-mapping task files into a coverage report.
 
 Reads all task files from <work-dir>/tasks/ and produces a markdown
-coverage report in <work-dir>/output/coverage-report.md.
+coverage report in <work-dir>/output/coverage-report.md. Parsed task files
+are cached in <work-dir>/output/.parse-cache.json, keyed by modification
+time and size, so unchanged files aren't re-parsed on the next run.
 
 Usage:
     python scripts/field_mapper/summarize.py
     python scripts/field_mapper/summarize.py --work-dir .mg/data-provider
+    python scripts/field_mapper/summarize.py --no-cache
 """
 
 import argparse
+import json
+import os
 import sys
-from collections import defaultdict
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
+from typing import Optional
 
 # Reuse the parser from status.py
 sys.path.insert(0, str(Path(__file__).parent))
-from status import parse_task_file
+from status import list_task_files, parse_task_file
 
 DEFAULT_WORK_DIR = ".mg/data-provider"
 
+# Threads reading task files; each is a small open + read, so overlapping
+# them hides file system latency
+PARSE_WORKERS = 8
+
+# Match types counted as coverage in the matrix totals row
+_COVERED_MATCHES = frozenset(("DIRECT", "DERIVABLE"))
+
+# Statuses whose results appear in the field detail tables
+_PROCESSED_STATUSES = frozenset(("verified", "inconclusive", "researched"))
+
+# Task file keys copied into each record, with their defaults ("" for
+# Research and Verification keys)
+_CONFIG_KEYS = ("field_number", "field_name", "provider", "status", "iterations")
+_CONFIG_DEFAULTS = ("0", "?", "?", "unknown", "0")
+_RESEARCH_KEYS = (
+    "match_type",
+    "endpoint",
+    "endpoint_version",
+    "json_path",
+    "evidence_url",
+    "derivation_formula",
+    "historical_depth",
+    "notes",
+)
+_VERIFICATION_KEYS = ("verified", "rejection_reason")
+
+# Bump when parse_task_file's output shape changes
+PARSE_CACHE_VERSION = 2
+
+
+def _load_cache(path: Path) -> dict:
+    """Load the parse cache: filename -> {mtime_ns, size, sections}.
+
+    A missing, unreadable or outdated cache is treated as empty.
+    """
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}  # Missing, or corrupt; rebuild it
+    if not isinstance(data, dict) or data.get("version") != PARSE_CACHE_VERSION:
+        return {}
+    return data.get("entries", {})
+
+
+def _save_cache(path: Path, entries: dict) -> None:
+    """Write the parse cache atomically (temp file + os.replace)."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "w") as f:
+            json.dump(
+                {"version": PARSE_CACHE_VERSION, "entries": entries},
+                f,
+                separators=(",", ":"),
+            )
+        os.replace(tmp, path)
+    except OSError as e:
+        tmp.unlink(missing_ok=True)
+        print(f"Warning: could not write parse cache {path}: {e}", file=sys.stderr)
+
+
+def _cache_matches(entry, st: os.stat_result) -> bool:
+    """Whether a cache entry was recorded for the file as it is now."""
+    return (
+        isinstance(entry, dict)
+        and entry.get("mtime_ns") == st.st_mtime_ns
+        and entry.get("size") == st.st_size
+    )
+
+
+def collect_tasks(
+    tasks_dir: Path, cache_file: Optional[Path] = None
+) -> list[dict[str, str]]:
+    """Collect and parse all task files into a flat list of records.
+
+    With cache_file, files whose mtime and size match the cache reuse the
+    cached parse, and the cache is rewritten with this run's results.
+    """
+    files = list_task_files(tasks_dir)
+    cache = _load_cache(cache_file) if cache_file else {}
+
+    entries = {}  # filename -> {mtime_ns, size, sections}, for this run
+    stale = []
+    for filepath in files:
+        st = filepath.stat()
+        hit = cache.get(filepath.name)
+        if _cache_matches(hit, st):
+            entries[filepath.name] = hit
+        else:
+            stale.append((filepath, st))
+
+    if stale:
+        with ThreadPoolExecutor(max_workers=PARSE_WORKERS) as executor:
+            parsed = executor.map(parse_task_file, [fp for fp, _ in stale])
+            for (filepath, st), sections in zip(stale, parsed):
+                entries[filepath.name] = {
+                    "mtime_ns": st.st_mtime_ns,
+                    "size": st.st_size,
+                    "sections": sections,
+                }
+
+    if cache_file and (stale or len(entries) != len(cache)):
+        _save_cache(cache_file, entries)
 
-def collect_tasks(tasks_dir: Path) -> list[dict[str, str]]:
-    """Collect and parse all task files into a flat list of records."""
     records = []
-    for filepath in sorted(tasks_dir.glob("field-*.md")):
-        sections = parse_task_file(filepath)
-        config = sections.get("Config", {})
-        research = sections.get("Research", {})
-        verification = sections.get("Verification", {})
-
-        records.append(
-            {
-                "file": filepath.name,
-                "field_number": config.get("field_number", "0"),
-                "field_name": config.get("field_name", "?"),
-                "provider": config.get("provider", "?"),
-                "status": config.get("status", "unknown"),
-                "iterations": config.get("iterations", "0"),
-                "match_type": research.get("match_type", ""),
-                "endpoint": research.get("endpoint", ""),
-                "endpoint_version": research.get("endpoint_version", ""),
-                "json_path": research.get("json_path", ""),
-                "evidence_url": research.get("evidence_url", ""),
-                "derivation_formula": research.get("derivation_formula", ""),
-                "historical_depth": research.get("historical_depth", ""),
-                "notes": research.get("notes", ""),
-                "verified": verification.get("verified", ""),
-                "rejection_reason": verification.get("rejection_reason", ""),
-            }
+    for filepath in files:
+        sections = entries[filepath.name]["sections"]
+        # zip/map look every key up in C, with no per-key .get() call here
+        record = {"file": filepath.name}
+        record.update(
+            zip(
+                _CONFIG_KEYS,
+                map(sections.get("Config", {}).get, _CONFIG_KEYS, _CONFIG_DEFAULTS),
+            )
         )
+        record.update(
+            zip(
+                _RESEARCH_KEYS,
+                map(sections.get("Research", {}).get, _RESEARCH_KEYS, repeat("")),
+            )
+        )
+        record.update(
+            zip(
+                _VERIFICATION_KEYS,
+                map(
+                    sections.get("Verification", {}).get,
+                    _VERIFICATION_KEYS,
+                    repeat(""),
+                ),
+            )
+        )
+        records.append(record)
 
     return records
 
@@ -58,8 +168,8 @@ def build_coverage_matrix(
     records: list[dict[str, str]],
     fields: list[tuple[str, str]],
     providers: list[str],
-) -> str:
-    """Build the coverage matrix table."""
+) -> list[str]:
+    """Build the coverage matrix table, as a list of lines."""
     # Index: (field_number, provider) → match_type
     lookup: dict[tuple[str, str], str] = {}
     for r in records:
@@ -73,64 +183,50 @@ def build_coverage_matrix(
         else:
             lookup[key] = r.get("match_type", "?")
 
-    # Header
-    header = "| # | Field |"
-    sep = "|---|-------|"
-    for p in providers:
-        header += f" {p} |"
-        sep += "------|"
-
-    lines = [header, sep]
+    # Each line is its fixed leading cells plus one " cell |" per provider,
+    # joined once rather than grown with += per provider
+    lines = [
+        "| # | Field |" + "".join([f" {p} |" for p in providers]),
+        "|---|-------|" + "------|" * len(providers),
+    ]
 
     for field_num, field_name in fields:
-        row = f"| {field_num} | {field_name} |"
-        for p in providers:
-            val = lookup.get((field_num, p), "-")
-            row += f" {val} |"
-        lines.append(row)
-
-    # Totals row
-    totals_row = "| | **Coverage** |"
-    for p in providers:
-        direct = sum(
-            1
-            for fn, _ in fields
-            if lookup.get((fn, p), "") in ("DIRECT", "DERIVABLE")
-        )
-        total = len(fields)
-        totals_row += f" **{direct}/{total}** |"
-    lines.append(totals_row)
+        cells = [f" {lookup.get((field_num, p), '-')} |" for p in providers]
+        lines.append(f"| {field_num} | {field_name} |" + "".join(cells))
+
+    # Totals row: covered cells per provider, in one pass over the filled cells
+    covered = Counter(p for (_, p), val in lookup.items() if val in _COVERED_MATCHES)
+    total = len(fields)
+    lines.append(
+        "| | **Coverage** |"
+        + "".join([f" **{covered[p]}/{total}** |" for p in providers])
+    )
 
-    return "\n".join(lines)
+    return lines
 
 
 def build_field_details(
     records: list[dict[str, str]],
     fields: list[tuple[str, str]],
-) -> str:
-    """Build per-field detail tables."""
-    # Group records by field number
-    by_field: dict[str, list[dict[str, str]]] = defaultdict(list)
+) -> list[str]:
+    """Build per-field detail tables, as a list of lines."""
+    # Group processed records by field number, in one pass
+    processed_by_field: dict[str, list[dict[str, str]]] = {}
     for r in records:
-        by_field[r["field_number"]].append(r)
+        if r["status"] in _PROCESSED_STATUSES:
+            processed_by_field.setdefault(r["field_number"], []).append(r)
 
-    sections = []
+    lines: list[str] = []
 
     for field_num, field_name in fields:
-        field_records = by_field.get(field_num, [])
-        if not field_records:
-            continue
-
         # Only include fields that have at least one processed result
-        processed = [
-            r
-            for r in field_records
-            if r["status"] in ("verified", "inconclusive", "researched")
-        ]
+        processed = processed_by_field.get(field_num)
         if not processed:
             continue
 
-        lines = [
+        if lines:
+            lines.append("")  # Blank line between tables
+        lines += [
             f"### {field_num}. {field_name}",
             "",
             "| Provider | Match | Endpoint | Field/Path | Derivation | Docs |",
@@ -149,16 +245,13 @@ def build_field_details(
                 f"| {r['provider']} | {match} | {endpoint} | {json_path} | {derivation} | {evidence} |"
             )
 
-        sections.append("\n".join(lines))
-
-    return "\n\n".join(sections)
+    return lines
 
 
-def build_inconclusive_section(records: list[dict[str, str]]) -> str:
-    """Build the inconclusive items section."""
-    inconclusive = [r for r in records if r["status"] == "inconclusive"]
+def build_inconclusive_section(inconclusive: list[dict[str, str]]) -> list[str]:
+    """Build the inconclusive items section from the inconclusive records."""
     if not inconclusive:
-        return "No inconclusive items."
+        return ["No inconclusive items."]
 
     lines = [
         "| # | Field | Provider | Last Rejection Reason |",
@@ -171,73 +264,70 @@ def build_inconclusive_section(records: list[dict[str, str]]) -> str:
             f"| {r['field_number']} | {r['field_name']} | {r['provider']} | {reason} |"
         )
 
-    return "\n".join(lines)
+    return lines
 
 
-def build_pending_section(records: list[dict[str, str]]) -> str:
-    """Build the pending items section."""
-    pending = [r for r in records if r["status"] == "pending"]
+def build_pending_section(pending: list[dict[str, str]]) -> list[str]:
+    """Build the pending items section from the pending records."""
     if not pending:
-        return "All tasks processed."
+        return ["All tasks processed."]
 
-    return f"{len(pending)} task(s) still pending. Run `/mg:map-fields-research` to process them."
+    return [
+        f"{len(pending)} task(s) still pending. Run `/mg:map-fields-research` to process them."
+    ]
 
 
-def generate_report(tasks_dir: Path) -> str:
+def generate_report(tasks_dir: Path, cache_file: Optional[Path] = None) -> str:
     """Generate the full coverage report."""
-    records = collect_tasks(tasks_dir)
+    records = collect_tasks(tasks_dir, cache_file)
 
     if not records:
         return "# Provider Coverage Report\n\nNo task files found."
 
-    # Extract unique fields and providers (ordered)
+    # Extract unique fields and providers (ordered), and group by status
     fields_seen: dict[str, str] = {}
     providers_seen: dict[str, bool] = {}
+    by_status: dict[str, list[dict[str, str]]] = {}
     for r in records:
         fields_seen[r["field_number"]] = r["field_name"]
         providers_seen[r["provider"]] = True
+        by_status.setdefault(r["status"], []).append(r)
 
     fields = sorted(fields_seen.items(), key=lambda x: int(x[0]))
     providers = list(providers_seen.keys())
+    inconclusive_records = by_status.get("inconclusive", [])
+    pending_records = by_status.get("pending", [])
 
     # Count stats
     total = len(records)
-    verified = sum(1 for r in records if r["status"] == "verified")
-    inconclusive = sum(1 for r in records if r["status"] == "inconclusive")
-    pending = sum(1 for r in records if r["status"] == "pending")
-
-    report = f"""# Provider Coverage Report
-
-Generated from: `{tasks_dir}`
-
-**Status:** {verified} verified | {inconclusive} inconclusive | {pending} pending | {total} total
-
----
-
-## Coverage Matrix
-
-{build_coverage_matrix(records, fields, providers)}
-
----
-
-## Field Details
-
-{build_field_details(records, fields)}
-
----
-
-## Inconclusive (manual review needed)
-
-{build_inconclusive_section(records)}
-
----
-
-## Pending
-
-{build_pending_section(records)}
-"""
+    verified = len(by_status.get("verified", []))
+    inconclusive = len(inconclusive_records)
+    pending = len(pending_records)
+
+    # Collect every line, then join once at the end
+    parts = [
+        "# Provider Coverage Report",
+        "",
+        f"Generated from: `{tasks_dir}`",
+        "",
+        f"**Status:** {verified} verified | {inconclusive} inconclusive | {pending} pending | {total} total",
+        "",
+        "---",
+        "",
+        "## Coverage Matrix",
+        "",
+    ]
+    parts += build_coverage_matrix(records, fields, providers)
+    parts += ["", "---", "", "## Field Details", ""]
+    # No detail tables still leaves an empty line in their place
+    parts += build_field_details(records, fields) or [""]
+    parts += ["", "---", "", "## Inconclusive (manual review needed)", ""]
+    parts += build_inconclusive_section(inconclusive_records)
+    parts += ["", "---", "", "## Pending", ""]
+    parts += build_pending_section(pending_records)
+    parts.append("")  # Trailing newline
 
-    return report
+    return "\n".join(parts)
 
 
 def main() -> None:
@@ -250,6 +340,11 @@ def main() -> None:
         default=DEFAULT_WORK_DIR,
         help=f"Work directory (default: {DEFAULT_WORK_DIR})",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-parse every task file and don't read or write the parse cache",
+    )
 
     args = parser.parse_args()
 
@@ -263,7 +358,8 @@ def main() -> None:
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    report = generate_report(tasks_dir)
+    cache_file = None if args.no_cache else output_dir / ".parse-cache.json"
+    report = generate_report(tasks_dir, cache_file)
     output_file.write_text(report)
     print(f"Report written to: {output_file}")
 